@@ -0,0 +1,151 @@
+"""
+Per-render cost of building a game board's buttons, before and after caching.
+
+Renders a board of N buttons (one pending input request covering all of them)
+the way ``GameManager._build_interactive_view`` does, comparing:
+
+* ``legacy``: the original code path, which rebuilt the request's
+  ``input_by_id`` dict for every button and URL-encoded every custom id;
+* ``cold``: the current path on an empty component cache (first render of a
+  request);
+* ``warm``: the current path re-rendering the same board within the request.
+
+Usage::
+
+    python -m benchmarks.component_render --sizes 25 100 --iterations 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+import discord
+
+from playcord.api import ButtonInput, InputMode
+from playcord.application.services.component_codec import ComponentArgumentTable
+from playcord.application.services.game_manager import (
+    GameManager,
+    PendingInputRequest,
+)
+from playcord.infrastructure.constants import BUTTON_PREFIX_GAME_MOVE
+from playcord.ui.render import make_discord_button
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class _Player:
+    def __init__(self, player_id: int) -> None:
+        self.id = player_id
+
+
+def _board(size: int) -> tuple[ButtonInput, ...]:
+    return tuple(
+        ButtonInput(
+            id=f"cell_{index}",
+            label=str(index),
+            arguments={"move": str(index)},
+            style="secondary",
+        )
+        for index in range(size)
+    )
+
+
+def _runtime(buttons: tuple[ButtonInput, ...]) -> GameManager:
+    # Only the attributes component rendering reads; no plugin, thread or bot.
+    runtime = GameManager.__new__(GameManager)
+    runtime.thread = None
+    runtime.game_id = 1
+    runtime._component_cache = {}
+    runtime._component_args = ComponentArgumentTable("a1b2c3d4e5f6")
+    runtime._pending = PendingInputRequest(
+        request_id="a1b2c3d4e5f6",
+        players=(_Player(1), _Player(2)),
+        inputs=buttons,
+        mode=InputMode.first,
+        min_responses=1,
+        future=asyncio.new_event_loop().create_future(),
+    )
+    return runtime
+
+
+def _legacy_make_button(runtime: GameManager, spec: ButtonInput) -> Any:
+    pending = runtime._pending
+    input_by_id = {item.id: item for item in pending.inputs}
+    request_id = pending.request_id if spec.id in input_by_id else ""
+    payload = urlencode(
+        {
+            "request_id": request_id,
+            "input_id": spec.id,
+            **{f"arg_{key}": str(value) for key, value in spec.arguments.items()},
+        },
+    )
+    return make_discord_button(
+        label=spec.label,
+        style=discord.ButtonStyle.secondary,
+        custom_id=f"{BUTTON_PREFIX_GAME_MOVE}{runtime.game_id}/{payload}",
+        disabled=spec.disabled or not request_id,
+        emoji=None,
+    )
+
+
+def _time_renders(
+    render: Callable[[], object],
+    *,
+    iterations: int,
+    before: Callable[[], object] | None = None,
+) -> list[float]:
+    samples: list[float] = []
+    for _ in range(iterations):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        render()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+def _bench_size(size: int, iterations: int) -> tuple[float, float, float]:
+    buttons = _board(size)
+    runtime = _runtime(buttons)
+    legacy = _time_renders(
+        lambda: [_legacy_make_button(runtime, spec) for spec in buttons],
+        iterations=iterations,
+    )
+    cold = _time_renders(
+        lambda: [runtime._make_button(spec) for spec in buttons],
+        iterations=iterations,
+        before=runtime._component_cache.clear,
+    )
+    warm = _time_renders(
+        lambda: [runtime._make_button(spec) for spec in buttons],
+        iterations=iterations,
+    )
+    return (
+        statistics.median(legacy),
+        statistics.median(cold),
+        statistics.median(warm),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 100])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    print(
+        f"{'buttons':>7} {'legacy p50 us':>14} {'cold p50 us':>12} {'warm p50 us':>12}"
+    )
+    for size in args.sizes:
+        legacy, cold, warm = _bench_size(size, args.iterations)
+        print(f"{size:>7} {legacy:>14.1f} {cold:>12.1f} {warm:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Cost and length of game component custom ids: query strings vs. table tokens.
+
+For a few representative button argument sets, compares the previous custom
+id payload (``urlencode`` of request id, input id and ``arg_*`` fields, parsed
+back with ``parse_qs`` on click) with the compact token codec plus
+server-side :class:`ComponentArgumentTable`. Reports encode and decode time
+per component and the length of the resulting custom id (Discord allows 100).
+
+Usage::
+
+    python -m benchmarks.custom_id_codec --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlencode
+
+from playcord.application.services.component_codec import (
+    ComponentArgumentTable,
+    decode_component_token,
+    encode_component_token,
+)
+from playcord.infrastructure.constants import BUTTON_PREFIX_GAME_MOVE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_REQUEST_ID = "9f86d081884c"
+# A Discord snowflake-sized thread id.
+_RESOURCE_ID = 1234567890123456789
+
+_CASES: dict[str, tuple[str, dict[str, str]]] = {
+    "tictactoe cell": ("move_12", {"move": "12"}),
+    "vote": ("vote_ja", {"vote": "ja", "round": "4"}),
+    "night action": (
+        "night_action_investigate",
+        {
+            "target": "123456789012345678",
+            "action": "investigate",
+            "night": "3",
+            "role": "detective",
+        },
+    ),
+}
+
+
+def _legacy_encode(input_id: str, arguments: dict[str, str]) -> str:
+    return urlencode(
+        {
+            "request_id": _REQUEST_ID,
+            "input_id": input_id,
+            **{f"arg_{key}": value for key, value in arguments.items()},
+        },
+    )
+
+
+def _legacy_decode(payload: str) -> tuple[str, str, dict[str, Any]]:
+    parsed = parse_qs(payload)
+    arguments = {
+        key.removeprefix("arg_"): values[0]
+        for key, values in parsed.items()
+        if key.startswith("arg_")
+    }
+    return parsed["request_id"][0], parsed["input_id"][0], arguments
+
+
+def _token_encode(
+    table: ComponentArgumentTable,
+    input_id: str,
+    arguments: dict[str, str],
+) -> str:
+    slot = table.register(input_id, tuple(arguments.items()))
+    return encode_component_token(_REQUEST_ID, slot)
+
+
+def _token_decode(
+    table: ComponentArgumentTable,
+    payload: str,
+) -> tuple[str, str, dict[str, Any]]:
+    request_id, slot = decode_component_token(payload)
+    input_id, arguments = table.lookup(slot) or ("", {})
+    return request_id, input_id, arguments
+
+
+def _time_calls(call: Callable[[], object], iterations: int) -> float:
+    samples: list[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1_000_000_000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    prefix = f"{BUTTON_PREFIX_GAME_MOVE}{_RESOURCE_ID}/"
+    print(
+        f"{'case':<16} {'codec':<7} {'encode ns':>10} {'decode ns':>10} {'id len':>7}",
+    )
+    for name, (input_id, arguments) in _CASES.items():
+        table = ComponentArgumentTable(_REQUEST_ID)
+        legacy = _legacy_encode(input_id, arguments)
+        token = _token_encode(table, input_id, arguments)
+        if _legacy_decode(legacy) != _token_decode(table, token):
+            msg = f"Codecs disagree for {name!r}"
+            raise AssertionError(msg)
+        rows = (
+            (
+                "query",
+                _time_calls(
+                    lambda i=input_id, a=arguments: _legacy_encode(i, a),
+                    args.iterations,
+                ),
+                _time_calls(lambda p=legacy: _legacy_decode(p), args.iterations),
+                len(prefix + legacy),
+            ),
+            (
+                "token",
+                _time_calls(
+                    lambda t=table, i=input_id, a=arguments: _token_encode(t, i, a),
+                    args.iterations,
+                ),
+                _time_calls(
+                    lambda t=table, p=token: _token_decode(t, p),
+                    args.iterations,
+                ),
+                len(prefix + token),
+            ),
+        )
+        for codec, encode_ns, decode_ns, length in rows:
+            print(
+                f"{name:<16} {codec:<7} {encode_ns:>10.0f} {decode_ns:>10.0f} "
+                f"{length:>7}",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Per-call latency of hot statements with and without server-side preparation.
+
+Runs every statement from the hot-statement registry that is a plain lookup
+(``SELECT`` with a single id parameter) against a migrated PlayCord database,
+first as unprepared text (``prepare=False``), then prepared (``prepare=True``),
+on one connection. Ids that match no rows are used on purpose: the result sets
+stay empty, so the difference is parse/plan overhead rather than row transfer.
+
+Usage::
+
+    PLAYCORD_BENCH_DSN="host=localhost dbname=playcord user=playcord" \\
+        python -m benchmarks.prepared_statements --iterations 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+
+import psycopg
+
+# Importing the repositories populates the registry.
+import playcord.infrastructure.database.implementation.repositories  # noqa: F401
+from playcord.infrastructure.database.implementation.core.statements import (
+    registered_statements,
+)
+
+# Sent as an untyped literal so it binds to both bigint ids and text codes.
+_MISSING_ID = "-1"
+
+
+def _lookup_statements() -> dict[str, str]:
+    return {
+        name: sql
+        for name, sql in registered_statements().items()
+        if sql.lstrip().upper().startswith("SELECT")
+        and sql.count("%s") == 1
+        and "ANY(" not in sql
+    }
+
+
+def _time_calls(
+    conn: psycopg.Connection,
+    sql: str,
+    *,
+    prepare: bool,
+    iterations: int,
+) -> list[float]:
+    samples: list[float] = []
+    with conn.cursor() as cur:
+        for _ in range(iterations):
+            started = time.perf_counter()
+            cur.execute(sql, (_MISSING_ID,), prepare=prepare)
+            cur.fetchall()
+            samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dsn", default=os.getenv("PLAYCORD_BENCH_DSN", ""))
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=50)
+    args = parser.parse_args()
+
+    statements = _lookup_statements()
+    print(f"{'statement':<28} {'text p50 us':>12} {'prep p50 us':>12} {'gain':>7}")
+    with psycopg.connect(args.dsn, autocommit=True) as conn:
+        conn.prepare_threshold = None  # only prepare when asked to
+        for name, sql in sorted(statements.items()):
+            _time_calls(conn, sql, prepare=False, iterations=args.warmup)
+            text = _time_calls(conn, sql, prepare=False, iterations=args.iterations)
+            _time_calls(conn, sql, prepare=True, iterations=args.warmup)
+            prepared = _time_calls(
+                conn,
+                sql,
+                prepare=True,
+                iterations=args.iterations,
+            )
+            text_p50 = statistics.median(text)
+            prepared_p50 = statistics.median(prepared)
+            gain = (1 - prepared_p50 / text_p50) * 100 if text_p50 else 0.0
+            print(f"{name:<28} {text_p50:>12.1f} {prepared_p50:>12.1f} {gain:>6.1f}%")
+
+
+if __name__ == "__main__":
+    main()
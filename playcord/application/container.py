@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from playcord.application.services import replay_viewer
+from playcord.infrastructure.analytics_client import Timer
+from playcord.infrastructure.constants import DATABASE_TYPE_MEMORY
 from playcord.infrastructure.database import (
     AnalyticsRepository,
+    AsyncAnalyticsRepository,
+    AsyncGuildRepository,
+    AsyncMatchRepository,
+    AsyncPlayerRepository,
+    AsyncReplayRepository,
     GameRepository,
     GuildRepository,
     MaintenanceRepository,
@@ -17,9 +25,36 @@ from playcord.infrastructure.database import (
     ReplayRepository,
     RoleRepository,
 )
+from playcord.infrastructure.database.implementation.core.invalidation import (
+    InvalidationTopic,
+    invalidation_bus,
+)
 from playcord.infrastructure.database.implementation.core.migrations import (
     apply_migrations,
 )
+from playcord.infrastructure.database.implementation.memory import InMemoryStore
+from playcord.infrastructure.database.implementation.repositories.guild import (
+    forget_guild_settings,
+    new_guild_settings_cache,
+)
+from playcord.infrastructure.database.implementation.repositories.memory import (
+    AsyncInMemoryAnalyticsRepository,
+    AsyncInMemoryGuildRepository,
+    AsyncInMemoryMatchRepository,
+    AsyncInMemoryPlayerRepository,
+    AsyncInMemoryReplayRepository,
+    InMemoryAnalyticsRepository,
+    InMemoryGameRepository,
+    InMemoryGuildRepository,
+    InMemoryMaintenanceRepository,
+    InMemoryMatchRepository,
+    InMemoryPlayerRepository,
+    InMemoryReplayRepository,
+    InMemoryRoleRepository,
+)
+from playcord.infrastructure.database.implementation.repositories.user import (
+    new_player_cache,
+)
 from playcord.infrastructure.state.user_games import SessionRegistry
 
 if TYPE_CHECKING:
@@ -50,27 +85,78 @@ class ApplicationContainer:
         repr=False,
         compare=False,
     )
+    async_players_repository: AsyncPlayerRepository = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    async_matches_repository: AsyncMatchRepository = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    async_replays_repository: AsyncReplayRepository = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    async_guilds_repository: AsyncGuildRepository = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    async_analytics_repository: AsyncAnalyticsRepository = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    # Milliseconds per startup step, filled while the repositories are built.
+    startup_timings: dict[str, float] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self) -> None:
+        if self.in_memory:
+            self._build_in_memory_repositories()
+        else:
+            self._build_postgres_repositories()
+
+    @property
+    def in_memory(self) -> bool:
+        """True when ``db.type`` selects the in-process store instead of PostgreSQL."""
+        return self.settings.db.type == DATABASE_TYPE_MEMORY
+
+    def _build_postgres_repositories(self) -> None:
+        timer = Timer().start()
         database = self.pool_manager.connect()
+        self.startup_timings["pool"] = timer.stop()
+        timer.start()
         apply_migrations(database)
+        self.startup_timings["migrations"] = timer.stop()
 
         self.games_repository = GameRepository(database)
+        player_cache = new_player_cache()
         self.players_repository = PlayerRepository(
             database,
             self.games_repository,
+            cache=player_cache,
         )
         self.analytics_repository = AnalyticsRepository(database, self.games_repository)
         self.maintenance_repository = MaintenanceRepository(
             database,
             self.games_repository,
         )
+        guild_settings_cache = new_guild_settings_cache()
         self.guilds_repository = GuildRepository(
             database,
             self.analytics_repository,
             self.players_repository,
             self.games_repository,
             self.maintenance_repository,
+            settings_cache=guild_settings_cache,
         )
         self.matches_repository = MatchRepository(
             database,
@@ -81,12 +167,127 @@ class ApplicationContainer:
         self.replays_repository = ReplayRepository(database)
         self.roles_repository = RoleRepository(database)
 
+        async_database = self.pool_manager.connect_async()
+        self.async_players_repository = AsyncPlayerRepository(
+            async_database,
+            self.games_repository,
+            cache=player_cache,
+        )
+        self.async_guilds_repository = AsyncGuildRepository(
+            async_database,
+            settings_cache=guild_settings_cache,
+        )
+        self.async_matches_repository = AsyncMatchRepository(
+            async_database,
+            self.async_players_repository,
+            self.async_guilds_repository,
+            self.games_repository,
+        )
+        self.async_replays_repository = AsyncReplayRepository(async_database)
+        self.async_analytics_repository = AsyncAnalyticsRepository(
+            async_database,
+            self.games_repository,
+        )
+
         self.migration_runner.run_startup(
             database,
             self.games_repository,
             self.analytics_repository,
             self.matches_repository,
+            timings=self.startup_timings,
+        )
+        self._subscribe_invalidations()
+
+    def _subscribe_invalidations(self) -> None:
+        """Apply other processes' cache invalidations to this process's caches."""
+        settings_cache = self.guilds_repository.settings_cache
+        invalidation_bus.subscribe(
+            InvalidationTopic.MATCH,
+            replay_viewer.forget_match_frames,
+        )
+        invalidation_bus.subscribe(
+            InvalidationTopic.GAME,
+            self.games_repository.forget_game,
+        )
+        invalidation_bus.subscribe(
+            InvalidationTopic.GUILD_SETTINGS,
+            lambda guild_id: forget_guild_settings(settings_cache, guild_id),
+        )
+
+    def _build_in_memory_repositories(self) -> None:
+        """Same wiring over one :class:`InMemoryStore`; no pools, no migrations."""
+        store = InMemoryStore()
+
+        self.games_repository = InMemoryGameRepository(store)
+        player_cache = new_player_cache()
+        self.players_repository = InMemoryPlayerRepository(
+            store,
+            self.games_repository,
+            cache=player_cache,
+        )
+        self.analytics_repository = InMemoryAnalyticsRepository(
+            store,
+            self.games_repository,
+        )
+        self.maintenance_repository = InMemoryMaintenanceRepository(
+            store,
+            self.games_repository,
         )
+        guild_settings_cache = new_guild_settings_cache()
+        self.guilds_repository = InMemoryGuildRepository(
+            store,
+            self.analytics_repository,
+            self.players_repository,
+            self.games_repository,
+            self.maintenance_repository,
+            settings_cache=guild_settings_cache,
+        )
+        self.matches_repository = InMemoryMatchRepository(
+            store,
+            self.players_repository,
+            self.guilds_repository,
+            self.games_repository,
+        )
+        self.replays_repository = InMemoryReplayRepository(store)
+        self.roles_repository = InMemoryRoleRepository(store)
+
+        self.async_players_repository = AsyncInMemoryPlayerRepository(
+            store,
+            self.games_repository,
+            cache=player_cache,
+        )
+        self.async_guilds_repository = AsyncInMemoryGuildRepository(
+            store,
+            settings_cache=guild_settings_cache,
+        )
+        self.async_matches_repository = AsyncInMemoryMatchRepository(
+            store,
+            self.async_players_repository,
+            self.async_guilds_repository,
+            self.games_repository,
+        )
+        self.async_replays_repository = AsyncInMemoryReplayRepository(store)
+        self.async_analytics_repository = AsyncInMemoryAnalyticsRepository(
+            store,
+            self.games_repository,
+        )
+
+        self.games_repository.sync_games_from_code()
+
+    def cache_stats(self) -> dict[str, dict[str, Any]]:
+        """Hit/miss counters of the repository caches, keyed by cache name."""
+        return {
+            "guild settings": self.guilds_repository.settings_cache.stats(),
+            "players": self.players_repository.cache.stats(),
+        }
+
+    async def open_async(self) -> None:
+        """Open the asyncio pool; must run on the bot's event loop."""
+        if not self.in_memory:
+            await self.pool_manager.open_async()
+
+    async def close_async(self) -> None:
+        await self.pool_manager.close_async()
 
     def close(self) -> None:
         self.pool_manager.close()
@@ -0,0 +1,110 @@
+"""
+Compact custom ids for game move buttons and selects.
+
+A game component's custom id is ``<prefix><resource id>/<token>``. The token
+packs the input request id and a slot number in base 62; the slot indexes a
+:class:`ComponentArgumentTable` the runtime keeps for the current request, which
+holds the input id and arguments server-side. Tokens stay about a dozen
+characters however long the input ids and arguments are, and decoding a click
+is a table lookup instead of a query-string parse.
+"""
+
+from __future__ import annotations
+
+import string
+
+_ALPHABET = string.digits + string.ascii_letters
+_BASE = len(_ALPHABET)
+_DIGITS = {char: value for value, char in enumerate(_ALPHABET)}
+
+# Request ids are 12 hex digits (48 bits); 62**9 > 2**48, so 9 digits fit any.
+_REQUEST_DIGITS = 9
+_REQUEST_HEX_DIGITS = 12
+# Leads the token of a component rendered while no request is pending.
+_NO_REQUEST = "-"
+
+type ComponentArguments = tuple[tuple[str, str], ...]
+
+
+def _encode_int(value: int) -> str:
+    if value < 0:
+        msg = f"Cannot encode negative value {value}"
+        raise ValueError(msg)
+    digits: list[str] = []
+    while True:
+        value, remainder = divmod(value, _BASE)
+        digits.append(_ALPHABET[remainder])
+        if not value:
+            return "".join(reversed(digits))
+
+
+def _decode_int(text: str) -> int:
+    if not text:
+        msg = "Empty base-62 value"
+        raise ValueError(msg)
+    value = 0
+    for char in text:
+        try:
+            value = value * _BASE + _DIGITS[char]
+        except KeyError:
+            msg = f"Invalid base-62 digit {char!r}"
+            raise ValueError(msg) from None
+    return value
+
+
+def encode_component_token(request_id: str, slot: int) -> str:
+    """Token for ``slot`` of the table belonging to ``request_id``."""
+    if not request_id:
+        return _NO_REQUEST + _encode_int(slot)
+    if len(request_id) > _REQUEST_HEX_DIGITS:
+        msg = f"Request id {request_id!r} is longer than {_REQUEST_HEX_DIGITS} digits"
+        raise ValueError(msg)
+    request = _encode_int(int(request_id, 16)).rjust(_REQUEST_DIGITS, _ALPHABET[0])
+    return request + _encode_int(slot)
+
+
+def decode_component_token(token: str) -> tuple[str, int]:
+    """Inverse of :func:`encode_component_token`; raises ``ValueError`` if malformed."""
+    if token.startswith(_NO_REQUEST):
+        return "", _decode_int(token[len(_NO_REQUEST) :])
+    if len(token) <= _REQUEST_DIGITS:
+        msg = f"Component token {token!r} is too short"
+        raise ValueError(msg)
+    request = _decode_int(token[:_REQUEST_DIGITS])
+    if request >= 16**_REQUEST_HEX_DIGITS:
+        msg = f"Component token {token!r} has an out-of-range request id"
+        raise ValueError(msg)
+    request_id = format(request, f"0{_REQUEST_HEX_DIGITS}x")
+    return request_id, _decode_int(token[_REQUEST_DIGITS:])
+
+
+class ComponentArgumentTable:
+    """
+    Input id and arguments of every component rendered for one input request.
+
+    Registering the same input id and arguments again returns the existing
+    slot, so re-rendering a board reuses its custom ids. ``request_id`` is
+    empty for components rendered while no request is pending.
+    """
+
+    def __init__(self, request_id: str = "") -> None:
+        self.request_id = request_id
+        self._entries: list[tuple[str, ComponentArguments]] = []
+        self._slots: dict[tuple[str, ComponentArguments], int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def register(self, input_id: str, arguments: ComponentArguments = ()) -> int:
+        key = (input_id, arguments)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = len(self._entries)
+            self._entries.append(key)
+        return slot
+
+    def lookup(self, slot: int) -> tuple[str, dict[str, str]] | None:
+        if not 0 <= slot < len(self._entries):
+            return None
+        input_id, arguments = self._entries[slot]
+        return input_id, dict(arguments)
@@ -6,8 +6,8 @@ import asyncio
 import inspect
 import time
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, cast
-from urllib.parse import parse_qs, urlencode
 from uuid import uuid4
 
 import discord
@@ -37,13 +37,36 @@ from playcord.api import (
 from playcord.api.handlers import HandlerRef, HandlerSpec
 from playcord.application.runtime_context import get_container
 from playcord.application.services import replay_viewer
+from playcord.application.services.component_codec import (
+    ComponentArgumentTable,
+    decode_component_token,
+    encode_component_token,
+)
+from playcord.application.services.message_coalescer import (
+    MessageEditCoalescer,
+    layout_digest,
+)
+from playcord.application.services.outbound import (
+    OutboundPriority,
+    delete_message,
+    edit_message,
+    send_message,
+)
+from playcord.application.services.replay_writer import ReplayWriter
+from playcord.application.services.sequence_allocator import SequenceAllocator
 from playcord.core.errors import ConfigurationError
 from playcord.infrastructure.constants import (
     BUTTON_PREFIX_GAME_MOVE,
     BUTTON_PREFIX_GAME_SELECT,
     BUTTON_PREFIX_PEEK,
     BUTTON_PREFIX_SPECTATE,
+    COMPONENT_CACHE_MAX_ENTRIES,
     EPHEMERAL_DELETE_AFTER,
+    THREAD_MEMBER_SETUP_CONCURRENCY,
+)
+from playcord.infrastructure.database.implementation.core.invalidation import (
+    InvalidationTopic,
+    invalidation_bus,
 )
 from playcord.infrastructure.db_thread import run_in_thread
 from playcord.infrastructure.locale import fmt, get
@@ -53,10 +76,17 @@ from playcord.ui.emojis import resolve_button_emoji
 from playcord.ui.render import make_discord_button, render_interactive_layout
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Mapping, Sequence
 
 log = get_logger("game.runtime")
 
+_BUTTON_STYLES = {
+    "primary": discord.ButtonStyle.primary,
+    "secondary": discord.ButtonStyle.secondary,
+    "success": discord.ButtonStyle.success,
+    "danger": discord.ButtonStyle.danger,
+}
+
 
 @dataclass(slots=True)
 class PendingInputRequest:
@@ -72,14 +102,13 @@ class PendingInputRequest:
     timeout_warning_message: discord.Message | None = None
     timeout_warning_player_ids: set[int] = field(default_factory=set)
     timeout_deadline_unix: int | None = None
+    # Built once: players and inputs are fixed for the life of the request.
+    player_ids: frozenset[int] = field(init=False)
+    input_by_id: Mapping[str, GameInputSpec] = field(init=False)
 
-    @property
-    def player_ids(self) -> set[int]:
-        return {int(player.id) for player in self.players}
-
-    @property
-    def input_by_id(self) -> dict[str, GameInputSpec]:
-        return {spec.id: spec for spec in self.inputs}
+    def __post_init__(self) -> None:
+        self.player_ids = frozenset(int(player.id) for player in self.players)
+        self.input_by_id = MappingProxyType({spec.id: spec for spec in self.inputs})
 
     @property
     def command_inputs(self) -> tuple[CommandInput, ...]:
@@ -201,6 +230,13 @@ class GameManager:
         self.thread = thread
         self.owned_messages: dict[str, discord.Message] = {}
         self.owned_message_purposes: dict[str, str] = {}
+        # layout_digest of what each owned message (and the overview) shows now.
+        self.owned_message_digests: dict[str, str] = {}
+        self._overview_digest: str | None = None
+        # Constructor arguments of rendered components, keyed by spec and request.
+        self._component_cache: dict[tuple[Any, ...], dict[str, Any]] = {}
+        # Input ids and arguments behind the custom ids of the current request.
+        self._component_args = ComponentArgumentTable()
         self.player_roles: dict[int, Any] = {}
         self.ending_game = False
         self._interrupt_started = False
@@ -211,6 +247,17 @@ class GameManager:
         self._main_task: asyncio.Task[Any] | None = None
         self.rematch_view_factory: Any = None
         self._background_tasks: set[asyncio.Task[object]] = set()
+        self.move_sequence = SequenceAllocator(self._seed_move_sequence)
+        self.replay_sequence = SequenceAllocator(self._seed_replay_sequence)
+        self.replay_writer = ReplayWriter(
+            match_id,
+            self.replay_sequence,
+            logger=self.logger,
+        )
+        self.message_edits = MessageEditCoalescer(
+            self._upsert_message,
+            logger=self.logger,
+        )
 
     async def setup(self) -> None:
         if self.thread is None:
@@ -219,15 +266,7 @@ class GameManager:
         reg = get_container().registry
         guild = getattr(self.status_message, "guild", None)
 
-        roles_repo = get_container().roles_repository
-        self.player_roles = (
-            await run_in_thread(
-                roles_repo.get_role_assignments,
-                self.game_id,
-            )
-            or {}
-        )
-
+        thread_member_ids: list[int] = []
         for player in self.players:
             player_id = getattr(player, "id", None)
             if player_id is not None:
@@ -238,15 +277,41 @@ class GameManager:
                 and guild is not None
                 and player_id is not None
             ):
+                thread_member_ids.append(int(player_id))
+        # Thread membership is Discord HTTP and the rest is database work;
+        # neither waits on the other.
+        await asyncio.gather(
+            self._add_thread_members(guild, thread_member_ids),
+            self._prepare_match_state(),
+        )
+        reg.games_by_thread_id[self.thread.id] = self
+        await self._show_started_overview()
+        self._main_task = asyncio.create_task(self._run_main())
+
+    async def _add_thread_members(self, guild: Any, player_ids: list[int]) -> None:
+        limit = asyncio.Semaphore(THREAD_MEMBER_SETUP_CONCURRENCY)
+
+        async def add(player_id: int) -> None:
+            async with limit:
                 try:
-                    member = await guild.fetch_member(int(player_id))
+                    member = guild.get_member(player_id)
+                    if member is None:
+                        member = await guild.fetch_member(player_id)
                     await self.thread.add_user(member)
                 except Exception:
                     self.logger.debug("Failed to add player %s to thread", player_id)
-        reg.games_by_thread_id[self.thread.id] = self
+
+        await asyncio.gather(*(add(player_id) for player_id in player_ids))
+
+    async def _prepare_match_state(self) -> None:
+        roles_repo = get_container().roles_repository
+        roles, _ = await asyncio.gather(
+            run_in_thread(roles_repo.get_role_assignments, self.game_id),
+            self._seed_sequences(),
+        )
+        self.player_roles = roles or {}
+        # Needs the roles: they are part of the context the plugin sees.
         await self._record_initial_replay_state_async()
-        await self._show_started_overview()
-        self._main_task = asyncio.create_task(self._run_main())
 
     async def _show_started_overview(self) -> None:
         if (getattr(self.status_message, "content", "") or "").strip():
@@ -390,6 +455,9 @@ class GameManager:
                 future=loop.create_future(),
             )
             self._pending = request
+            # Cached components carry the previous request id; none can be reused.
+            self._component_cache.clear()
+            self._component_args = ComponentArgumentTable(request.request_id)
             if layout is not None and key is not None:
                 request_layout = self._layout_with_request_inputs(
                     layout,
@@ -401,6 +469,8 @@ class GameManager:
                     target=target,
                     purpose=purpose,
                 )
+            # Players must see the current board (and these inputs) while we wait.
+            await self.message_edits.flush()
             self._schedule_bot_inputs(request)
             if send_timeout_warning and timeout > 0:
                 self._schedule_timeout_warning(request, timeout=timeout)
@@ -510,7 +580,11 @@ class GameManager:
             thread = self.thread
             warned_player_ids = {int(player.id) for player in missing_players}
         try:
-            warning_message = await thread.send(warning_text)
+            warning_message = await send_message(
+                thread,
+                priority=OutboundPriority.INPUT,
+                content=warning_text,
+            )
         except Exception:
             self.logger.exception("Failed to send timeout warning")
             return
@@ -523,7 +597,7 @@ class GameManager:
                 request.timeout_warning_player_ids = warned_player_ids
         if should_delete:
             try:
-                await warning_message.delete()
+                await delete_message(warning_message, priority=OutboundPriority.INPUT)
             except Exception:
                 self.logger.exception("Failed to delete timeout warning")
             return
@@ -540,7 +614,7 @@ class GameManager:
             deadline_unix = request.timeout_deadline_unix or int(time.time())
         if not remaining_players:
             try:
-                await warning_message.delete()
+                await delete_message(warning_message, priority=OutboundPriority.INPUT)
             except Exception:
                 self.logger.exception("Failed to delete timeout warning")
             finally:
@@ -554,7 +628,11 @@ class GameManager:
             deadline_unix=deadline_unix,
         )
         try:
-            await warning_message.edit(content=warning_text)
+            await edit_message(
+                warning_message,
+                priority=OutboundPriority.INPUT,
+                content=warning_text,
+            )
         except Exception:
             self.logger.exception("Failed to update timeout warning")
 
@@ -789,7 +867,11 @@ class GameManager:
                 players=self._format_timeout_player_mentions(missing_players),
             )
             try:
-                await self.thread.send(timed_out_msg)
+                await send_message(
+                    self.thread,
+                    priority=OutboundPriority.INPUT,
+                    content=timed_out_msg,
+                )
             except Exception:
                 self.logger.exception("Failed to send timeout message")
 
@@ -898,9 +980,62 @@ class GameManager:
         task = self._main_task
         if task is not None and task is not asyncio.current_task() and not task.done():
             task.cancel()
+        # Before finish_match edits the overview itself.
+        await self.message_edits.close()
+        await self.flush_replay_events()
         from playcord.application.services.match_lifecycle import finish_match
 
-        await finish_match(self, outcome)
+        try:
+            await finish_match(self, outcome)
+        finally:
+            await self._archive_replay()
+
+    async def _archive_replay(self) -> None:
+        """Compact the finished match's replay rows into one archive row."""
+        replays = get_container().async_replays_repository
+        try:
+            archived = await replays.archive_replay(self.game_id)
+        except Exception:
+            self.logger.exception(
+                "Failed to archive replay events match_id=%s",
+                self.game_id,
+            )
+            return
+        if archived:
+            # Frames built from the pre-archive rows may be cached here or in
+            # other processes; the events are unchanged, but drop them anyway so
+            # nothing outlives a read that raced the archive.
+            replay_viewer.invalidate_match_cache(self.game_id)
+            invalidation_bus.publish(InvalidationTopic.MATCH, self.game_id)
+        self.logger.debug(
+            "Archived %d replay events match_id=%s",
+            archived,
+            self.game_id,
+        )
+
+    async def _seed_move_sequence(self) -> int:
+        matches = get_container().async_matches_repository
+        return await matches.get_next_move_number(self.game_id)
+
+    async def _seed_replay_sequence(self) -> int:
+        replays = get_container().async_replays_repository
+        return await replays.get_next_replay_sequence(self.game_id)
+
+    async def _seed_sequences(self) -> None:
+        """Seed move/replay numbering once per match start or resume."""
+        results = await asyncio.gather(
+            self.move_sequence.reseed(),
+            self.replay_sequence.reseed(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                # Allocators seed lazily on first use instead.
+                self.logger.warning(
+                    "Failed to seed sequences match_id=%s: %s",
+                    self.game_id,
+                    result,
+                )
 
     async def _record_move(
         self,
@@ -910,64 +1045,60 @@ class GameManager:
         *,
         source: InputSource,
     ) -> None:
-        def _sync_record() -> None:
-            try:
-                matches = get_container().matches_repository
-                replays = get_container().replays_repository
-                next_number = matches.get_move_count(self.game_id) + 1
-                matches.record_move(
+        try:
+            matches = get_container().async_matches_repository
+            user_id = (
+                int(getattr(actor, "id", 0))
+                if not getattr(actor, "is_bot", False)
+                else None
+            )
+            move_data = {"name": name, "arguments": arguments, "source": source}
+            kind = "system" if source == "bot" else "move"
+            next_number = await self.move_sequence.take()
+            if not await matches.record_move(
+                self.game_id,
+                user_id,
+                next_number,
+                move_data,
+                is_game_affecting=True,
+                kind=kind,
+            ):
+                await self.move_sequence.reseed()
+                next_number = await self.move_sequence.take()
+                await matches.record_move(
                     self.game_id,
-                    (
-                        int(getattr(actor, "id", 0))
-                        if not getattr(actor, "is_bot", False)
-                        else None
-                    ),
+                    user_id,
                     next_number,
-                    {"name": name, "arguments": arguments, "source": source},
+                    move_data,
                     is_game_affecting=True,
-                    kind="system" if source == "bot" else "move",
+                    kind=kind,
                 )
-                actor_id = getattr(actor, "id", None)
-                replay_event: dict[str, Any] = {
-                    "type": "move",
-                    "move_number": next_number,
-                    "command_name": name,
-                    "arguments": dict(arguments),
-                    "source": source,
-                }
-                if actor_id is not None:
-                    replay_event["user_id"] = int(actor_id)
-                replays.append_replay_dict(self.game_id, replay_event)
-                replay_viewer.invalidate_match_cache(self.game_id)
-            except Exception:
-                self.logger.exception("Failed to record move match_id=%s", self.game_id)
-
-        await run_in_thread(_sync_record)
+            actor_id = getattr(actor, "id", None)
+            replay_event: dict[str, Any] = {
+                "type": "move",
+                "move_number": next_number,
+                "command_name": name,
+                "arguments": dict(arguments),
+                "source": source,
+            }
+            if actor_id is not None:
+                replay_event["user_id"] = int(actor_id)
+            self.replay_writer.append(replay_event)
+        except Exception:
+            self.logger.exception("Failed to record move match_id=%s", self.game_id)
 
     def _plugin_replay_hook(self, event_type: str, payload: dict[str, Any]) -> None:
-        def _write() -> None:
-            try:
-                body: dict[str, Any] = {"type": event_type, **dict(payload)}
-                get_container().replays_repository.append_replay_dict(
-                    self.game_id,
-                    body,
-                )
-                replay_viewer.invalidate_match_cache(self.game_id)
-            except Exception:
-                self.logger.exception(
-                    "Failed to append plugin replay event match_id=%s type=%s",
-                    self.game_id,
-                    event_type,
-                )
+        self.replay_writer.append({"type": event_type, **dict(payload)})
 
+    async def flush_replay_events(self) -> None:
+        """Write out every queued replay event; safe to call more than once."""
         try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            _write()
-            return
-        task = loop.create_task(run_in_thread(_write))
-        self._background_tasks.add(task)
-        task.add_done_callback(self._background_tasks.discard)
+            await self.replay_writer.close()
+        except Exception:
+            self.logger.exception(
+                "Failed to flush replay events match_id=%s",
+                self.game_id,
+            )
 
     async def _record_initial_replay_state_async(self) -> None:
         try:
@@ -986,48 +1117,72 @@ class GameManager:
             "move_index": int(replay_state.move_index),
             "state": replay_state.state,
         }
-
-        def _write() -> None:
-            try:
-                get_container().replays_repository.append_replay_dict(
-                    self.game_id,
-                    {"type": "replay_init", "state": payload},
-                )
-                replay_viewer.invalidate_match_cache(self.game_id)
-            except Exception:
-                self.logger.exception(
-                    "Failed to record replay_init match_id=%s",
-                    self.game_id,
-                )
-
-        await run_in_thread(_write)
+        self.replay_writer.append({"type": "replay_init", "state": payload})
 
     async def _apply_actions(self, actions: tuple[Any, ...]) -> None:
         for action in actions:
             if isinstance(action, UpsertMessage):
-                await self._upsert_message(action)
+                # Edits of existing messages are coalesced; new messages go out now.
+                queued = self._edits_existing_message(action) and (
+                    self.message_edits.submit(action)
+                )
+                if not queued:
+                    await self._upsert_message(action)
             elif isinstance(action, DeleteMessage):
+                self.message_edits.discard(action.target, action.key)
                 await self._delete_owned_message(action.key)
 
+    def _edits_existing_message(self, action: UpsertMessage) -> bool:
+        if action.target == "overview":
+            return True
+        return self.thread is not None and action.key in self.owned_messages
+
+    def _layout_digest(self, layout: MessageLayout) -> str:
+        # Component custom ids carry the pending request id, so it is part of
+        # what the message shows even when the layout itself is unchanged.
+        request_ids = [
+            self._request_id_for_input(spec.id)
+            for spec in (*layout.buttons, *layout.selects)
+        ]
+        return layout_digest(layout, *request_ids)
+
     async def _upsert_message(self, action: UpsertMessage) -> None:
+        digest = self._layout_digest(action.layout)
         if action.target == "overview":
+            if digest == self._overview_digest:
+                self.message_edits.record_unchanged()
+                return
+            # Recorded up front so an identical upsert racing this one is skipped.
+            self._overview_digest = digest
             view = self._build_overview_view(action.layout)
             if view is not None:
-                await self._safe_edit_message(
+                edited = await self._safe_edit_message(
                     self.status_message,
                     view=view,
                     attachments=[],
                 )
             else:
-                await self._safe_edit_message(
+                edited = await self._safe_edit_message(
                     self.status_message,
                     content=action.layout.content,
                     attachments=[],
                 )
+            if not edited and self._overview_digest == digest:
+                self._overview_digest = None
             return
         if self.thread is None:
             return
         existing = self.owned_messages.get(action.key)
+        if (
+            existing is not None
+            and self.owned_message_digests.get(action.key) == digest
+        ):
+            self.message_edits.record_unchanged()
+            self.owned_message_purposes[action.key] = action.purpose
+            return
+        if existing is not None:
+            self.owned_message_digests[action.key] = digest
+        priority = self._message_priority(action.purpose)
         view = self._build_view(action.layout)
         files = [
             discord.File(fp=asset_to_file(asset), filename=asset.filename)
@@ -1035,7 +1190,9 @@ class GameManager:
         ]
         if existing is None:
             if view is None:
-                message = await self.thread.send(
+                message = await send_message(
+                    self.thread,
+                    priority=priority,
                     content=action.layout.content,
                     files=files or None,
                 )
@@ -1043,27 +1200,48 @@ class GameManager:
                 send_kw: dict[str, Any] = {"view": view}
                 if files:
                     send_kw["files"] = files
-                message = await self.thread.send(**send_kw)
+                message = await send_message(
+                    self.thread,
+                    priority=priority,
+                    **send_kw,
+                )
             self.owned_messages[action.key] = message
             self.owned_message_purposes[action.key] = action.purpose
+            self.owned_message_digests[action.key] = digest
             return
         if view is None:
-            await self._safe_edit_message(
+            edited = await self._safe_edit_message(
                 existing,
+                priority=priority,
                 content=action.layout.content,
                 attachments=files,
             )
         else:
-            await self._safe_edit_message(existing, view=view, attachments=files)
+            edited = await self._safe_edit_message(
+                existing,
+                priority=priority,
+                view=view,
+                attachments=files,
+            )
         self.owned_message_purposes[action.key] = action.purpose
+        if not edited and self.owned_message_digests.get(action.key) == digest:
+            # Unknown state on Discord: the next upsert must edit for real.
+            del self.owned_message_digests[action.key]
+
+    @staticmethod
+    def _message_priority(purpose: Any) -> OutboundPriority:
+        if purpose in (MessagePurpose.overview, MessagePurpose.announcement):
+            return OutboundPriority.OVERVIEW
+        return OutboundPriority.BOARD
 
     async def _delete_owned_message(self, key: str) -> None:
         message = self.owned_messages.pop(key, None)
-        self.owned_message_purposes.pop(key, None)
+        purpose = self.owned_message_purposes.pop(key, None)
+        self.owned_message_digests.pop(key, None)
         if message is None:
             return
         try:
-            await message.delete()
+            await delete_message(message, priority=self._message_priority(purpose))
         except discord.HTTPException:
             self.logger.debug("Failed to delete owned message key=%s", key)
 
@@ -1071,10 +1249,13 @@ class GameManager:
         self,
         message: discord.Message | None,
         /,
+        *,
+        priority: OutboundPriority = OutboundPriority.OVERVIEW,
         **kwargs: Any,
-    ) -> None:
+    ) -> bool:
+        """Edit ``message``, logging failures; True if the edit went through."""
         if message is None:
-            return
+            return False
         edit_kwargs = dict(kwargs)
         try:
             if (
@@ -1085,7 +1266,7 @@ class GameManager:
                     "Dropping content from edit because message uses components v2",
                 )
                 edit_kwargs.pop("content", None)
-            await message.edit(**edit_kwargs)
+            await edit_message(message, priority=priority, **edit_kwargs)
         except Exception as exc:
             if (
                 edit_kwargs.get("content") is not None
@@ -1095,18 +1276,20 @@ class GameManager:
                 retry_kwargs = dict(edit_kwargs)
                 retry_kwargs.pop("content", None)
                 try:
-                    await message.edit(**retry_kwargs)
-                    return
+                    await edit_message(message, priority=priority, **retry_kwargs)
+                    return True
                 except Exception:
                     self.logger.exception(
                         "Failed to edit message %s",
                         getattr(message, "id", None),
                     )
-                    return
+                    return False
             self.logger.exception(
                 "Failed to edit message %s",
                 getattr(message, "id", None),
             )
+            return False
+        return True
 
     @staticmethod
     def _is_http_exception(exc: Exception) -> bool:
@@ -1171,59 +1354,97 @@ class GameManager:
         )
         return self._build_interactive_view(layout, trail)
 
+    def _cached_component(
+        self,
+        key: tuple[Any, ...],
+        build: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        Return a component's constructor arguments, building them once per ``key``.
+
+        Only the arguments are cached: discord.py items belong to the view they
+        are added to, so every render still constructs fresh ones.
+        """
+        kwargs = self._component_cache.get(key)
+        if kwargs is None:
+            if len(self._component_cache) >= COMPONENT_CACHE_MAX_ENTRIES:
+                self._component_cache.clear()
+            kwargs = self._component_cache[key] = build()
+        return kwargs
+
     def _make_button(self, spec: ButtonInput) -> discord.ui.Button:
-        style_map = {
-            "primary": discord.ButtonStyle.primary,
-            "secondary": discord.ButtonStyle.secondary,
-            "success": discord.ButtonStyle.success,
-            "danger": discord.ButtonStyle.danger,
-        }
         request_id = self._request_id_for_input(spec.id)
-        payload = urlencode(
-            {
-                "request_id": request_id,
-                "input_id": spec.id,
-                **{f"arg_{key}": str(value) for key, value in spec.arguments.items()},
-            },
+        arguments = tuple(
+            (str(key), str(value)) for key, value in spec.arguments.items()
         )
-        resource_id = self.thread.id if self.thread is not None else self.game_id
-        custom_id = f"{BUTTON_PREFIX_GAME_MOVE}{resource_id}/{payload}"
-        emoji_val = resolve_button_emoji(spec.emoji) if spec.emoji else None
-        return make_discord_button(
-            label=spec.label,
-            style=style_map[str(spec.style)],
-            custom_id=custom_id,
-            disabled=spec.disabled or not request_id,
-            emoji=emoji_val,
+
+        def build() -> dict[str, Any]:
+            slot = self._component_args.register(spec.id, arguments)
+            payload = encode_component_token(request_id, slot)
+            resource_id = self.thread.id if self.thread is not None else self.game_id
+            return {
+                "label": spec.label,
+                "style": _BUTTON_STYLES[str(spec.style)],
+                "custom_id": f"{BUTTON_PREFIX_GAME_MOVE}{resource_id}/{payload}",
+                "disabled": spec.disabled or not request_id,
+                "emoji": resolve_button_emoji(spec.emoji) if spec.emoji else None,
+            }
+
+        key = (
+            "button",
+            request_id,
+            spec.id,
+            spec.label,
+            arguments,
+            str(spec.style),
+            spec.emoji,
+            spec.disabled,
         )
+        return make_discord_button(**self._cached_component(key, build))
 
     def _make_select(self, spec: SelectInput) -> discord.ui.Select:
         request_id = self._request_id_for_input(spec.id)
-        payload = urlencode({"request_id": request_id, "input_id": spec.id})
-        resource_id = self.thread.id if self.thread is not None else self.game_id
-        custom_id = f"{BUTTON_PREFIX_GAME_SELECT}{resource_id}/{payload}"
-        options = []
-        for option in spec.options:
-            opt_label = (
-                option.label
-                if (option.label and option.label.strip())
-                else option.value
-            )
-            options.append(
-                discord.SelectOption(
-                    label=opt_label,
-                    value=option.value,
-                    default=option.default,
-                ),
+
+        def build() -> dict[str, Any]:
+            slot = self._component_args.register(spec.id)
+            payload = encode_component_token(request_id, slot)
+            resource_id = self.thread.id if self.thread is not None else self.game_id
+            options = tuple(
+                {
+                    "label": (
+                        option.label
+                        if (option.label and option.label.strip())
+                        else option.value
+                    ),
+                    "value": option.value,
+                    "default": option.default,
+                }
+                for option in spec.options
             )
-        return discord.ui.Select(
-            custom_id=custom_id,
-            placeholder=spec.placeholder,
-            options=options,
-            min_values=spec.min_values,
-            max_values=spec.max_values,
-            disabled=spec.disabled or not request_id,
+            return {
+                "custom_id": f"{BUTTON_PREFIX_GAME_SELECT}{resource_id}/{payload}",
+                "placeholder": spec.placeholder,
+                "options": options,
+                "min_values": spec.min_values,
+                "max_values": spec.max_values,
+                "disabled": spec.disabled or not request_id,
+            }
+
+        key = (
+            "select",
+            request_id,
+            spec.id,
+            spec.options,
+            spec.placeholder,
+            spec.min_values,
+            spec.max_values,
+            spec.disabled,
         )
+        kwargs = dict(self._cached_component(key, build))
+        kwargs["options"] = [
+            discord.SelectOption(**option) for option in kwargs["options"]
+        ]
+        return discord.ui.Select(**kwargs)
 
     def _request_id_for_input(self, input_id: str) -> str:
         pending = self._pending
@@ -1234,14 +1455,16 @@ class GameManager:
         return pending.request_id
 
     def decode_input_payload(self, payload: str) -> tuple[str, str, dict[str, Any]]:
-        parsed = parse_qs(payload)
-        request_id = parsed.get("request_id", [""])[0]
-        input_id = parsed.get("input_id", [""])[0]
-        arguments = {
-            key.removeprefix("arg_"): values[0]
-            for key, values in parsed.items()
-            if key.startswith("arg_")
-        }
+        try:
+            request_id, slot = decode_component_token(payload)
+        except ValueError:
+            return "", "", {}
+        table = self._component_args
+        # Slots of an earlier request are gone; the request id alone rejects it.
+        entry = table.lookup(slot) if request_id == table.request_id else None
+        if entry is None:
+            return request_id, "", {}
+        input_id, arguments = entry
         return request_id, input_id, arguments
 
     def _player_by_id(self, user_id: Any) -> Any | None:
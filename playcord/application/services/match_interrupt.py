@@ -7,7 +7,6 @@ from typing import Any
 from playcord.application.runtime_context import get_container
 from playcord.infrastructure.analytics_client import register_event
 from playcord.infrastructure.database.models import EventType, MatchStatus
-from playcord.infrastructure.db_thread import run_in_thread
 from playcord.infrastructure.logging import get_logger
 
 log = get_logger("application.match_interrupt")
@@ -57,10 +56,13 @@ async def interrupt_match(
     match_id = getattr(interface, "game_id", None)
     thread = getattr(interface, "thread", None)
 
+    flush_replay_events = getattr(interface, "flush_replay_events", None)
+    if callable(flush_replay_events):
+        await flush_replay_events()
+
     try:
         if match_id is not None:
-            await run_in_thread(
-                get_container().matches_repository.update_status,
+            await get_container().async_matches_repository.update_status(
                 match_id,
                 MatchStatus.INTERRUPTED.value,
                 metadata_patch={"reason": reason_payload},
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 
 from playcord.application.runtime_context import get_container
 from playcord.application.services.game_manager import GameManager
+from playcord.application.services.outbound import OutboundPriority, send_message
 from playcord.application.services.role_management import (
     assign_roles,
     reorder_players_by_roles,
@@ -60,7 +61,7 @@ async def start_match_from_lobby(
     reg.matchmaking_by_lobby_key.pop(interface.lobby_key, None)
 
     match_options = dict(getattr(interface, "match_settings", {}) or {})
-    matches = get_container().matches_repository
+    matches = get_container().async_matches_repository
 
     game_instance = plugin_class(players)
     role_selections = getattr(interface, "role_selections", {})
@@ -69,13 +70,12 @@ async def start_match_from_lobby(
     if role_assignments:
         players = reorder_players_by_roles(players, role_assignments)
 
-    match_code = await run_in_thread(matches.ensure_unique_match_code)
+    match_code = await matches.ensure_unique_match_code()
     thread = await message.create_thread(
         name=f"{game_instance.metadata.name} - {match_code}",
     )
 
-    match_id, match_code = await run_in_thread(
-        matches.create_game,
+    match_id, match_code = await matches.create_game(
         interface.game_type,
         message.guild.id,
         [player.id for player in players],
@@ -127,9 +127,8 @@ async def finish_match(runtime: GameManager, outcome: Any) -> None:
             [getattr(player, "id", None) for player in group] for group in placements
         ],
     }
-    matches = get_container().matches_repository
-    await run_in_thread(
-        matches.end_match,
+    matches = get_container().async_matches_repository
+    await matches.end_match(
         runtime.game_id,
         final_state,
         results,
@@ -161,8 +160,7 @@ async def finish_match(runtime: GameManager, outcome: Any) -> None:
 
     if (global_summary and str(global_summary).strip()) or summaries:
         try:
-            await run_in_thread(
-                matches.merge_match_metadata_outcome_display,
+            await matches.merge_match_metadata_outcome_display(
                 runtime.game_id,
                 summaries=summaries,
                 global_summary=global_summary,
@@ -185,7 +183,11 @@ async def finish_match(runtime: GameManager, outcome: Any) -> None:
 
     summary = _summary_text(runtime, outcome)
     if runtime.thread is not None:
-        await runtime.thread.send(summary)
+        await send_message(
+            runtime.thread,
+            priority=OutboundPriority.OVERVIEW,
+            content=summary,
+        )
         await runtime.thread.edit(
             locked=True,
             archived=True,
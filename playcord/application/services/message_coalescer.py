@@ -0,0 +1,215 @@
+"""Coalescing and no-op detection of repeated message edits for a live match."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from playcord.infrastructure.constants import MESSAGE_EDIT_COALESCE_SECONDS
+from playcord.infrastructure.logging import get_logger
+
+if TYPE_CHECKING:
+    import logging
+    from collections.abc import Awaitable, Callable
+
+    from playcord.api import MessageLayout, UpsertMessage
+
+log = get_logger("game.message_edits")
+
+
+@dataclass(slots=True)
+class EditCoalescingStats:
+    """Process-wide counters across every :class:`MessageEditCoalescer`."""
+
+    submitted: int = 0
+    sent: int = 0
+    saved: int = 0
+    flushes: int = 0
+    # Edits dropped because the message already showed the same layout.
+    unchanged: int = 0
+
+
+_totals = EditCoalescingStats()
+_totals_lock = threading.Lock()
+
+
+def _count(**deltas: int) -> None:
+    with _totals_lock:
+        for name, delta in deltas.items():
+            setattr(_totals, name, getattr(_totals, name) + delta)
+
+
+def coalescing_stats() -> dict[str, Any]:
+    with _totals_lock:
+        snapshot = asdict(_totals)
+    submitted = snapshot["submitted"]
+    snapshot["saved_ratio"] = (
+        round(snapshot["saved"] / submitted, 3) if submitted else 0.0
+    )
+    return snapshot
+
+
+def format_coalescing_stats(snapshot: dict[str, Any]) -> str:
+    """One-line summary for the periodic stats log."""
+    return (
+        f"message edits: {snapshot['submitted']} requested, {snapshot['sent']} sent, "
+        f"{snapshot['saved']} coalesced away ({snapshot['saved_ratio']:.1%}) "
+        f"over {snapshot['flushes']} flush(es), "
+        f"{snapshot['unchanged']} skipped as unchanged"
+    )
+
+
+def layout_digest(layout: MessageLayout, *context: Any) -> str:
+    """Stable hash of everything in ``layout`` that ends up on the message.
+
+    Handlers and other server-side fields are left out. ``context`` mixes in
+    render inputs that live outside the layout, such as the request ids baked
+    into component custom ids.
+    """
+    canonical = [
+        layout.content,
+        layout.button_row_width,
+        [
+            [
+                button.id,
+                button.label,
+                sorted((str(k), str(v)) for k, v in button.arguments.items()),
+                str(button.style),
+                button.emoji,
+                button.disabled,
+            ]
+            for button in layout.buttons
+        ],
+        [
+            [
+                select.id,
+                [[o.label, o.value, o.default] for o in select.options],
+                select.placeholder,
+                select.min_values,
+                select.max_values,
+                select.disabled,
+            ]
+            for select in layout.selects
+        ],
+        [
+            [
+                asset.filename,
+                asset.description,
+                hashlib.blake2b(asset.data, digest_size=16).hexdigest(),
+            ]
+            for asset in layout.attachments
+        ],
+        [str(part) for part in context],
+    ]
+    encoded = json.dumps(canonical, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+class MessageEditCoalescer:
+    """Keep only the latest queued edit per message.
+
+    :meth:`submit` queues an upsert and arms a flush ``window`` seconds later;
+    another upsert for the same message before then replaces the queued one.
+    :meth:`flush` sends everything queued right away, in the order the messages
+    were first queued; :meth:`close` also stops queueing, so later submits are
+    refused and the caller sends them directly. The sender reports edits it
+    skipped because nothing changed through :meth:`record_unchanged`.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[UpsertMessage], Awaitable[None]],
+        *,
+        window: float = MESSAGE_EDIT_COALESCE_SECONDS,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.window = max(0.0, float(window))
+        self.logger = logger or log
+        self.submitted = 0
+        self.sent = 0
+        self.unchanged = 0
+        self._send = send
+        self._queue: dict[tuple[str, str], UpsertMessage] = {}
+        self._flush_lock = asyncio.Lock()
+        self._timer: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    @property
+    def saved(self) -> int:
+        return self.submitted - self.sent - len(self._queue)
+
+    def submit(self, action: UpsertMessage) -> bool:
+        """Queue ``action``; False if closed or disabled (send it directly)."""
+        if self._closed or self.window <= 0:
+            return False
+        self.submitted += 1
+        _count(submitted=1)
+        key = (str(action.target), action.key)
+        if key in self._queue:
+            _count(saved=1)
+        self._queue[key] = action
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.get_running_loop().create_task(self._flush_later())
+        return True
+
+    def record_unchanged(self) -> None:
+        self.unchanged += 1
+        _count(unchanged=1)
+
+    def discard(self, target: str, key: str) -> None:
+        """Forget a queued edit (its message is being deleted)."""
+        if self._queue.pop((str(target), key), None) is not None:
+            _count(saved=1)
+
+    async def flush(self) -> None:
+        # Shielded: a caller cancelled mid-flush (e.g. the match's main task
+        # at finish) must not drop the rest of the batch it already dequeued.
+        await asyncio.shield(self._flush())
+
+    async def _flush(self) -> None:
+        async with self._flush_lock:
+            if not self._queue:
+                return
+            batch = list(self._queue.values())
+            self._queue.clear()
+            _count(flushes=1)
+            for action in batch:
+                try:
+                    await self._send(action)
+                except Exception:
+                    self.logger.exception(
+                        "Failed to send coalesced edit key=%s", action.key
+                    )
+                self.sent += 1
+                _count(sent=1)
+
+    async def close(self) -> None:
+        """Cancel the timer, send whatever is queued, and stop queueing."""
+        self._closed = True
+        timer = self._timer
+        self._timer = None
+        if timer is not None and not timer.done():
+            timer.cancel()
+        await self.flush()
+        if self.submitted or self.unchanged:
+            self.logger.debug(
+                "Message edits: %d requested, %d sent, %d coalesced away, "
+                "%d skipped as unchanged",
+                self.submitted,
+                self.sent,
+                self.saved,
+                self.unchanged,
+            )
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.window)
+        # flush() is shielded, so close() cancelling the timer never aborts an edit.
+        await self.flush()
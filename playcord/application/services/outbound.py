@@ -0,0 +1,305 @@
+"""Process-wide scheduler for outbound Discord message operations.
+
+Game runtimes and lobbies hand their sends, edits and deletes to
+:data:`outbound` instead of calling Discord directly. Operations queue per
+channel (Discord's rate-limit buckets are per channel) and run one at a time
+per channel, most urgent :class:`OutboundPriority` first, with at most
+``OUTBOUND_MAX_IN_FLIGHT`` in flight process-wide. A queued edit or delete
+of a message replaces an edit of the same message that has not started yet;
+the replaced caller gets the newer operation's result.
+
+Interaction responses (``followup_send``) are not scheduled: they use the
+interaction's own webhook bucket and have to answer within its deadline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+from playcord.infrastructure.constants import OUTBOUND_MAX_IN_FLIGHT
+from playcord.infrastructure.database.implementation.core.telemetry import (
+    LatencyHistogram,
+)
+from playcord.infrastructure.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+log = get_logger("outbound")
+
+
+class OutboundPriority(IntEnum):
+    """Lower runs first."""
+
+    # Boards players are acting on.
+    BOARD = 0
+    # Timeout warnings and other notices about pending input.
+    INPUT = 1
+    # Match overview / status messages and announcements.
+    OVERVIEW = 2
+    # Lobby embeds and other cosmetic updates.
+    PRESENCE = 3
+
+
+@dataclass(order=True, slots=True)
+class _Job:
+    priority: int
+    seq: int
+    operation: Callable[[], Awaitable[Any]] = field(compare=False)
+    future: asyncio.Future[Any] = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    supersedes: Hashable | None = field(default=None, compare=False)
+    dropped: bool = field(default=False, compare=False)
+    # The queued job this one replaced; it shares this job's outcome.
+    replaced: _Job | None = field(default=None, compare=False)
+
+
+@dataclass(slots=True)
+class _ChannelQueue:
+    heap: list[_Job] = field(default_factory=list)
+    # Queued (not yet started) jobs by supersede key.
+    by_key: dict[Hashable, _Job] = field(default_factory=dict)
+    worker: asyncio.Task[None] | None = None
+
+
+class _PriorityGate:
+    """Semaphore whose waiters are admitted in ``(priority, seq)`` order."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = max(1, limit)
+        self.active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+
+    async def acquire(self, priority: int, seq: int) -> None:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, seq, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Admitted just as we were cancelled: hand the slot on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                # The slot passes straight to the next waiter.
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+class OutboundScheduler:
+    """Per-channel priority queues in front of Discord message operations."""
+
+    def __init__(self, *, max_in_flight: int = OUTBOUND_MAX_IN_FLIGHT) -> None:
+        self._gate = _PriorityGate(max_in_flight)
+        self._channels: dict[int, _ChannelQueue] = {}
+        self._seq = itertools.count()
+        self._wait = {priority: LatencyHistogram() for priority in OutboundPriority}
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.superseded = 0
+        self.peak_depth = 0
+
+    @property
+    def depth(self) -> int:
+        return sum(len(queue.heap) for queue in self._channels.values())
+
+    async def run[T](
+        self,
+        channel_id: int | None,
+        operation: Callable[[], Awaitable[T]],
+        *,
+        priority: OutboundPriority,
+        supersedes: Hashable | None = None,
+        final: bool = False,
+    ) -> T:
+        """Queue ``operation`` on ``channel_id`` and wait for its result.
+
+        ``supersedes`` names what the operation overwrites (e.g. one message);
+        a queued operation with the same key is dropped in its favour. A
+        ``final`` operation (a delete) is never replaced itself.
+        """
+        if channel_id is None:
+            return await operation()
+        loop = asyncio.get_running_loop()
+        queue = self._channels.get(channel_id)
+        if queue is None:
+            queue = self._channels[channel_id] = _ChannelQueue()
+        job = _Job(
+            priority=int(priority),
+            seq=next(self._seq),
+            operation=operation,
+            future=loop.create_future(),
+            enqueued_at=time.perf_counter(),
+            supersedes=supersedes,
+        )
+        self.submitted += 1
+        if supersedes is not None:
+            previous = queue.by_key.get(supersedes)
+            if previous is not None:
+                self._supersede(previous, job)
+            if final:
+                queue.by_key.pop(supersedes, None)
+            else:
+                queue.by_key[supersedes] = job
+        heapq.heappush(queue.heap, job)
+        self.peak_depth = max(self.peak_depth, self.depth)
+        if queue.worker is None or queue.worker.done():
+            queue.worker = loop.create_task(self._drain(channel_id, queue))
+        return await job.future
+
+    def stats(self) -> dict[str, Any]:
+        by_priority: dict[str, int] = {
+            priority.name.lower(): 0 for priority in OutboundPriority
+        }
+        for queue in self._channels.values():
+            for job in queue.heap:
+                if not job.dropped:
+                    by_priority[OutboundPriority(job.priority).name.lower()] += 1
+        return {
+            "depth": sum(by_priority.values()),
+            "depth_by_priority": by_priority,
+            "peak_depth": self.peak_depth,
+            "channels": len(self._channels),
+            "in_flight": self._gate.active,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "superseded": self.superseded,
+            "wait": {
+                priority.name.lower(): histogram.snapshot()
+                for priority, histogram in self._wait.items()
+            },
+        }
+
+    def _supersede(self, previous: _Job, job: _Job) -> None:
+        previous.dropped = True
+        self.superseded += 1
+        # Take over the older job's place in line, at the more urgent priority.
+        job.priority = min(job.priority, previous.priority)
+        job.seq = previous.seq
+        job.enqueued_at = previous.enqueued_at
+        job.replaced = previous
+
+    @staticmethod
+    def _resolve(
+        job: _Job | None,
+        *,
+        result: Any = None,
+        exc: Exception | None = None,
+    ) -> None:
+        # The job and every job it replaced get the outcome; a cancelled
+        # caller in the chain never cancels the others.
+        while job is not None:
+            if not job.future.done():
+                if exc is not None:
+                    job.future.set_exception(exc)
+                else:
+                    job.future.set_result(result)
+            job = job.replaced
+
+    async def _drain(self, channel_id: int, queue: _ChannelQueue) -> None:
+        while queue.heap:
+            job = heapq.heappop(queue.heap)
+            if job.dropped:
+                continue
+            if job.supersedes is not None and queue.by_key.get(job.supersedes) is job:
+                del queue.by_key[job.supersedes]
+            # A caller that gave up (cancelled) before its turn does not take
+            # the operations it replaced down with it: run the newest of those.
+            while job.future.done() and job.replaced is not None:
+                job = job.replaced
+            if job.future.done():
+                continue
+            await self._gate.acquire(job.priority, job.seq)
+            try:
+                self._wait[OutboundPriority(job.priority)].observe(
+                    (time.perf_counter() - job.enqueued_at) * 1000,
+                )
+                result = await job.operation()
+            except Exception as exc:
+                self.failed += 1
+                self._resolve(job, exc=exc)
+            else:
+                self.completed += 1
+                self._resolve(job, result=result)
+            finally:
+                self._gate.release()
+        if self._channels.get(channel_id) is queue:
+            del self._channels[channel_id]
+
+
+outbound = OutboundScheduler()
+
+
+def _channel_id(target: Any) -> int | None:
+    channel_id = getattr(target, "id", None)
+    return int(channel_id) if isinstance(channel_id, int) else None
+
+
+def _message_channel_id(message: Any) -> int | None:
+    return _channel_id(getattr(message, "channel", None))
+
+
+async def send_message(
+    channel: Any, *, priority: OutboundPriority, **kwargs: Any
+) -> Any:
+    """``channel.send(**kwargs)`` through :data:`outbound`."""
+    return await outbound.run(
+        _channel_id(channel),
+        lambda: channel.send(**kwargs),
+        priority=priority,
+    )
+
+
+async def edit_message(
+    message: Any, *, priority: OutboundPriority, **kwargs: Any
+) -> Any:
+    """``message.edit(**kwargs)``; replaces a still-queued edit of the same message."""
+    return await outbound.run(
+        _message_channel_id(message),
+        lambda: message.edit(**kwargs),
+        priority=priority,
+        supersedes=("message", getattr(message, "id", None)),
+    )
+
+
+async def delete_message(message: Any, *, priority: OutboundPriority) -> None:
+    """``message.delete()``; a still-queued edit of the message is dropped."""
+    await outbound.run(
+        _message_channel_id(message),
+        message.delete,
+        priority=priority,
+        supersedes=("message", getattr(message, "id", None)),
+        final=True,
+    )
+
+
+def format_outbound_stats(snapshot: dict[str, Any]) -> str:
+    """One-line summary for the periodic stats log."""
+    waits = ", ".join(
+        f"{name} {wait['avg_ms']}/{wait['max_ms']} ms"
+        for name, wait in snapshot["wait"].items()
+        if wait["count"]
+    )
+    return (
+        f"outbound: depth {snapshot['depth']} (peak {snapshot['peak_depth']}) "
+        f"over {snapshot['channels']} channel(s), in flight {snapshot['in_flight']}, "
+        f"completed {snapshot['completed']}, failed {snapshot['failed']}, "
+        f"superseded {snapshot['superseded']}"
+        + (f"; queue wait avg/max {waits}" if waits else "")
+    )
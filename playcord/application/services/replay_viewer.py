@@ -242,6 +242,15 @@ def invalidate_match_cache(match_id: int) -> None:
         _FRAME_CACHE.pop(key, None)
 
 
+def forget_match_frames(match_id: str | None) -> None:
+    """Invalidation bus handler: drop one match's frames (all for ``None``)."""
+    if match_id is None:
+        _PRECOMPUTED_FRAMES.clear()
+        _FRAME_CACHE.clear()
+    else:
+        invalidate_match_cache(int(match_id))
+
+
 def frame_for_index(
     *,
     match_id: int,
@@ -0,0 +1,139 @@
+"""Write-behind batching of replay events for a single live match."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from playcord.application.runtime_context import get_container
+from playcord.application.services import replay_viewer
+from playcord.infrastructure.constants import (
+    REPLAY_WRITER_BATCH_SIZE,
+    REPLAY_WRITER_FLUSH_INTERVAL_SECONDS,
+)
+from playcord.infrastructure.database.implementation.core.invalidation import (
+    InvalidationTopic,
+    invalidation_bus,
+)
+from playcord.infrastructure.logging import get_logger
+
+if TYPE_CHECKING:
+    import logging
+
+    from playcord.application.services.sequence_allocator import SequenceAllocator
+
+log = get_logger("game.replay_writer")
+
+
+class ReplayWriter:
+    """Queue replay events in memory and insert them in multi-row batches.
+
+    Sequence numbers come from the match's :class:`SequenceAllocator`, so a
+    flush is a single INSERT with no ``matches`` row lock. A flush runs once
+    ``batch_size`` events are queued or ``flush_interval`` seconds after the
+    first queued event, whichever comes first; :meth:`close` forces the rest out.
+    """
+
+    def __init__(
+        self,
+        match_id: int,
+        sequences: SequenceAllocator,
+        *,
+        batch_size: int = REPLAY_WRITER_BATCH_SIZE,
+        flush_interval: float = REPLAY_WRITER_FLUSH_INTERVAL_SECONDS,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.match_id = match_id
+        self.sequences = sequences
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(0.0, float(flush_interval))
+        self.logger = logger or log
+        self._queue: list[dict[str, Any]] = []
+        self._flush_lock = asyncio.Lock()
+        self._timer: asyncio.Task[None] | None = None
+        self._tasks: set[asyncio.Task[object]] = set()
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def append(self, event: dict[str, Any]) -> None:
+        """Queue one replay dict (``{"type": ..., ...}``) for the next flush."""
+        if self._closed:
+            self.logger.warning(
+                "Replay event after close match_id=%s type=%s",
+                self.match_id,
+                event.get("type"),
+            )
+        self._queue.append(dict(event))
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (sync plugin hooks in tests/tools): the next flush picks it up.
+            return
+        if len(self._queue) >= self.batch_size:
+            self._spawn(loop, self.flush())
+        elif self._timer is None or self._timer.done():
+            self._timer = loop.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._queue:
+                return
+            batch = self._queue
+            self._queue = []
+            try:
+                await self._write(batch)
+            except Exception:
+                self.logger.exception(
+                    "Failed to flush %d replay events match_id=%s",
+                    len(batch),
+                    self.match_id,
+                )
+                # Keep the events for the next attempt, ahead of anything newer.
+                self._queue[:0] = batch
+                return
+        replay_viewer.invalidate_match_cache(self.match_id)
+        invalidation_bus.publish(InvalidationTopic.MATCH, self.match_id)
+
+    async def close(self) -> None:
+        """Cancel the pending timer and flush everything still queued."""
+        self._closed = True
+        timer = self._timer
+        self._timer = None
+        if timer is not None and not timer.done():
+            timer.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.flush()
+
+    async def _write(self, batch: list[dict[str, Any]]) -> None:
+        replays = get_container().async_replays_repository
+        first = await self.sequences.take(len(batch))
+        if await replays.append_replay_events(
+            self.match_id,
+            batch,
+            first_sequence=first,
+        ):
+            return
+        # Another writer claimed some of these numbers; reseed and retry once.
+        await self.sequences.reseed()
+        first = await self.sequences.take(len(batch))
+        if not await replays.append_replay_events(
+            self.match_id,
+            batch,
+            first_sequence=first,
+        ):
+            msg = f"Replay sequence conflict persisted after reseed (match_id={self.match_id})"
+            raise RuntimeError(msg)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        # Shielded so close() cancelling the timer never aborts an in-flight write.
+        await asyncio.shield(self.flush())
+
+    def _spawn(self, loop: asyncio.AbstractEventLoop, coro: Any) -> None:
+        task = loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
@@ -0,0 +1,41 @@
+"""In-process sequence numbers for per-match event streams."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+class SequenceAllocator:
+    """Hand out consecutive numbers for one stream, seeded once from the database.
+
+    ``seed`` returns the next free number (``MAX(...) + 1``). It runs on first
+    use, or eagerly via :meth:`reseed` when a match starts or resumes, and again
+    whenever a write reports that a number it was given is already taken.
+    """
+
+    def __init__(self, seed: Callable[[], Awaitable[int]]) -> None:
+        self._seed = seed
+        self._next: int | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def seeded(self) -> bool:
+        return self._next is not None
+
+    async def reseed(self) -> None:
+        async with self._lock:
+            self._next = max(1, int(await self._seed()))
+
+    async def take(self, count: int = 1) -> int:
+        """Reserve ``count`` consecutive numbers and return the first one."""
+        if self._next is None:
+            async with self._lock:
+                if self._next is None:
+                    self._next = max(1, int(await self._seed()))
+        first = self._next
+        self._next = first + max(1, count)
+        return first
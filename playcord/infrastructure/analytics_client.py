@@ -5,43 +5,40 @@ Tracks events like game starts, game completions, command usage, etc.
 
 import json
 import time
-from typing import Any
-
-from playcord.infrastructure.constants import VERSION
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from playcord.infrastructure.analytics_ingest import AnalyticsIngestQueue
+from playcord.infrastructure.constants import (
+    ANALYTICS_INGEST_BATCH_SIZE,
+    ANALYTICS_INGEST_FLUSH_INTERVAL_SECONDS,
+    ANALYTICS_INGEST_QUEUE_CAPACITY,
+    ANALYTICS_SPILL_PATH,
+    VERSION,
+)
+from playcord.infrastructure.database.implementation.core.cache import (
+    format_cache_stats,
+)
+from playcord.infrastructure.database.implementation.core.telemetry import (
+    format_pool_snapshot,
+)
 from playcord.infrastructure.database.models import EventType
 from playcord.infrastructure.logging import get_logger
 
+if TYPE_CHECKING:
+    from playcord.infrastructure.database.implementation.repositories.analytics import (
+        AsyncAnalyticsRepository,
+    )
+
 logger = get_logger("analytics")
 
 
-def _record_via_container(
-    et: str,
-    meta: dict[str, Any],
-    *,
-    user_id: int | None,
-    guild_id: int | None,
-    game_type: str | None,
-    match_id: int | None,
-) -> bool:
-    try:
-        from playcord.application.runtime_context import try_get_container
-
-        c = try_get_container()
-        if c is None:
-            return False
-        payload = dict(meta)
-        payload.setdefault("user_id", user_id)
-        payload.setdefault("guild_id", guild_id)
-        payload.setdefault("game_type", game_type)
-        payload.setdefault("match_id", match_id)
-        c.analytics.record(et, payload)
-        return True
-    except Exception:
-        return False
-
-
-# Fallback buffer when DB write fails (retry on flush)
-_event_buffer: list[dict] = []
+_ingest_queue = AnalyticsIngestQueue(
+    capacity=ANALYTICS_INGEST_QUEUE_CAPACITY,
+    batch_size=ANALYTICS_INGEST_BATCH_SIZE,
+    flush_interval=ANALYTICS_INGEST_FLUSH_INTERVAL_SECONDS,
+    spill_path=ANALYTICS_SPILL_PATH,
+)
 
 
 def register_event(
@@ -55,7 +52,7 @@ def register_event(
     latency_ms: float | None = None,
     outcome: str | None = None,
 ) -> None:
-    """Register an analytics event (written to the database immediately when connected)."""
+    """Register an analytics event (queued and written in batches by the ingest worker)."""
     et = event_type.value if isinstance(event_type, EventType) else str(event_type)
     meta = dict(metadata or {})
     meta.setdefault("bot_version", VERSION)
@@ -66,21 +63,10 @@ def register_event(
     if outcome is not None:
         meta.setdefault("outcome", str(outcome))
 
-    if _record_via_container(
-        et,
-        meta,
-        user_id=user_id,
-        guild_id=guild_id,
-        game_type=game_type,
-        match_id=match_id,
-    ):
-        logger.debug("Recorded analytics event: %s", et)
-        return
-
-    global _event_buffer
-    _event_buffer.append(
+    _ingest_queue.offer(
         {
             "event_type": et,
+            "created_at": datetime.now(UTC).isoformat(),
             "user_id": user_id,
             "guild_id": guild_id,
             "game_type": game_type,
@@ -88,54 +74,34 @@ def register_event(
             "metadata": meta,
         },
     )
-    if len(_event_buffer) >= 20:
-        flush_events()
+    logger.debug("Queued analytics event: %s", et)
 
 
-def flush_events() -> int:
-    """
-    Flush buffered events (after failed writes) to storage.
+def start_ingest(repository: "AsyncAnalyticsRepository") -> None:
+    """Start the batching writer on the running loop (call once the pool is open)."""
+    _ingest_queue.start(repository)
 
-    :return: Number of events flushed
-    """
-    global _event_buffer
 
-    if not _event_buffer:
-        return 0
+async def stop_ingest() -> None:
+    """Stop the writer and flush whatever is still queued."""
+    await _ingest_queue.stop()
 
-    count = len(_event_buffer)
-    events_to_flush = _event_buffer.copy()
 
-    from playcord.application.runtime_context import try_get_container
+async def flush_events() -> int:
+    """
+    Write all queued events now and replay any spilled to disk.
 
-    c = try_get_container()
-    if c is None:
-        logger.debug(
-            "Application container not bound; keeping %s buffered analytics events.",
-            count,
-        )
-        return 0
+    :return: Number of events written
+    """
+    flushed = await _ingest_queue.flush()
+    if flushed:
+        logger.debug("Flushed %s analytics events.", flushed)
+    return flushed
 
-    flushed = 0
-    try:
-        repo = c.analytics_repository
-        for event in events_to_flush:
-            payload: dict[str, Any] = dict(event.get("metadata") or {})
-            payload.setdefault("user_id", event.get("user_id"))
-            payload.setdefault("guild_id", event.get("guild_id"))
-            payload.setdefault("game_type", event.get("game_type"))
-            payload.setdefault("match_id", event.get("match_id"))
-            repo.record_event(event["event_type"], payload)
-            flushed += 1
-        _event_buffer = []
-        if flushed:
-            logger.info("Flushed %s buffered analytics events.", flushed)
-    except Exception as e:
-        logger.exception("Failed to flush analytics events: %s", e)
-        if len(_event_buffer) > 500:
-            _event_buffer = _event_buffer[-250:]
 
-    return flushed
+def ingest_stats() -> dict[str, Any]:
+    """Queue depth, throughput and spill counters for the ingest pipeline."""
+    return _ingest_queue.stats()
 
 
 class Timer:
@@ -189,6 +155,15 @@ def format_ascii_bar_chart(
     return lines
 
 
+def format_latency_row(row: dict[str, Any]) -> str:
+    """One line of the hourly-rollup latency summary."""
+    return (
+        f"`{row.get('event_type')}` avg {float(row['avg_ms']):.1f} ms "
+        f"(min {float(row['min_ms']):.1f}, max {float(row['max_ms']):.1f}, "
+        f"n={row['samples']})"
+    )
+
+
 def format_recent_event_row(row: dict[str, Any]) -> str:
     """One line for owner-facing analytics dump (Discord-safe length)."""
     meta = row.get("metadata")
@@ -219,14 +194,35 @@ def render_analytics_markdown_summary(
     game_counts: list[dict[str, Any]],
     recent: list[dict[str, Any]],
     hours: int,
+    ingest: dict[str, Any] | None = None,
+    pools: dict[str, dict[str, Any]] | None = None,
+    caches: dict[str, dict[str, Any]] | None = None,
+    latency: list[dict[str, Any]] | None = None,
 ) -> list[str]:
     lines = [f"Window: last {hours} hour(s)"]
+    for name, snapshot in (pools or {}).items():
+        lines.append(format_pool_snapshot(name, snapshot))
+    for name, snapshot in (caches or {}).items():
+        lines.append(format_cache_stats(name, snapshot))
+    if ingest is not None:
+        lines.append(
+            "Ingest queue: "
+            f"depth {ingest['depth']}/{ingest['capacity']} "
+            f"(peak {ingest['high_water']}), "
+            f"written {ingest['written']} in {ingest['batches']} batch(es), "
+            f"last batch {ingest['last_batch_ms']} ms, "
+            f"rejected {ingest['rejected']}, spilled {ingest['spilled']}, "
+            f"recovered {ingest['recovered']}, failed batches {ingest['failed_batches']}",
+        )
     lines.append("Events by type:")
     lines.extend(format_ascii_bar_chart(event_counts) or ["_(none)_"])
     lines.append("Games:")
     lines.extend(
         format_ascii_bar_chart(game_counts, label_key="game_type") or ["_(none)_"],
     )
+    if latency:
+        lines.append("Latency by type:")
+        lines.extend(format_latency_row(row) for row in latency)
     lines.append("Recent events:")
     lines.extend([format_recent_event_row(row) for row in recent[:12]] or ["_(none)_"])
     return lines
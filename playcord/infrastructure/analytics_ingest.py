@@ -0,0 +1,269 @@
+"""
+Bounded analytics ingestion queue.
+
+Events are queued in memory and written in batches (one users/guilds upsert and
+one COPY per batch). When the queue is full or a batch cannot be written, events
+are appended to a JSON-lines spill file and replayed once writes succeed again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from playcord.infrastructure.logging import get_logger
+
+if TYPE_CHECKING:
+    from playcord.infrastructure.database.implementation.repositories.analytics import (
+        AsyncAnalyticsRepository,
+    )
+
+logger = get_logger("analytics.ingest")
+
+# After a failed write, leave the spill file alone for this long before replaying it.
+_SPILL_RETRY_BACKOFF_SECONDS = 60.0
+
+
+@dataclass(slots=True)
+class IngestStats:
+    """Counters for the ingestion queue (backpressure and write health)."""
+
+    enqueued: int = 0
+    written: int = 0
+    rejected: int = 0
+    spilled: int = 0
+    recovered: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    high_water: int = 0
+    last_batch_ms: float = 0.0
+
+
+class AnalyticsIngestQueue:
+    """Batch analytics events by count or time and write them with COPY."""
+
+    def __init__(
+        self,
+        *,
+        capacity: int,
+        batch_size: int,
+        flush_interval: float,
+        spill_path: Path,
+    ) -> None:
+        self.capacity = max(1, int(capacity))
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(0.1, float(flush_interval))
+        self.spill_path = Path(spill_path)
+        self._events: deque[dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._stats = IngestStats()
+        self._repository: AsyncAnalyticsRepository | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._write_lock: asyncio.Lock | None = None
+        self._recover_lock: asyncio.Lock | None = None
+        self._spill_retry_after = 0.0
+
+    @property
+    def depth(self) -> int:
+        return len(self._events)
+
+    def stats(self) -> dict[str, Any]:
+        snapshot = asdict(self._stats)
+        snapshot["depth"] = self.depth
+        snapshot["capacity"] = self.capacity
+        snapshot["spill_bytes"] = (
+            self.spill_path.stat().st_size if self.spill_path.exists() else 0
+        )
+        return snapshot
+
+    def offer(self, event: dict[str, Any]) -> None:
+        """Queue one event; never blocks. Overflow goes to the spill file."""
+        with self._lock:
+            if len(self._events) >= self.capacity:
+                overflow = True
+            else:
+                overflow = False
+                self._events.append(event)
+                self._stats.enqueued += 1
+                depth = len(self._events)
+                self._stats.high_water = max(self._stats.high_water, depth)
+        if overflow:
+            self._spill([event])
+            return
+        if depth >= self.batch_size:
+            self._wake()
+
+    def start(self, repository: AsyncAnalyticsRepository) -> None:
+        """Start the background writer on the running event loop."""
+        if self._worker is not None and not self._worker.done():
+            return
+        self._repository = repository
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._recover_lock = asyncio.Lock()
+        self._worker = self._loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        worker = self._worker
+        self._worker = None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Write everything queued now, then replay the spill file if any."""
+        if self._repository is None or self._write_lock is None:
+            return 0
+        written = 0
+        while self._events:
+            batch_written = await self._write_next_batch()
+            if batch_written < 0:
+                return written
+            written += batch_written
+        return written + await self._recover_spill()
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                # Shielded so stop() never cancels a batch halfway through a write.
+                await asyncio.shield(self.flush())
+            except Exception:
+                logger.exception("Analytics ingest flush failed")
+
+    def _wake(self) -> None:
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wakeup.set()
+        else:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def _take_batch(self) -> list[dict[str, Any]]:
+        with self._lock:
+            count = min(self.batch_size, len(self._events))
+            return [self._events.popleft() for _ in range(count)]
+
+    async def _write_next_batch(self) -> int:
+        """Write one batch; returns rows written, or -1 if the batch was spilled."""
+        batch = self._take_batch()
+        if not batch:
+            return 0
+        written = await self._write(batch)
+        if written < 0:
+            await asyncio.to_thread(self._spill, batch)
+        return written
+
+    async def _write(self, batch: list[dict[str, Any]]) -> int:
+        assert self._repository is not None and self._write_lock is not None
+        started = time.perf_counter()
+        async with self._write_lock:
+            try:
+                written = await self._repository.ingest_events(batch)
+            except Exception:
+                self._stats.failed_batches += 1
+                self._spill_retry_after = (
+                    time.monotonic() + _SPILL_RETRY_BACKOFF_SECONDS
+                )
+                logger.exception(
+                    "Failed to write %d analytics events; spilling to %s",
+                    len(batch),
+                    self.spill_path,
+                )
+                return -1
+        self._stats.batches += 1
+        self._stats.written += written
+        self._stats.rejected += len(batch) - written
+        self._stats.last_batch_ms = round((time.perf_counter() - started) * 1000, 2)
+        return written
+
+    def _spill(self, events: list[dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(event, default=str) + "\n" for event in events)
+        try:
+            with self._spill_lock:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                with self.spill_path.open("a", encoding="utf-8") as handle:
+                    handle.write(lines)
+        except OSError:
+            logger.exception(
+                "Failed to spill %d analytics events; dropping them",
+                len(events),
+            )
+            return
+        self._stats.spilled += len(events)
+
+    async def _recover_spill(self) -> int:
+        if self._recover_lock is None:
+            return 0
+        # One replay at a time: concurrent flush() calls would otherwise each
+        # pick up the spill file (and events spilled back by a failed replay).
+        async with self._recover_lock:
+            return await self._replay_spill()
+
+    async def _replay_spill(self) -> int:
+        if not self.spill_path.exists():
+            return 0
+        if time.monotonic() < self._spill_retry_after:
+            return 0
+        # Unique per call, so a replay never overwrites another one's file.
+        replay_path = self.spill_path.with_name(
+            f"{self.spill_path.name}.{os.getpid()}.{uuid4().hex[:8]}.replay",
+        )
+        with self._spill_lock:
+            if not self.spill_path.exists():
+                return 0
+            self.spill_path.replace(replay_path)
+        events = await asyncio.to_thread(_read_spill_file, replay_path)
+        recovered = 0
+        for start in range(0, len(events), self.batch_size):
+            batch = events[start : start + self.batch_size]
+            written = await self._write(batch)
+            if written < 0:
+                await asyncio.to_thread(self._spill, events[start:])
+                break
+            recovered += written
+        replay_path.unlink(missing_ok=True)
+        self._stats.recovered += recovered
+        if recovered:
+            logger.info("Recovered %d spilled analytics events.", recovered)
+        return recovered
+
+
+def _read_spill_file(path: Path) -> list[dict[str, Any]]:
+    events: list[dict[str, Any]] = []
+    with path.open("r", encoding="utf-8") as handle:
+        for raw_line in handle:
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning("Skipping corrupt analytics spill line: %.80s", line)
+    return events
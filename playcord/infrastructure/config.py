@@ -22,6 +22,7 @@ class LoggingSettings:
 
 @dataclass(frozen=True, slots=True)
 class DatabaseSettings:
+    # "postgresql", or "memory" for the in-process store (nothing is persisted).
     type: str = "postgresql"
     host: str = "localhost"
     port: int = 5432
@@ -31,6 +32,20 @@ class DatabaseSettings:
     pool_size: int = 10
     max_overflow: int = 20
     pool_timeout: int = 30
+    min_size: int = 2
+    max_idle: int = 300
+    # Per-statement latency/row statistics (owner ``topqueries`` command).
+    profile_queries: bool = False
+    # Log statements slower than this many milliseconds; 0 disables the log.
+    slow_query_ms: int = 0
+    # Optional read replica for history/replay/analytics reads; "" disables it.
+    replica_host: str = ""
+    # 0 reuses ``port``.
+    replica_port: int = 0
+    # Lag above which lag-sensitive reads go back to the primary.
+    replica_max_lag_seconds: float = 5.0
+    # Share cache invalidations with other processes via LISTEN/NOTIFY.
+    invalidation_bus: bool = True
 
 
 @dataclass(frozen=True, slots=True)
@@ -72,6 +87,7 @@ def _apply_environment_overrides(raw: dict[str, Any]) -> dict[str, Any]:
         "PLAYCORD_DB_USER": "user",
         "PLAYCORD_DB_PASSWORD": "password",
         "PLAYCORD_DB_NAME": "database",
+        "PLAYCORD_DB_REPLICA_HOST": "replica_host",
     }
     for env_key, field_name in direct.items():
         value = os.getenv(env_key)
@@ -83,6 +99,10 @@ def _apply_environment_overrides(raw: dict[str, Any]) -> dict[str, Any]:
         "PLAYCORD_DB_POOL_SIZE": "pool_size",
         "PLAYCORD_DB_MAX_OVERFLOW": "max_overflow",
         "PLAYCORD_DB_POOL_TIMEOUT": "pool_timeout",
+        "PLAYCORD_DB_MIN_SIZE": "min_size",
+        "PLAYCORD_DB_MAX_IDLE": "max_idle",
+        "PLAYCORD_DB_SLOW_QUERY_MS": "slow_query_ms",
+        "PLAYCORD_DB_REPLICA_PORT": "replica_port",
     }
     for env_key, field_name in numeric.items():
         value = _as_int(os.getenv(env_key), env_key=env_key)
@@ -158,6 +178,14 @@ def load_settings(path: str | Path = DEFAULT_CONFIG_PATH) -> Settings:
             pool_size=int(db_raw.get("pool_size", 10)),
             max_overflow=int(db_raw.get("max_overflow", 20)),
             pool_timeout=int(db_raw.get("pool_timeout", 30)),
+            min_size=int(db_raw.get("min_size", 2)),
+            max_idle=int(db_raw.get("max_idle", 300)),
+            profile_queries=bool(db_raw.get("profile_queries", False)),
+            slow_query_ms=int(db_raw.get("slow_query_ms", 0)),
+            replica_host=str(db_raw.get("replica_host") or ""),
+            replica_port=int(db_raw.get("replica_port", 0)),
+            replica_max_lag_seconds=float(db_raw.get("replica_max_lag_seconds", 5.0)),
+            invalidation_bus=bool(db_raw.get("invalidation_bus", True)),
         ),
         logging=LoggingSettings(level=str(logging_raw.get("level", "INFO"))),
         analytics_retention_days=int(raw.get("analytics_retention_days", 30)),
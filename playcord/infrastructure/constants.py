@@ -28,6 +28,8 @@ MESSAGE_COMMAND_ANALYTICS = "analytics"
 MESSAGE_COMMAND_TREEDIFF = "treediff"
 MESSAGE_COMMAND_DBRESET = "dbreset"
 MESSAGE_COMMAND_EMOJI = "emoji"
+MESSAGE_COMMAND_REBUILD_STATS = "rebuildstats"
+MESSAGE_COMMAND_TOP_QUERIES = "topqueries"
 MESSAGE_COMMAND_SPECIFY_LOCAL_SERVER = "this"
 
 EMBED_COLOR = None
@@ -93,8 +95,58 @@ EPHEMERAL_DELETE_AFTER = 10
 
 ANALYTICS_PERIODIC_FLUSH_INITIAL_DELAY_SECONDS = 60
 ANALYTICS_PERIODIC_FLUSH_INTERVAL_SECONDS = 120
-# Retention DELETE runs at startup (migrations) and on this interval — not every flush tick.
-ANALYTICS_PERIODIC_CLEANUP_INTERVAL_SECONDS = 86_400
+# Bounded ingest queue: batches are written by count or interval; overflow and failed
+# batches are appended to the spill file and replayed once writes succeed again.
+ANALYTICS_INGEST_QUEUE_CAPACITY = 10_000
+ANALYTICS_INGEST_BATCH_SIZE = 500
+ANALYTICS_INGEST_FLUSH_INTERVAL_SECONDS = 5.0
+ANALYTICS_SPILL_PATH = _PROJECT_ROOT / "data" / "analytics-spill.jsonl"
+# Hourly rollup: raw events are folded in after each periodic flush, at most
+# BATCH_SIZE * MAX_BATCHES per tick so a backlog never stalls the flush loop.
+ANALYTICS_ROLLUP_BATCH_SIZE = 5_000
+ANALYTICS_ROLLUP_MAX_BATCHES = 20
+# Age an event_id horizon must reach before the fold passes it: longer than any
+# analytics insert transaction (a COPY batch) can stay open.
+ANALYTICS_ROLLUP_SETTLE_SECONDS = 300
+
+# Monthly range-partitioned tables. The partition task keeps the next few months
+# created, drains rows that fell into the _default partitions, and enforces
+# retention by dropping whole expired months (analytics at startup, too).
+PARTITIONED_TABLES = ("match_moves", "analytics_events", "audit_events")
+PARTITION_MONTHS_AHEAD = 3
+PARTITION_MAINTENANCE_INITIAL_DELAY_SECONDS = 300
+PARTITION_MAINTENANCE_INTERVAL_SECONDS = 21_600
+
+# ``db.type`` that swaps PostgreSQL for the in-process store (load tests, benchmarks).
+DATABASE_TYPE_MEMORY = "memory"
+
+# LISTEN/NOTIFY channel for cross-process cache invalidation, and how many unsent
+# invalidations are queued before they collapse into one flush per topic.
+INVALIDATION_CHANNEL = "playcord_invalidate"
+INVALIDATION_MAX_PENDING = 1_000
+
+# Owner `topqueries` dump: statements shown by default / at most.
+TOP_QUERIES_DEFAULT_LIMIT = 10
+TOP_QUERIES_MAX_LIMIT = 50
+
+# Per-match replay write-behind: flush when this many events are queued, or after the interval.
+REPLAY_WRITER_BATCH_SIZE = 32
+REPLAY_WRITER_FLUSH_INTERVAL_SECONDS = 2.0
+# Window in which repeated edits of one game message collapse into the latest (0 = off).
+MESSAGE_EDIT_COALESCE_SECONDS = 0.35
+# Discord message operations the outbound scheduler runs at once, across all channels.
+OUTBOUND_MAX_IN_FLIGHT = 8
+# Rendered button/select arguments a game runtime keeps before starting over.
+COMPONENT_CACHE_MAX_ENTRIES = 1024
+# Players a starting match looks up and adds to its thread at the same time.
+THREAD_MEMBER_SETUP_CONCURRENCY = 5
+
+# Guild settings read-through cache (shared by the sync and asyncio guild repositories).
+GUILD_SETTINGS_CACHE_TTL_SECONDS = 300.0
+GUILD_SETTINGS_CACHE_MAX_ENTRIES = 10_000
+# Player identity/preferences cache (shared by the sync and asyncio player repositories).
+PLAYER_CACHE_TTL_SECONDS = 600.0
+PLAYER_CACHE_MAX_ENTRIES = 50_000
 
 HISTORY_PAGE_SIZE = 8
 CATALOG_GAMES_PER_PAGE = 3
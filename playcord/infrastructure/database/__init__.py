@@ -6,6 +6,11 @@ from playcord.infrastructure.database.implementation.core.migrations import (
 )
 from playcord.infrastructure.database.implementation.repositories import (
     AnalyticsRepository,
+    AsyncAnalyticsRepository,
+    AsyncGuildRepository,
+    AsyncMatchRepository,
+    AsyncPlayerRepository,
+    AsyncReplayRepository,
     GameRepository,
     GuildRepository,
     MaintenanceRepository,
@@ -17,6 +22,11 @@ from playcord.infrastructure.database.implementation.repositories import (
 
 __all__ = [
     "AnalyticsRepository",
+    "AsyncAnalyticsRepository",
+    "AsyncGuildRepository",
+    "AsyncMatchRepository",
+    "AsyncPlayerRepository",
+    "AsyncReplayRepository",
     "GameRepository",
     "GuildRepository",
     "MaintenanceRepository",
@@ -0,0 +1,104 @@
+"""Small in-process read-through caches shared by the sync and asyncio repositories."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters for one :class:`TTLCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+
+class TTLCache[K: Hashable, V]:
+    """Thread-safe mapping whose entries expire ``ttl`` seconds after being stored.
+
+    ``None`` is a valid cached value (e.g. "no row"), so :meth:`lookup` reports
+    presence separately from the value. Past ``max_entries`` the least recently
+    stored entry is evicted.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        *,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = float(ttl)
+        self.max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: K) -> tuple[bool, V | None]:
+        """Return ``(True, value)`` for a live entry, else ``(False, None)``."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return False, None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._stats.expired += 1
+                self._stats.misses += 1
+                return False, None
+            self._stats.hits += 1
+            return True, value
+
+    def put(self, key: K, value: V) -> None:
+        expires_at = self._clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            snapshot = asdict(self._stats)
+            snapshot["size"] = len(self._entries)
+        lookups = snapshot["hits"] + snapshot["misses"]
+        snapshot["hit_ratio"] = round(snapshot["hits"] / lookups, 3) if lookups else 0.0
+        return snapshot
+
+
+def format_cache_stats(name: str, snapshot: dict[str, Any]) -> str:
+    """One-line summary for logs and the owner analytics dump."""
+    return (
+        f"{name} cache: {snapshot['size']} entries, "
+        f"hits {snapshot['hits']}, misses {snapshot['misses']} "
+        f"(hit ratio {snapshot['hit_ratio']:.1%}), "
+        f"expired {snapshot['expired']}, invalidated {snapshot['invalidations']}, "
+        f"evicted {snapshot['evictions']}"
+    )
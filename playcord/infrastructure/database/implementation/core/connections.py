@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from playcord.infrastructure.database.implementation.database import Database
+from playcord.infrastructure.database.implementation.core.invalidation import (
+    invalidation_bus,
+)
+from playcord.infrastructure.database.implementation.core.profiling import profiler
+from playcord.infrastructure.database.implementation.database import (
+    AsyncDatabase,
+    Database,
+)
 from playcord.infrastructure.logging import get_logger
 
 if TYPE_CHECKING:
@@ -16,15 +23,21 @@ log = get_logger("infrastructure.db.pool")
 
 @dataclass(slots=True)
 class PoolManager:
-    """Owns the database connection pool for the application."""
+    """Owns the database connection pools (sync and asyncio) for the application."""
 
     settings: DatabaseSettings
     database: Database | None = None
+    async_database: AsyncDatabase | None = None
 
     def connect(self) -> Database:
         if self.database is not None:
             return self.database
 
+        profiler.configure(
+            enabled=self.settings.profile_queries or self.settings.slow_query_ms > 0,
+            slow_query_ms=self.settings.slow_query_ms,
+        )
+        invalidation_bus.configure(enabled=self.settings.invalidation_bus)
         self.database = Database(
             host=self.settings.host,
             port=self.settings.port,
@@ -34,15 +47,78 @@ class PoolManager:
             pool_size=self.settings.pool_size,
             max_overflow=self.settings.max_overflow,
             pool_timeout=self.settings.pool_timeout,
+            min_size=self.settings.min_size,
+            max_idle=self.settings.max_idle,
+            replica_host=self.settings.replica_host,
+            replica_port=self.settings.replica_port,
+            replica_max_lag_seconds=self.settings.replica_max_lag_seconds,
         )
         log.info(
-            "Database pool initialized for %s:%s/%s",
+            "Database pool initialized for %s:%s/%s (min=%s, max=%s, max_idle=%ss)",
             self.settings.host,
             self.settings.port,
             self.settings.database,
+            self.database.min_size,
+            self.database.max_size,
+            self.database.max_idle,
         )
         return self.database
 
+    def connect_async(self) -> AsyncDatabase:
+        """Create the asyncio pool; it is opened later via :meth:`open_async`."""
+        if self.async_database is not None:
+            return self.async_database
+
+        self.async_database = AsyncDatabase(
+            host=self.settings.host,
+            port=self.settings.port,
+            user=self.settings.user,
+            password=self.settings.password,
+            database=self.settings.database,
+            pool_size=self.settings.pool_size,
+            max_overflow=self.settings.max_overflow,
+            pool_timeout=self.settings.pool_timeout,
+            min_size=self.settings.min_size,
+            max_idle=self.settings.max_idle,
+            replica_host=self.settings.replica_host,
+            replica_port=self.settings.replica_port,
+            replica_max_lag_seconds=self.settings.replica_max_lag_seconds,
+        )
+        return self.async_database
+
+    async def open_async(self) -> None:
+        async_database = self.connect_async()
+        await async_database.open()
+        log.info(
+            "Async database pool opened for %s:%s/%s",
+            self.settings.host,
+            self.settings.port,
+            self.settings.database,
+        )
+        await invalidation_bus.start(async_database)
+
+    async def close_async(self) -> None:
+        if self.async_database is None:
+            return
+        await invalidation_bus.stop()
+        await self.async_database.disconnect()
+        self.async_database = None
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-pool telemetry keyed by ``"sync"`` / ``"async"`` (open pools only).
+
+        Configured read replicas add ``"sync replica"`` / ``"async replica"``.
+        """
+        stats: dict[str, dict[str, Any]] = {}
+        for name, database in (("sync", self.database), ("async", self.async_database)):
+            if database is None:
+                continue
+            stats[name] = database.stats()
+            replica = database.replica_stats()
+            if replica is not None:
+                stats[f"{name} replica"] = replica
+        return stats
+
     def close(self) -> None:
         if self.database is None:
             return
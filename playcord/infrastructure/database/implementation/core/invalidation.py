@@ -0,0 +1,263 @@
+"""
+Cross-process cache invalidation over PostgreSQL LISTEN/NOTIFY.
+
+A process that changes cached data drops its own entries right away and then
+calls :meth:`InvalidationBus.publish`. Every process keeps one dedicated
+connection LISTENing on :data:`INVALIDATION_CHANNEL` and runs the handlers
+subscribed to the notified topic; a process ignores its own notifications.
+
+Publishing never blocks the caller. Payloads are queued (deduplicated) and a
+background task sends them on the asyncio pool; anything published before
+:meth:`InvalidationBus.start` waits in the queue. Notifications sent while the
+listener is disconnected are lost, so each (re)connect flushes every topic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import uuid
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from psycopg import AsyncConnection
+
+from playcord.infrastructure.constants import (
+    INVALIDATION_CHANNEL,
+    INVALIDATION_MAX_PENDING,
+)
+from playcord.infrastructure.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from playcord.infrastructure.database.implementation.database import (
+        AsyncDatabase,
+    )
+
+logger = get_logger("database.invalidation")
+
+_RECONNECT_MIN_SECONDS = 1.0
+_RECONNECT_MAX_SECONDS = 30.0
+_SEND_RETRY_SECONDS = 1.0
+
+# One round trip for a whole batch; NOTIFY is delivered when it commits.
+_NOTIFY_SQL = "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload;"
+
+
+class InvalidationTopic(StrEnum):
+    """What changed; the key (if any) says which entry."""
+
+    # Replay frame caches of one match (key: match id).
+    MATCH = "match"
+    # One game registry entry (key: game name).
+    GAME = "game"
+    # One guild's settings (key: guild id).
+    GUILD_SETTINGS = "guild_settings"
+
+
+# Called with the notified key, or ``None`` to drop everything for the topic.
+type InvalidationHandler = Callable[[str | None], None]
+
+
+class InvalidationBus:
+    """Process-wide publisher/subscriber; disabled until :meth:`configure`."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.origin = uuid.uuid4().hex[:12]
+        self.published = 0
+        self.received = 0
+        self.reconnects = 0
+        self._handlers: dict[InvalidationTopic, list[InvalidationHandler]] = {}
+        # Insertion-ordered set of payloads not yet sent.
+        self._pending: dict[str, None] = {}
+        self._lock = threading.Lock()
+        self._database: AsyncDatabase | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def configure(self, *, enabled: bool) -> None:
+        self.enabled = enabled
+        if not enabled:
+            with self._lock:
+                self._pending.clear()
+
+    def subscribe(self, topic: InvalidationTopic, handler: InvalidationHandler) -> None:
+        self._handlers.setdefault(topic, []).append(handler)
+
+    def publish(self, topic: InvalidationTopic, key: Any = None) -> None:
+        """Tell the other processes to drop ``key`` (or all entries) of ``topic``."""
+        if not self.enabled:
+            return
+        payload = self._payload(topic, key)
+        with self._lock:
+            self._pending[payload] = None
+            if len(self._pending) > INVALIDATION_MAX_PENDING:
+                self._collapse_pending()
+        self._wake()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "published": self.published,
+            "received": self.received,
+            "reconnects": self.reconnects,
+            "pending": pending,
+            "listening": bool(self._tasks),
+        }
+
+    async def start(self, database: AsyncDatabase) -> None:
+        """Start listening and sending on the running loop (no-op if disabled)."""
+        if not self.enabled or self._tasks:
+            return
+        loop = asyncio.get_running_loop()
+        self._database = database
+        self._wakeup = asyncio.Event()
+        self._loop = loop
+        self._tasks = [
+            loop.create_task(self._listen(database), name="invalidation-listen"),
+            loop.create_task(
+                self._send_loop(self._wakeup),
+                name="invalidation-send",
+            ),
+        ]
+        if self._pending:
+            self._wakeup.set()
+
+    async def stop(self) -> None:
+        """Stop both tasks, sending whatever is still queued first."""
+        tasks, self._tasks = self._tasks, []
+        self._loop = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._database is not None:
+            await self._send_pending()
+            self._database = None
+
+    def _payload(self, topic: InvalidationTopic, key: Any) -> str:
+        return json.dumps(
+            {"o": self.origin, "t": str(topic), "k": None if key is None else str(key)},
+            separators=(",", ":"),
+        )
+
+    def _collapse_pending(self) -> None:
+        # Too far behind to send per-key: one flush-all per topic is equivalent.
+        topics = {json.loads(payload)["t"] for payload in self._pending}
+        self._pending = dict.fromkeys(
+            self._payload(InvalidationTopic(topic), None) for topic in topics
+        )
+
+    def _wake(self) -> None:
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wakeup.set()
+        else:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    async def _send_pending(self) -> bool:
+        with self._lock:
+            payloads = list(self._pending)
+            self._pending.clear()
+        if not payloads or self._database is None:
+            return True
+        try:
+            await self._database.execute_query(
+                _NOTIFY_SQL,
+                (INVALIDATION_CHANNEL, payloads),
+            )
+        except Exception as e:
+            logger.warning("Could not publish %d invalidation(s): %s", len(payloads), e)
+            with self._lock:
+                # Keep them ahead of anything published meanwhile.
+                self._pending = dict.fromkeys(payloads) | self._pending
+            return False
+        self.published += len(payloads)
+        return True
+
+    async def _send_loop(self, wakeup: asyncio.Event) -> None:
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            if not await self._send_pending():
+                await asyncio.sleep(_SEND_RETRY_SECONDS)
+                wakeup.set()
+
+    async def _listen(self, database: AsyncDatabase) -> None:
+        delay = _RECONNECT_MIN_SECONDS
+        connected_before = False
+        while True:
+            try:
+                conn = await AsyncConnection.connect(
+                    database.conninfo,
+                    autocommit=True,
+                )
+                async with conn:
+                    await conn.execute(f"LISTEN {INVALIDATION_CHANNEL};")
+                    if connected_before:
+                        self.reconnects += 1
+                    connected_before = True
+                    delay = _RECONNECT_MIN_SECONDS
+                    # Anything may have changed while nobody was listening.
+                    self._dispatch_all()
+                    logger.info("Listening for cache invalidations")
+                    async for notify in conn.notifies():
+                        self._dispatch(notify.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Invalidation listener disconnected (%s); retrying in %.0fs",
+                    e,
+                    delay,
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RECONNECT_MAX_SECONDS)
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            if message["o"] == self.origin:
+                return
+            topic = InvalidationTopic(message["t"])
+        except (ValueError, KeyError, TypeError):
+            # Unknown topics come from newer processes during a rolling deploy.
+            logger.debug("Ignoring invalidation payload %r", payload)
+            return
+        self.received += 1
+        self._run_handlers(topic, message.get("k"))
+
+    def _dispatch_all(self) -> None:
+        for topic in list(self._handlers):
+            self._run_handlers(topic, None)
+
+    def _run_handlers(self, topic: InvalidationTopic, key: str | None) -> None:
+        for handler in self._handlers.get(topic, ()):
+            try:
+                handler(key)
+            except Exception:
+                logger.exception(
+                    "Invalidation handler failed topic=%s key=%s", topic, key
+                )
+
+
+invalidation_bus = InvalidationBus()
+
+
+def format_invalidation_stats(snapshot: dict[str, Any]) -> str:
+    """One-line summary for the periodic stats log."""
+    return (
+        f"invalidation bus: {'listening' if snapshot['listening'] else 'stopped'}, "
+        f"published {snapshot['published']}, received {snapshot['received']}, "
+        f"pending {snapshot['pending']}, reconnects {snapshot['reconnects']}"
+    )
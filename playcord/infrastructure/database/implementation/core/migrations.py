@@ -8,18 +8,53 @@ No backwards compatibility is maintained across baseline rebuilds.
 from __future__ import annotations
 
 import hashlib
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from playcord.infrastructure.database.implementation.core.exceptions import DatabaseError
 from playcord.infrastructure.logging import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from playcord.infrastructure.database.implementation.database import Database
 
 logger = get_logger("database.migrations")
 
+# Non-version keys in database_migrations: content hashes of startup work that
+# only needs redoing when its inputs change (see load_fingerprints()).
+SQL_ASSET_FINGERPRINT_PREFIX = "asset:"
+GAME_REGISTRY_FINGERPRINT = "registry:games"
+_FINGERPRINT_PREFIXES = (SQL_ASSET_FINGERPRINT_PREFIX, "registry:")
+
+_CREATE_MIGRATIONS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS database_migrations
+    (
+        version     TEXT PRIMARY KEY,
+        description TEXT,
+        applied_at  TIMESTAMPTZ DEFAULT NOW(),
+        sql_hash    VARCHAR(64)
+    );
+"""
+_UPSERT_MIGRATION_SQL = """
+    INSERT INTO database_migrations (version, description, sql_hash)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (version) DO UPDATE SET description = EXCLUDED.description,
+                                        sql_hash    = EXCLUDED.sql_hash,
+                                        applied_at  = NOW();
+"""
+_LOAD_FINGERPRINTS_SQL = """
+    SELECT version, sql_hash
+    FROM database_migrations
+    WHERE starts_with(version, %s) OR starts_with(version, %s);
+"""
+_FORGET_SQL_ASSET_FINGERPRINTS_SQL = (
+    "DELETE FROM database_migrations WHERE starts_with(version, %s);"
+)
+
 
 def _load_migration_sql(filename: str) -> str:
     """Load SQL content from a migration SQL file."""
@@ -37,6 +72,36 @@ MIGRATIONS: list[tuple[str, str, list[str]]] = [
         ),
         [_load_migration_sql("schema.sql")],
     ),
+    (
+        "4.1.0",
+        "Stored match player counts and keyset indexes for match history.",
+        [_load_migration_sql("history_keyset.sql")],
+    ),
+    (
+        "4.2.0",
+        "Per-user, per-game match totals rolled up as matches finish.",
+        [_load_migration_sql("user_game_stats.sql")],
+    ),
+    (
+        "4.3.0",
+        "Hourly analytics rollup with per-event-type latency aggregates.",
+        [_load_migration_sql("analytics_hourly.sql")],
+    ),
+    (
+        "4.4.0",
+        "Default-partition draining and drop-based retention for monthly partitions.",
+        [_load_migration_sql("partition_lifecycle.sql")],
+    ),
+    (
+        "4.5.0",
+        "Compressed replay archives for finished matches.",
+        [_load_migration_sql("replay_archives.sql")],
+    ),
+    (
+        "4.6.0",
+        "Settled event_id horizon so the analytics fold never skips late commits.",
+        [_load_migration_sql("analytics_rollup_horizon.sql")],
+    ),
 ]
 
 
@@ -45,50 +110,32 @@ def get_migration_hash(migration_sql: str) -> str:
     return hashlib.sha256(migration_sql.strip().encode("utf-8")).hexdigest()
 
 
-def apply_migrations(database) -> None:
-    """Apply all pending migrations in order, tracking by version."""
-    # Create database_migrations table if it doesn't exist
-    try:
-        with database.transaction() as cur:
-            cur.execute("""
-                        CREATE TABLE IF NOT EXISTS database_migrations
-                        (
-                            version     TEXT PRIMARY KEY,
-                            description TEXT,
-                            applied_at  TIMESTAMPTZ DEFAULT NOW(),
-                            sql_hash    VARCHAR(64)
-                        );
-                        """)
-    except Exception as e:
-        logger.exception("Failed to create database_migrations table: %s", e)
-        raise
+def apply_migrations(database) -> int:
+    """Apply all pending migrations in order, tracking by version.
 
-    applied_versions = set()
+    Returns how many were applied. Applying any also forgets the SQL asset
+    fingerprints, so functions and views are rebuilt against the new schema.
+    """
     try:
         with database.transaction() as cur:
+            cur.execute(_CREATE_MIGRATIONS_TABLE_SQL)
             cur.execute("SELECT version FROM database_migrations;")
-            for row in cur.fetchall():
-                version = None
-                if isinstance(row, dict):
-                    version = row.get("version")
-                else:
-                    try:
-                        version = row["version"]
-                    except (TypeError, KeyError):
-                        try:
-                            version = row[0]
-                        except (TypeError, IndexError, KeyError):
-                            version = None
-                if version is not None:
-                    applied_versions.add(str(version))
+            applied_versions = {str(row["version"]) for row in cur.fetchall()}
     except Exception as e:
-        logger.warning("Could not fetch applied migrations: %s", e)
-
-    for version, description, statements in MIGRATIONS:
-        if version in applied_versions:
-            logger.info("Skipping already-applied migration %s", version)
-            continue
+        logger.exception("Failed to read database_migrations: %s", e)
+        raise
 
+    pending = [m for m in MIGRATIONS if m[0] not in applied_versions]
+    if not pending:
+        logger.debug("Database schema up to date (%d migrations)", len(MIGRATIONS))
+        return 0
+    if len(pending) < len(MIGRATIONS):
+        logger.info(
+            "Skipping %d already-applied migration(s)",
+            len(MIGRATIONS) - len(pending),
+        )
+
+    for version, description, statements in pending:
         logger.warning("Applying database migration %s (%s)", version, description)
 
         try:
@@ -104,15 +151,7 @@ def apply_migrations(database) -> None:
                 migration_text = "\n".join(statements)
                 sql_hash = get_migration_hash(migration_text)
 
-                cur.execute(
-                    """
-                    INSERT INTO database_migrations (version, description, sql_hash)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT (version) DO UPDATE SET description = EXCLUDED.description,
-                                                        sql_hash    = EXCLUDED.sql_hash;
-                    """,
-                    (version, description, sql_hash),
-                )
+                cur.execute(_UPSERT_MIGRATION_SQL, (version, description, sql_hash))
             logger.info("Migration %s applied successfully", version)
 
         except Exception as e:
@@ -125,6 +164,34 @@ def apply_migrations(database) -> None:
             msg = f"Migration {version} failed: {e}"
             raise DatabaseError(msg) from e
 
+    with database.transaction() as cur:
+        cur.execute(_FORGET_SQL_ASSET_FINGERPRINTS_SQL, (SQL_ASSET_FINGERPRINT_PREFIX,))
+    return len(pending)
+
+
+def load_fingerprints(database: Database) -> dict[str, str]:
+    """Stored content hashes of SQL assets and the game registry, by key."""
+    rows = database.execute_query(
+        _LOAD_FINGERPRINTS_SQL,
+        _FINGERPRINT_PREFIXES,
+        fetchall=True,
+    )
+    return {row["version"]: row["sql_hash"] for row in rows or ()}
+
+
+def record_fingerprint(cur: Any, key: str, description: str, sql_hash: str) -> None:
+    """Store ``sql_hash`` under ``key`` (inside the caller's transaction)."""
+    cur.execute(_UPSERT_MIGRATION_SQL, (key, description, sql_hash))
+
+
+@contextmanager
+def _timed(timings: dict[str, float], step: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[step] = round((time.perf_counter() - started) * 1000, 4)
+
 
 @dataclass(slots=True)
 class MigrationRunner:
@@ -132,9 +199,9 @@ class MigrationRunner:
 
     analytics_retention_days: int = 30
 
-    def apply_migrations(self, database: Database) -> None:
+    def apply_migrations(self, database: Database) -> int:
         """Run versioned SQL migrations only (connection pool; no domain logic)."""
-        apply_migrations(database)
+        return apply_migrations(database)
 
     def run_startup(
         self,
@@ -142,15 +209,33 @@ class MigrationRunner:
         games: object,
         analytics: object,
         matches: object,
+        *,
+        timings: dict[str, float] | None = None,
     ) -> None:
         """
         After migrations: refresh SQL assets, sync game registry, analytics cleanup,
         and mark stale in-progress matches interrupted.
+
+        SQL assets and the game registry are skipped when their content hashes
+        match the ones stored by the previous startup. Milliseconds per step are
+        written to ``timings``.
         """
-        database.refresh_sql_assets()
-        games.sync_games_from_code()
-        analytics.cleanup_old_analytics(days=self.analytics_retention_days)
-        interrupted = matches.interrupt_stale_matches()
+        timings = {} if timings is None else timings
+        with _timed(timings, "fingerprints"):
+            known = load_fingerprints(database)
+        with _timed(timings, "sql assets"):
+            refreshed = database.refresh_sql_assets(known)
+        with _timed(timings, "game registry"):
+            synced = games.sync_games_from_code(known)
+        with _timed(timings, "analytics cleanup"):
+            analytics.cleanup_old_analytics(days=self.analytics_retention_days)
+        with _timed(timings, "stale matches"):
+            interrupted = matches.interrupt_stale_matches()
+        logger.info(
+            "Startup refreshed %d SQL asset(s); game registry %s",
+            refreshed,
+            "synced" if synced else "unchanged",
+        )
         if interrupted:
             logger.warning(
                 "Marked %s stale in-progress matches as interrupted during startup",
@@ -0,0 +1,183 @@
+"""
+Per-statement query profiling and the slow-query log.
+
+When enabled, the pool cursors (see ``database.py``) report every executed
+statement here. Statements are fingerprinted by the repository method that
+issued them plus their registry name (or normalized SQL text), and each
+fingerprint keeps a latency histogram, row and error counts, and the pool
+checkout wait of the connection it ran on. Disabled, the only cost per
+statement is one attribute check.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from playcord.infrastructure.database.implementation.core.statements import (
+    statement_name,
+)
+from playcord.infrastructure.database.implementation.core.telemetry import (
+    LatencyHistogram,
+)
+from playcord.infrastructure.logging import get_logger
+
+logger = get_logger("database.slow_query")
+
+# Longest normalized SQL kept as a fingerprint / shown in reports.
+_FINGERPRINT_MAX_CHARS = 160
+# How far up the stack to look for the repository method that issued a statement.
+_CALLER_MAX_DEPTH = 12
+_REPOSITORIES_DIR = str(Path(__file__).resolve().parent.parent / "repositories")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+# Checkout wait of the connection the current task/thread holds, charged to its
+# first statement.
+_checkout_wait_ms: ContextVar[float] = ContextVar("checkout_wait_ms", default=0.0)
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and replace literals so equivalent SQL shares a key."""
+    text = _WHITESPACE_RE.sub(" ", sql).strip().rstrip(";")
+    text = _STRING_LITERAL_RE.sub("?", text)
+    text = _NUMBER_LITERAL_RE.sub("?", text)
+    if len(text) > _FINGERPRINT_MAX_CHARS:
+        text = text[: _FINGERPRINT_MAX_CHARS - 3] + "..."
+    return text
+
+
+def _statement_label(query: Any) -> str:
+    if not isinstance(query, str):
+        return normalize_sql(str(query))
+    return statement_name(query) or normalize_sql(query)
+
+
+def _calling_repository_method() -> str:
+    # Skip this function, observe() and the cursor's execute().
+    frame = sys._getframe(3)
+    for _ in range(_CALLER_MAX_DEPTH):
+        if frame is None:
+            break
+        code = frame.f_code
+        if code.co_filename.startswith(_REPOSITORIES_DIR):
+            return f"{Path(code.co_filename).stem}.{code.co_qualname}"
+        frame = frame.f_back
+    return "?"
+
+
+@dataclass(slots=True)
+class StatementStats:
+    """Aggregates for one (repository method, statement) fingerprint."""
+
+    caller: str
+    statement: str
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    rows: int = 0
+    errors: int = 0
+    pool_wait_ms: float = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        latency = self.latency.snapshot()
+        return {
+            "caller": self.caller,
+            "statement": self.statement,
+            "calls": latency["count"],
+            "total_ms": round(self.latency.sum_ms, 3),
+            "avg_ms": latency["avg_ms"],
+            "max_ms": latency["max_ms"],
+            "buckets": latency["buckets"],
+            "rows": self.rows,
+            "errors": self.errors,
+            "pool_wait_ms": round(self.pool_wait_ms, 3),
+        }
+
+
+class QueryProfiler:
+    """Process-wide statement statistics shared by the sync and asyncio pools."""
+
+    def __init__(self, *, enabled: bool = False, slow_query_ms: float = 0.0) -> None:
+        self.enabled = enabled
+        self.slow_query_ms = float(slow_query_ms)
+        self._stats: dict[tuple[str, str], StatementStats] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, *, enabled: bool, slow_query_ms: float) -> None:
+        """Turn profiling on/off; ``slow_query_ms <= 0`` disables the slow-query log."""
+        self.slow_query_ms = float(slow_query_ms)
+        self.enabled = enabled
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def note_checkout(self, wait_ms: float) -> None:
+        """Remember the pool wait for the connection just checked out."""
+        _checkout_wait_ms.set(wait_ms)
+
+    def observe(
+        self,
+        query: Any,
+        elapsed_ms: float,
+        rows: int,
+        *,
+        failed: bool = False,
+    ) -> None:
+        """Record one executed statement (called from the cursor)."""
+        caller = _calling_repository_method()
+        statement = _statement_label(query)
+        wait_ms = _checkout_wait_ms.get()
+        if wait_ms:
+            _checkout_wait_ms.set(0.0)
+        key = (caller, statement)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = StatementStats(caller, statement)
+            stats.latency.observe(elapsed_ms)
+            stats.rows += max(0, rows)
+            stats.errors += int(failed)
+            stats.pool_wait_ms += wait_ms
+        if 0 < self.slow_query_ms <= elapsed_ms:
+            logger.warning(
+                "Slow query %.1f ms (rows=%s, pool wait %.1f ms%s) in %s: %s",
+                elapsed_ms,
+                rows,
+                wait_ms,
+                ", failed" if failed else "",
+                caller,
+                statement,
+            )
+
+    def top(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Snapshots of the ``limit`` fingerprints with the most total time."""
+        with self._lock:
+            ranked = sorted(
+                self._stats.values(),
+                key=lambda stats: stats.latency.sum_ms,
+                reverse=True,
+            )[: max(1, limit)]
+            return [stats.snapshot() for stats in ranked]
+
+
+profiler = QueryProfiler()
+
+
+def format_statement_stats(snapshot: dict[str, Any]) -> str:
+    """Two-line summary (totals, then the statement) for the owner top-queries dump."""
+    return (
+        f"`{snapshot['caller']}` {snapshot['total_ms']:.0f} ms total, "
+        f"{snapshot['calls']} call(s), avg {snapshot['avg_ms']} ms / "
+        f"max {snapshot['max_ms']} ms, rows {snapshot['rows']}, "
+        f"errors {snapshot['errors']}, pool wait {snapshot['pool_wait_ms']:.0f} ms\n"
+        f"`{snapshot['statement']}`"
+    )
@@ -0,0 +1,129 @@
+"""
+Read-replica routing for read-only repository queries.
+
+:meth:`Database.execute_read` (and its asyncio twin) asks a
+:class:`ReplicaRouter` whether a read may go to the replica. The answer depends
+on the caller's :class:`ReadConsistency`, the replica's last measured replay lag
+(probed at most once per ``lag_check_interval`` on a replica connection) and
+whether the replica recently failed. Anything the replica cannot serve falls
+back to the primary.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from playcord.infrastructure.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = get_logger("database.replica")
+
+# How often the replay lag is re-measured, and how long a failed replica is skipped.
+_LAG_CHECK_INTERVAL_SECONDS = 1.0
+_FAILURE_COOLDOWN_SECONDS = 30.0
+# Replica checkouts give up quickly: the primary can always serve the read instead.
+REPLICA_CHECKOUT_TIMEOUT_SECONDS = 2.0
+
+# Seconds the replica is behind the primary. A server that is not in recovery
+# (e.g. a second standalone instance in development) reports 0; a standby that
+# has not replayed anything yet reports infinity, so bounded reads skip it.
+REPLICA_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0.0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0.0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM NOW() - pg_last_xact_replay_timestamp())::DOUBLE PRECISION,
+            'Infinity'::DOUBLE PRECISION
+        )
+    END AS lag_seconds;
+"""
+
+
+class ReadConsistency(StrEnum):
+    """How stale a routed read is allowed to be."""
+
+    # Always the primary (read-your-writes).
+    PRIMARY = "primary"
+    # The replica while its lag is within ``max_lag_seconds``, else the primary.
+    BOUNDED = "bounded"
+    # The replica whenever it is reachable, however far behind it is.
+    RELAXED = "relaxed"
+
+
+@dataclass(slots=True)
+class ReplicaRouter:
+    """Routing decisions and counters for one replica pool."""
+
+    max_lag_seconds: float
+    lag_check_interval: float = _LAG_CHECK_INTERVAL_SECONDS
+    failure_cooldown: float = _FAILURE_COOLDOWN_SECONDS
+    clock: Callable[[], float] = time.monotonic
+    lag_seconds: float | None = None
+    replica_reads: int = 0
+    stale_fallbacks: int = 0
+    error_fallbacks: int = 0
+    _lag_checked_at: float | None = None
+    _down_until: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def wants_replica(self, consistency: ReadConsistency) -> bool:
+        """True if this read should try the replica at all."""
+        if consistency is ReadConsistency.PRIMARY:
+            return False
+        return self.clock() >= self._down_until
+
+    def needs_lag_check(self, consistency: ReadConsistency) -> bool:
+        if consistency is not ReadConsistency.BOUNDED:
+            return False
+        checked_at = self._lag_checked_at
+        return (
+            checked_at is None or self.clock() - checked_at >= self.lag_check_interval
+        )
+
+    def record_lag(self, lag_seconds: float | None) -> None:
+        with self._lock:
+            self.lag_seconds = None if lag_seconds is None else float(lag_seconds)
+            self._lag_checked_at = self.clock()
+
+    def fresh_enough(self, consistency: ReadConsistency) -> bool:
+        """True if the last measured lag satisfies ``consistency``."""
+        if consistency is ReadConsistency.RELAXED:
+            return True
+        lag = self.lag_seconds
+        return lag is not None and lag <= self.max_lag_seconds
+
+    def record_replica_read(self) -> None:
+        with self._lock:
+            self.replica_reads += 1
+
+    def record_stale_fallback(self) -> None:
+        with self._lock:
+            self.stale_fallbacks += 1
+
+    def mark_down(self, exc: BaseException) -> None:
+        """Send reads to the primary for ``failure_cooldown`` seconds."""
+        with self._lock:
+            self.error_fallbacks += 1
+            self._down_until = self.clock() + self.failure_cooldown
+            self._lag_checked_at = None
+        logger.warning(
+            "Read replica unavailable (%s); reading from the primary for %.0fs",
+            exc,
+            self.failure_cooldown,
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "replica_reads": self.replica_reads,
+                "stale_fallbacks": self.stale_fallbacks,
+                "error_fallbacks": self.error_fallbacks,
+                "lag_seconds": self.lag_seconds,
+                "available": self.clock() >= self._down_until,
+            }
@@ -0,0 +1,54 @@
+"""
+Registry of hot SQL statements that are server-side prepared on every connection.
+
+Repositories wrap their frequently executed SQL constants with
+:func:`register_statement`. The pool's cursor classes (see ``database.py``) look
+each executed query up here and pass ``prepare=True`` to psycopg for registered
+statements, so each pooled connection parses and plans them once and then only
+sends Bind/Execute.
+Unregistered SQL keeps psycopg's default behaviour (prepare after
+``prepare_threshold`` executions on the same connection).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Upper bound on prepared statements kept per connection (psycopg evicts LRU past it).
+PREPARED_MAX = 256
+
+_STATEMENTS: dict[str, str] = {}
+_NAMES: dict[str, str] = {}
+
+
+def register_statement(name: str, sql: str) -> str:
+    """Declare ``sql`` as a hot statement and return it unchanged."""
+    existing = _STATEMENTS.get(name)
+    if existing is not None and existing != sql:
+        msg = f"Statement {name!r} is already registered with different SQL"
+        raise ValueError(msg)
+    _STATEMENTS[name] = sql
+    _NAMES[sql] = name
+    return sql
+
+
+def is_registered(sql: Any) -> bool:
+    return isinstance(sql, str) and sql in _NAMES
+
+
+def statement_name(sql: str) -> str | None:
+    return _NAMES.get(sql)
+
+
+def registered_statements() -> dict[str, str]:
+    """Snapshot of ``name -> sql`` for every registered statement."""
+    return dict(_STATEMENTS)
+
+
+def configure_connection(conn: Any) -> None:
+    """Pool ``configure`` hook: room for every hot statement in the LRU."""
+    conn.prepared_max = max(PREPARED_MAX, len(_STATEMENTS) * 2)
+
+
+async def configure_async_connection(conn: Any) -> None:
+    configure_connection(conn)
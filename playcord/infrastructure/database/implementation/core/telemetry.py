@@ -0,0 +1,112 @@
+"""Lightweight counters and latency histograms for the connection pools."""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds (ms) of the checkout wait-time buckets; the last bucket is open-ended.
+WAIT_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Fixed-bucket histogram; ``counts[i]`` holds samples ``<= bounds[i]``."""
+
+    bounds: tuple[float, ...] = WAIT_BUCKETS_MS
+    counts: list[int] = field(default_factory=list)
+    total: int = 0
+    sum_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect_left(self.bounds, value_ms)] += 1
+        self.total += 1
+        self.sum_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        labels = [f"<={bound:g}ms" for bound in self.bounds]
+        labels.append(f">{self.bounds[-1]:g}ms")
+        return {
+            "count": self.total,
+            "avg_ms": round(self.sum_ms / self.total, 3) if self.total else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+@dataclass(slots=True)
+class PoolTelemetry:
+    """Checkout wait times and failures observed by one :class:`Database` pool."""
+
+    wait: LatencyHistogram = field(default_factory=LatencyHistogram)
+    checkout_errors: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_checkout(self, wait_ms: float) -> None:
+        with self._lock:
+            self.wait.observe(wait_ms)
+
+    def record_checkout_error(self) -> None:
+        with self._lock:
+            self.checkout_errors += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "checkout_wait": self.wait.snapshot(),
+                "checkout_errors": self.checkout_errors,
+            }
+
+
+def pool_snapshot(pool: Any, telemetry: PoolTelemetry) -> dict[str, Any]:
+    """Merge psycopg_pool's own gauges with our checkout telemetry."""
+    stats = pool.get_stats() if pool is not None else {}
+    size = int(stats.get("pool_size", 0))
+    available = int(stats.get("pool_available", 0))
+    return {
+        "min_size": stats.get("pool_min", 0),
+        "max_size": stats.get("pool_max", 0),
+        "size": size,
+        "in_use": max(0, size - available),
+        "available": available,
+        "waiting": stats.get("requests_waiting", 0),
+        "requests": stats.get("requests_num", 0),
+        "requests_queued": stats.get("requests_queued", 0),
+        "connections_lost": stats.get("connections_lost", 0),
+        "connection_errors": stats.get("connections_errors", 0),
+        **telemetry.snapshot(),
+    }
+
+
+def format_pool_snapshot(name: str, snapshot: dict[str, Any]) -> str:
+    """One-line summary for logs and the owner analytics dump."""
+    wait = snapshot["checkout_wait"]
+    busy_buckets = ", ".join(
+        f"{label}: {count}" for label, count in wait["buckets"].items() if count
+    )
+    line = (
+        f"{name} pool: in use {snapshot['in_use']}/{snapshot['size']} "
+        f"(min {snapshot['min_size']}, max {snapshot['max_size']}), "
+        f"waiting {snapshot['waiting']}, checkout errors {snapshot['checkout_errors']}, "
+        f"wait avg {wait['avg_ms']} ms / max {wait['max_ms']} ms"
+        + (f" [{busy_buckets}]" if busy_buckets else "")
+    )
+    routing = snapshot.get("routing")
+    if routing:
+        lag = routing["lag_seconds"]
+        line += (
+            f"; reads {routing['replica_reads']}, "
+            f"stale fallbacks {routing['stale_fallbacks']}, "
+            f"error fallbacks {routing['error_fallbacks']}, "
+            f"lag {'?' if lag is None else f'{lag:.1f}'} s"
+            + ("" if routing["available"] else " (cooling down)")
+        )
+    return line
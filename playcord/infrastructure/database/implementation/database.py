@@ -6,12 +6,15 @@ Domain operations live in :mod:`playcord.infrastructure.database.implementation.
 
 from __future__ import annotations
 
-from contextlib import contextmanager
+import time
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
+from typing import Any
 
 try:
+    from psycopg import AsyncCursor, Cursor, OperationalError
     from psycopg.rows import dict_row
-    from psycopg_pool import ConnectionPool
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
 except ImportError as err:
     msg = "psycopg3 is required. Install with: pip install 'psycopg[binary,pool]'"
     raise ImportError(
@@ -21,10 +24,84 @@ except ImportError as err:
 from playcord.infrastructure.database.implementation.core.exceptions import (
     DatabaseConnectionError,
 )
+from playcord.infrastructure.database.implementation.core.migrations import (
+    SQL_ASSET_FINGERPRINT_PREFIX,
+    get_migration_hash,
+    record_fingerprint,
+)
+from playcord.infrastructure.database.implementation.core.profiling import profiler
+from playcord.infrastructure.database.implementation.core.replica import (
+    REPLICA_CHECKOUT_TIMEOUT_SECONDS,
+    REPLICA_LAG_SQL,
+    ReadConsistency,
+    ReplicaRouter,
+)
+from playcord.infrastructure.database.implementation.core.statements import (
+    configure_async_connection,
+    configure_connection,
+    is_registered,
+)
+from playcord.infrastructure.database.implementation.core.telemetry import (
+    PoolTelemetry,
+    pool_snapshot,
+)
 from playcord.infrastructure.logging import get_logger
 
 logger = get_logger("database")
 
+# Refreshed in this order at startup (views depend on functions).
+SQL_ASSETS = ("functions.sql", "views.sql")
+
+# Replica failures that send a read back to the primary (connection loss, pool
+# timeouts, recovery conflicts) rather than up to the caller.
+_REPLICA_FALLBACK_ERRORS = (OperationalError, DatabaseConnectionError)
+
+
+def _conninfo(host: str, port: int, database: str, user: str, password: str) -> str:
+    return f"host={host} port={port} dbname={database} user={user} password={password}"
+
+
+class PreparedCursor(Cursor):
+    """Cursor that server-side prepares hot statements and feeds the query profiler."""
+
+    def execute(self, query, params=None, *, prepare=None, binary=None):
+        if prepare is None and is_registered(query):
+            prepare = True
+        if not profiler.enabled:
+            return super().execute(query, params, prepare=prepare, binary=binary)
+        started = time.perf_counter()
+        try:
+            result = super().execute(query, params, prepare=prepare, binary=binary)
+        except Exception:
+            profiler.observe(
+                query, (time.perf_counter() - started) * 1000, 0, failed=True
+            )
+            raise
+        profiler.observe(query, (time.perf_counter() - started) * 1000, self.rowcount)
+        return result
+
+
+class AsyncPreparedCursor(AsyncCursor):
+    """Async cursor that server-side prepares hot statements and feeds the query profiler."""
+
+    async def execute(self, query, params=None, *, prepare=None, binary=None):
+        if prepare is None and is_registered(query):
+            prepare = True
+        if not profiler.enabled:
+            return await super().execute(query, params, prepare=prepare, binary=binary)
+        started = time.perf_counter()
+        try:
+            result = await super().execute(
+                query, params, prepare=prepare, binary=binary
+            )
+        except Exception:
+            profiler.observe(
+                query, (time.perf_counter() - started) * 1000, 0, failed=True
+            )
+            raise
+        profiler.observe(query, (time.perf_counter() - started) * 1000, self.rowcount)
+        return result
+
 
 class Database:
     """
@@ -42,6 +119,11 @@ class Database:
         pool_size: int = 10,
         max_overflow: int = 20,
         pool_timeout: int = 30,
+        min_size: int = 2,
+        max_idle: int = 300,
+        replica_host: str = "",
+        replica_port: int = 0,
+        replica_max_lag_seconds: float = 5.0,
     ) -> None:
         self.host = host
         self.port = port
@@ -51,57 +133,145 @@ class Database:
         self.pool_size = pool_size
         self.max_overflow = max_overflow
         self.pool_timeout = pool_timeout
+        # Held open at all times; bursts up to pool_size + max_overflow and
+        # connections above min_size are closed after max_idle seconds unused.
+        self.min_size = max(0, min(min_size, pool_size))
+        self.max_size = max(1, pool_size + max(0, max_overflow))
+        self.max_idle = max_idle
+        self.telemetry = PoolTelemetry()
 
-        self.conninfo = (
-            f"host={host} port={port} dbname={database} user={user} password={password}"
-        )
+        self.conninfo = _conninfo(host, port, database, user, password)
+        # Optional read replica (same credentials) for execute_read().
+        self.replica: ReplicaRouter | None = None
+        self.replica_conninfo: str | None = None
+        self.replica_telemetry = PoolTelemetry()
+        if replica_host:
+            self.replica = ReplicaRouter(max_lag_seconds=replica_max_lag_seconds)
+            self.replica_conninfo = _conninfo(
+                replica_host,
+                replica_port or port,
+                database,
+                user,
+                password,
+            )
 
         self.pool: ConnectionPool | None = None
+        self.replica_pool: ConnectionPool | None = None
         self.connect()
 
+    def _new_pool(self, conninfo: str, timeout: float) -> ConnectionPool:
+        return ConnectionPool(
+            conninfo=conninfo,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            timeout=timeout,
+            max_idle=self.max_idle,
+            kwargs={"row_factory": dict_row, "cursor_factory": PreparedCursor},
+            configure=configure_connection,
+        )
+
     def connect(self) -> None:
-        """Initialize connection pool."""
+        """Initialize connection pool (and the replica pool, if configured)."""
         try:
-            self.pool = ConnectionPool(
-                conninfo=self.conninfo,
-                min_size=2,
-                max_size=self.pool_size,
-                timeout=self.pool_timeout,
-                kwargs={"row_factory": dict_row},
-            )
+            self.pool = self._new_pool(self.conninfo, self.pool_timeout)
             logger.info("Connected to PostgreSQL database: %s", self.database)
         except Exception as e:
             logger.exception("Error connecting to PostgreSQL: %s", e)
             self.pool = None
             msg = f"Could not connect to database: {e}"
             raise DatabaseConnectionError(msg) from e
+        if self.replica_conninfo:
+            try:
+                self.replica_pool = self._new_pool(
+                    self.replica_conninfo,
+                    REPLICA_CHECKOUT_TIMEOUT_SECONDS,
+                )
+            except Exception as e:
+                # Reads keep working against the primary.
+                logger.exception("Error creating read replica pool: %s", e)
+                self.replica_pool = None
 
     def disconnect(self) -> None:
         """Close connection pool."""
+        if self.replica_pool:
+            self.replica_pool.close()
+            self.replica_pool = None
         if self.pool:
             self.pool.close()
             logger.info("Database connection pool closed.")
 
-    def get_connection(self):
-        """Get a connection from the pool."""
-        if not self.pool:
+    @contextmanager
+    def _checkout(self, pool: ConnectionPool | None, telemetry: PoolTelemetry):
+        if not pool:
             msg = "Connection pool not initialized"
             raise DatabaseConnectionError(msg)
-        return self.pool.connection()
+        started = time.perf_counter()
+        checked_out = False
+        try:
+            with pool.connection() as conn:
+                checked_out = True
+                wait_ms = (time.perf_counter() - started) * 1000
+                telemetry.record_checkout(wait_ms)
+                if profiler.enabled:
+                    profiler.note_checkout(wait_ms)
+                yield conn
+        except Exception:
+            if not checked_out:
+                telemetry.record_checkout_error()
+            raise
+
+    @contextmanager
+    def get_connection(self):
+        """Get a connection from the pool, recording checkout wait and failures."""
+        with self._checkout(self.pool, self.telemetry) as conn:
+            yield conn
+
+    def stats(self) -> dict[str, Any]:
+        """Pool gauges (size, in use, waiting) plus checkout wait histogram."""
+        return pool_snapshot(self.pool, self.telemetry)
+
+    def replica_stats(self) -> dict[str, Any] | None:
+        """Replica pool gauges plus routing counters (None without a replica)."""
+        if self.replica is None:
+            return None
+        snapshot = pool_snapshot(self.replica_pool, self.replica_telemetry)
+        snapshot["routing"] = self.replica.snapshot()
+        return snapshot
+
+    def _load_sql_asset(
+        self,
+        relative_path: str,
+        known: dict[str, str] | None = None,
+    ) -> bool:
+        """Execute an idempotent SQL asset file (functions/views) shipped with PlayCord.
 
-    def _load_sql_asset(self, relative_path: str) -> None:
-        """Execute an idempotent SQL asset file (functions/views) shipped with PlayCord."""
+        Skipped (returns False) when ``known`` holds the file's current hash.
+        """
         sql_dir = Path(__file__).resolve().parent / "sql"
-        sql_path = sql_dir / Path(relative_path).name
-        with sql_path.open("r", encoding="utf-8") as fh:
+        name = Path(relative_path).name
+        with (sql_dir / name).open("r", encoding="utf-8") as fh:
             sql_text = fh.read()
+        key = f"{SQL_ASSET_FINGERPRINT_PREFIX}{name}"
+        sql_hash = get_migration_hash(sql_text)
+        if known is not None and known.get(key) == sql_hash:
+            return False
         with self.transaction() as cur:
             cur.execute(sql_text)
+            record_fingerprint(cur, key, f"SQL asset {name}", sql_hash)
+        return True
+
+    def refresh_sql_assets(self, known: dict[str, str] | None = None) -> int:
+        """Refresh SQL functions and views from the tracked asset files.
 
-    def refresh_sql_assets(self) -> None:
-        """Refresh SQL functions and views from the tracked asset files."""
-        self._load_sql_asset("functions.sql")
-        self._load_sql_asset("views.sql")
+        With ``known`` fingerprints (see ``load_fingerprints``) unchanged files
+        are skipped; once one file runs, every later one runs too, since
+        ``functions.sql`` drops functions with CASCADE. Returns files executed.
+        """
+        refreshed = 0
+        for name in SQL_ASSETS:
+            if self._load_sql_asset(name, None if refreshed else known):
+                refreshed += 1
+        return refreshed
 
     @contextmanager
     def transaction(self):
@@ -161,3 +331,292 @@ class Database:
                     e,
                 )
                 raise
+
+    def execute_read(
+        self,
+        query: str,
+        params: tuple | dict | None = None,
+        *,
+        fetchone: bool = False,
+        consistency: ReadConsistency = ReadConsistency.BOUNDED,
+    ):
+        """
+        Run a read-only query on the replica when ``consistency`` allows it.
+
+        Returns one row with ``fetchone``, otherwise all rows. Falls back to the
+        primary when no replica is configured, when a ``BOUNDED`` read finds the
+        replica lagging by more than ``replica_max_lag_seconds``, or when the
+        replica cannot be reached (it is then skipped for a cooldown).
+        """
+        router = self.replica
+        if router is not None and router.wants_replica(consistency):
+            try:
+                with (
+                    self._checkout(self.replica_pool, self.replica_telemetry) as conn,
+                    conn.cursor() as cur,
+                ):
+                    if router.needs_lag_check(consistency):
+                        cur.execute(REPLICA_LAG_SQL)
+                        router.record_lag(cur.fetchone()["lag_seconds"])
+                    if router.fresh_enough(consistency):
+                        cur.execute(query, params or ())
+                        rows = cur.fetchone() if fetchone else cur.fetchall()
+                        router.record_replica_read()
+                        return rows
+                router.record_stale_fallback()
+            except _REPLICA_FALLBACK_ERRORS as e:
+                router.mark_down(e)
+        return self.execute_query(
+            query,
+            params,
+            fetchone=fetchone,
+            fetchall=not fetchone,
+        )
+
+
+class AsyncDatabase:
+    """
+    Asyncio PostgreSQL connection pool for PlayCord.
+
+    Mirrors :class:`Database` for code running on the event loop: repositories
+    await :meth:`execute_query` and ``async with`` :meth:`transaction` instead of
+    hopping through a worker thread. The pool is created closed and must be
+    opened with :meth:`open` from inside the running loop.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        database: str,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+        pool_timeout: int = 30,
+        min_size: int = 2,
+        max_idle: int = 300,
+        replica_host: str = "",
+        replica_port: int = 0,
+        replica_max_lag_seconds: float = 5.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.database = database
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        # Held open at all times; bursts up to pool_size + max_overflow and
+        # connections above min_size are closed after max_idle seconds unused.
+        self.min_size = max(0, min(min_size, pool_size))
+        self.max_size = max(1, pool_size + max(0, max_overflow))
+        self.max_idle = max_idle
+        self.telemetry = PoolTelemetry()
+
+        self.conninfo = _conninfo(host, port, database, user, password)
+        self.replica: ReplicaRouter | None = None
+        self.replica_conninfo: str | None = None
+        self.replica_telemetry = PoolTelemetry()
+        if replica_host:
+            self.replica = ReplicaRouter(max_lag_seconds=replica_max_lag_seconds)
+            self.replica_conninfo = _conninfo(
+                replica_host,
+                replica_port or port,
+                database,
+                user,
+                password,
+            )
+
+        self.pool: AsyncConnectionPool | None = None
+        self.replica_pool: AsyncConnectionPool | None = None
+        self.connect()
+
+    def _new_pool(self, conninfo: str, timeout: float) -> AsyncConnectionPool:
+        return AsyncConnectionPool(
+            conninfo=conninfo,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            timeout=timeout,
+            max_idle=self.max_idle,
+            kwargs={
+                "row_factory": dict_row,
+                "cursor_factory": AsyncPreparedCursor,
+            },
+            configure=configure_async_connection,
+            open=False,
+        )
+
+    def connect(self) -> None:
+        """Create the (unopened) async connection pool(s)."""
+        try:
+            self.pool = self._new_pool(self.conninfo, self.pool_timeout)
+        except Exception as e:
+            logger.exception("Error creating async PostgreSQL pool: %s", e)
+            self.pool = None
+            msg = f"Could not create async database pool: {e}"
+            raise DatabaseConnectionError(msg) from e
+        if self.replica_conninfo:
+            try:
+                self.replica_pool = self._new_pool(
+                    self.replica_conninfo,
+                    REPLICA_CHECKOUT_TIMEOUT_SECONDS,
+                )
+            except Exception as e:
+                logger.exception("Error creating async read replica pool: %s", e)
+                self.replica_pool = None
+
+    async def open(self) -> None:
+        """Open the pool; call once from the running event loop."""
+        if not self.pool:
+            msg = "Async connection pool not initialized"
+            raise DatabaseConnectionError(msg)
+        try:
+            await self.pool.open(wait=True, timeout=self.pool_timeout)
+            logger.info(
+                "Connected async pool to PostgreSQL database: %s", self.database
+            )
+        except Exception as e:
+            logger.exception("Error opening async PostgreSQL pool: %s", e)
+            msg = f"Could not connect to database: {e}"
+            raise DatabaseConnectionError(msg) from e
+        if self.replica_pool:
+            # Connects in the background; an unreachable replica only costs
+            # fallbacks to the primary, never startup.
+            await self.replica_pool.open()
+
+    async def disconnect(self) -> None:
+        """Close the async connection pool."""
+        if self.replica_pool:
+            await self.replica_pool.close()
+            self.replica_pool = None
+        if self.pool:
+            await self.pool.close()
+            logger.info("Async database connection pool closed.")
+
+    @asynccontextmanager
+    async def _checkout(
+        self,
+        pool: AsyncConnectionPool | None,
+        telemetry: PoolTelemetry,
+    ):
+        if not pool:
+            msg = "Async connection pool not initialized"
+            raise DatabaseConnectionError(msg)
+        started = time.perf_counter()
+        checked_out = False
+        try:
+            async with pool.connection() as conn:
+                checked_out = True
+                wait_ms = (time.perf_counter() - started) * 1000
+                telemetry.record_checkout(wait_ms)
+                if profiler.enabled:
+                    profiler.note_checkout(wait_ms)
+                yield conn
+        except Exception:
+            if not checked_out:
+                telemetry.record_checkout_error()
+            raise
+
+    @asynccontextmanager
+    async def get_connection(self):
+        """Get a connection from the pool (``async with``), recording checkout stats."""
+        async with self._checkout(self.pool, self.telemetry) as conn:
+            yield conn
+
+    def stats(self) -> dict[str, Any]:
+        """Pool gauges (size, in use, waiting) plus checkout wait histogram."""
+        return pool_snapshot(self.pool, self.telemetry)
+
+    def replica_stats(self) -> dict[str, Any] | None:
+        """Replica pool gauges plus routing counters (None without a replica)."""
+        if self.replica is None:
+            return None
+        snapshot = pool_snapshot(self.replica_pool, self.replica_telemetry)
+        snapshot["routing"] = self.replica.snapshot()
+        return snapshot
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Async transaction context manager.
+
+        Usage:
+            async with db.transaction() as cur:
+                await cur.execute("INSERT ...")
+        """
+        async with self.get_connection() as conn:
+            try:
+                async with conn.cursor() as cur:
+                    yield cur
+                await conn.commit()
+            except Exception as e:
+                await conn.rollback()
+                logger.exception("Transaction failed, rolled back: %s", e)
+                raise
+
+    async def execute_query(
+        self,
+        query: str,
+        params: tuple | None = None,
+        fetchone: bool = False,
+        fetchall: bool = False,
+    ):
+        """Async counterpart of :meth:`Database.execute_query`."""
+        async with self.get_connection() as conn, conn.cursor() as cur:
+            try:
+                await cur.execute(query, params or ())
+
+                if fetchone:
+                    return await cur.fetchone()
+                if fetchall:
+                    return await cur.fetchall()
+                await conn.commit()
+                return None
+
+            except Exception as e:
+                await conn.rollback()
+                logger.warning(
+                    "Error executing query %s... (params=%s, fetchone=%s, fetchall=%s): %s",
+                    query[:100],
+                    params,
+                    fetchone,
+                    fetchall,
+                    e,
+                )
+                raise
+
+    async def execute_read(
+        self,
+        query: str,
+        params: tuple | dict | None = None,
+        *,
+        fetchone: bool = False,
+        consistency: ReadConsistency = ReadConsistency.BOUNDED,
+    ):
+        """Async counterpart of :meth:`Database.execute_read`."""
+        router = self.replica
+        if router is not None and router.wants_replica(consistency):
+            try:
+                async with (
+                    self._checkout(self.replica_pool, self.replica_telemetry) as conn,
+                    conn.cursor() as cur,
+                ):
+                    if router.needs_lag_check(consistency):
+                        await cur.execute(REPLICA_LAG_SQL)
+                        router.record_lag((await cur.fetchone())["lag_seconds"])
+                    if router.fresh_enough(consistency):
+                        await cur.execute(query, params or ())
+                        rows = await (cur.fetchone() if fetchone else cur.fetchall())
+                        router.record_replica_read()
+                        return rows
+                router.record_stale_fallback()
+            except _REPLICA_FALLBACK_ERRORS as e:
+                router.mark_down(e)
+        return await self.execute_query(
+            query,
+            params,
+            fetchone=fetchone,
+            fetchall=not fetchone,
+        )
@@ -0,0 +1,838 @@
+"""
+Pure-Python stand-in for the PostgreSQL database.
+
+:class:`InMemoryStore` keeps the PlayCord tables as dicts and offers one method
+per statement the repositories run, with the same semantics (upserts, soft
+deletes, ``jsonb ||`` merges, restrict/cascade rules, keyset history, stats
+derived from finished matches). The in-memory repositories in
+:mod:`playcord.infrastructure.database.implementation.repositories.memory` wrap
+it so the runtime can be load-tested without a server. Nothing is persisted.
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from playcord.infrastructure.database.implementation.core.exceptions import (
+    DatabaseError,
+)
+from playcord.infrastructure.database.models import EventType, MatchStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from playcord.infrastructure.database.models import HistoryCursor
+
+_FINISHED_STATUSES = frozenset(
+    {
+        MatchStatus.COMPLETED.value,
+        MatchStatus.INTERRUPTED.value,
+        MatchStatus.ABANDONED.value,
+    },
+)
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
+def _jsonb(value: Any) -> Any:
+    # Round-trip like a jsonb column: int keys become strings, tuples lists.
+    return json.loads(json.dumps(value))
+
+
+def _window_start(hours: int) -> datetime:
+    since = _now() - timedelta(hours=hours)
+    return since.replace(minute=0, second=0, microsecond=0)
+
+
+def _latency_ms(metadata: dict[str, Any] | None) -> float | None:
+    value = (metadata or {}).get("latency_ms")
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    return float(value)
+
+
+def _as_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    if value:
+        return datetime.fromisoformat(str(value))
+    return _now()
+
+
+@dataclass(slots=True)
+class InMemoryStore:
+    """Thread-safe in-process tables; every method is one atomic statement."""
+
+    users: dict[int, dict[str, Any]] = field(default_factory=dict)
+    guilds: dict[int, dict[str, Any]] = field(default_factory=dict)
+    games: dict[int, dict[str, Any]] = field(default_factory=dict)
+    matches: dict[int, dict[str, Any]] = field(default_factory=dict)
+    participants: dict[int, list[dict[str, Any]]] = field(default_factory=dict)
+    moves: dict[int, list[dict[str, Any]]] = field(default_factory=dict)
+    replay_events: dict[int, dict[int, dict[str, Any]]] = field(default_factory=dict)
+    replay_archives: dict[int, dict[str, Any]] = field(default_factory=dict)
+    role_assignments: dict[int, dict[int, tuple[str, int]]] = field(
+        default_factory=dict,
+    )
+    analytics_events: list[dict[str, Any]] = field(default_factory=list)
+    event_types: frozenset[str] = frozenset(event.value for event in EventType)
+    rollup_high_water_id: int = 0
+    _match_codes: dict[str, int] = field(default_factory=dict, repr=False)
+    _ids: dict[str, itertools.count[int]] = field(default_factory=dict, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+
+    def _next_id(self, sequence: str) -> int:
+        counter = self._ids.get(sequence)
+        if counter is None:
+            counter = self._ids[sequence] = itertools.count(1)
+        return next(counter)
+
+    def _require_match(self, match_id: int) -> dict[str, Any]:
+        match = self.matches.get(match_id)
+        if match is None:
+            msg = f"Match {match_id} does not exist"
+            raise DatabaseError(msg)
+        return match
+
+    def reset(self) -> None:
+        """Drop every row (the equivalent of recreating the schema)."""
+        with self._lock:
+            for table in (
+                self.users,
+                self.guilds,
+                self.games,
+                self.matches,
+                self.participants,
+                self.moves,
+                self.replay_events,
+                self.replay_archives,
+                self.role_assignments,
+                self._match_codes,
+                self._ids,
+            ):
+                table.clear()
+            self.analytics_events.clear()
+            self.rollup_high_water_id = 0
+
+    # -- users ---------------------------------------------------------------
+
+    def _insert_user(self, user_id: int, username: str, is_bot: bool) -> None:
+        now = _now()
+        self.users[user_id] = {
+            "user_id": user_id,
+            "username": username,
+            "is_bot": is_bot,
+            "preferences": {},
+            "is_active": True,
+            "is_deleted": False,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def upsert_user(self, user_id: int, username: str, is_bot: bool) -> None:
+        with self._lock:
+            row = self.users.get(user_id)
+            if row is None:
+                self._insert_user(user_id, username, is_bot)
+            else:
+                row.update(username=username, is_bot=is_bot, updated_at=_now())
+
+    def ensure_users(self, user_ids: Iterable[int]) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                if user_id not in self.users:
+                    self._insert_user(user_id, "Unknown", False)
+
+    def get_user(self, user_id: int) -> dict[str, Any] | None:
+        with self._lock:
+            row = self.users.get(user_id)
+            if row is None or row["is_deleted"]:
+                return None
+            return copy.deepcopy(row)
+
+    def get_users_preferences(self, user_ids: Iterable[int]) -> list[dict[str, Any]]:
+        """``user_id``/``joined_at``/``preferences`` rows of live users."""
+        with self._lock:
+            rows = []
+            for user_id in user_ids:
+                row = self.users.get(user_id)
+                if row is not None and not row["is_deleted"]:
+                    rows.append(
+                        {
+                            "user_id": user_id,
+                            "joined_at": row["created_at"],
+                            "preferences": copy.deepcopy(row["preferences"]),
+                        },
+                    )
+            return rows
+
+    def merge_user_preferences(
+        self,
+        user_id: int,
+        patch: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        with self._lock:
+            row = self.users.get(user_id)
+            if row is None or row["is_deleted"]:
+                return None
+            row["preferences"] = {**row["preferences"], **_jsonb(patch)}
+            row["updated_at"] = _now()
+            return {
+                "joined_at": row["created_at"],
+                "preferences": copy.deepcopy(row["preferences"]),
+            }
+
+    def set_user_deleted(self, user_id: int, deleted: bool) -> None:
+        """Soft-delete a user; restoring also restores their participations and moves."""
+        with self._lock:
+            row = self.users.get(user_id)
+            if row is None:
+                return
+            row.update(is_deleted=deleted, updated_at=_now())
+            if deleted:
+                return
+            for participants in self.participants.values():
+                for participant in participants:
+                    if participant["user_id"] == user_id:
+                        participant["is_deleted"] = False
+            for moves in self.moves.values():
+                for move in moves:
+                    if move["user_id"] == user_id:
+                        move["is_deleted"] = False
+
+    # -- guilds --------------------------------------------------------------
+
+    def _insert_guild(self, guild_id: int, settings: dict[str, Any]) -> None:
+        now = _now()
+        self.guilds[guild_id] = {
+            "guild_id": guild_id,
+            "settings": _jsonb(settings),
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def upsert_guild(self, guild_id: int, settings: dict[str, Any]) -> None:
+        """Insert with ``settings``, or reactivate an existing guild (settings kept)."""
+        with self._lock:
+            row = self.guilds.get(guild_id)
+            if row is None:
+                self._insert_guild(guild_id, settings)
+            else:
+                row.update(is_active=True, updated_at=_now())
+
+    def ensure_guilds(self, guild_ids: Iterable[int]) -> None:
+        with self._lock:
+            for guild_id in guild_ids:
+                if guild_id not in self.guilds:
+                    self._insert_guild(guild_id, {})
+
+    def get_guild_settings(self, guild_id: int) -> dict[str, Any] | None:
+        with self._lock:
+            row = self.guilds.get(guild_id)
+            return copy.deepcopy(row["settings"]) if row is not None else None
+
+    def merge_guild_settings(self, guild_id: int, patch: dict[str, Any]) -> None:
+        with self._lock:
+            row = self.guilds.get(guild_id)
+            if row is not None:
+                row["settings"] = {**row["settings"], **_jsonb(patch)}
+                row["updated_at"] = _now()
+
+    def delete_guild(self, guild_id: int) -> None:
+        with self._lock:
+            if any(m["guild_id"] == guild_id for m in self.matches.values()):
+                msg = f"Guild {guild_id} is still referenced by matches"
+                raise DatabaseError(msg)
+            self.guilds.pop(guild_id, None)
+
+    # -- games ---------------------------------------------------------------
+
+    def upsert_game(
+        self,
+        game_name: str,
+        display_name: str,
+        min_players: int,
+        max_players: int,
+        game_metadata: dict[str, Any],
+        game_schema_version: int,
+    ) -> int:
+        with self._lock:
+            now = _now()
+            values = {
+                "display_name": display_name,
+                "min_players": min_players,
+                "max_players": max_players,
+                "game_metadata": _jsonb(game_metadata),
+                "game_schema_version": game_schema_version,
+                "updated_at": now,
+            }
+            for row in self.games.values():
+                if row["game_name"] == game_name:
+                    row.update(values)
+                    return row["game_id"]
+            game_id = self._next_id("games")
+            self.games[game_id] = {
+                "game_id": game_id,
+                "game_name": game_name,
+                "is_active": True,
+                "created_at": now,
+                **values,
+            }
+            return game_id
+
+    def get_game(
+        self,
+        *,
+        game_id: int | None = None,
+        game_name: str | None = None,
+    ) -> dict[str, Any] | None:
+        with self._lock:
+            if game_id is not None:
+                row = self.games.get(game_id)
+            else:
+                row = next(
+                    (g for g in self.games.values() if g["game_name"] == game_name),
+                    None,
+                )
+            return copy.deepcopy(row) if row is not None else None
+
+    def delete_game(self, game_id: int) -> None:
+        with self._lock:
+            if any(m["game_id"] == game_id for m in self.matches.values()):
+                msg = f"Game {game_id} is still referenced by matches"
+                raise DatabaseError(msg)
+            self.games.pop(game_id, None)
+
+    # -- matches -------------------------------------------------------------
+
+    def first_free_match_code(self, codes: Sequence[str]) -> str | None:
+        with self._lock:
+            return next(
+                (code for code in codes if code.lower() not in self._match_codes),
+                None,
+            )
+
+    def create_match(
+        self,
+        *,
+        match_id: int,
+        game_id: int,
+        guild_id: int,
+        channel_id: int,
+        thread_id: int | None,
+        game_config: dict[str, Any],
+        user_ids: list[int],
+        codes: Sequence[str],
+    ) -> tuple[int, str] | None:
+        """Guild/users upsert, match and participants; None if every code is taken."""
+        with self._lock:
+            if match_id in self.matches:
+                msg = f"Match {match_id} already exists"
+                raise DatabaseError(msg)
+            if game_id not in self.games:
+                msg = f"Game {game_id} does not exist"
+                raise DatabaseError(msg)
+            code = self.first_free_match_code(codes)
+            if code is None:
+                return None
+            self.upsert_guild(guild_id, {})
+            self.ensure_users(user_ids)
+            now = _now()
+            self.matches[match_id] = {
+                "match_id": match_id,
+                "game_id": game_id,
+                "guild_id": guild_id,
+                "channel_id": channel_id,
+                "thread_id": thread_id,
+                "started_at": now,
+                "ended_at": None,
+                "status": MatchStatus.IN_PROGRESS.value,
+                "game_config": _jsonb(game_config),
+                "match_code": code,
+                "metadata": {},
+                "created_at": now,
+                "updated_at": now,
+                "player_count": len(user_ids),
+            }
+            self._match_codes[code.lower()] = match_id
+            self.participants[match_id] = [
+                {
+                    "participant_id": self._next_id("match_participants"),
+                    "match_id": match_id,
+                    "user_id": user_id,
+                    "player_number": number,
+                    "final_ranking": None,
+                    "score": None,
+                    "is_deleted": False,
+                    "joined_at": now,
+                    "updated_at": now,
+                }
+                for number, user_id in enumerate(user_ids, start=1)
+            ]
+            return match_id, code
+
+    def get_match(self, match_id: int) -> dict[str, Any] | None:
+        with self._lock:
+            row = self.matches.get(match_id)
+            return copy.deepcopy(row) if row is not None else None
+
+    def get_match_by_code(self, code: str) -> dict[str, Any] | None:
+        with self._lock:
+            match_id = self._match_codes.get(code.lower())
+            return self.get_match(match_id) if match_id is not None else None
+
+    def update_match_status(
+        self,
+        match_id: int,
+        status: str,
+        metadata_patch: dict[str, Any] | None = None,
+    ) -> None:
+        with self._lock:
+            match = self.matches.get(match_id)
+            if match is None:
+                return
+            now = _now()
+            match["status"] = status
+            match["updated_at"] = now
+            if status != MatchStatus.IN_PROGRESS.value and match["ended_at"] is None:
+                match["ended_at"] = now
+            if metadata_patch:
+                match["metadata"] = {**match["metadata"], **_jsonb(metadata_patch)}
+
+    def interrupt_stale_matches(self, metadata_patch: dict[str, Any]) -> list[int]:
+        with self._lock:
+            stale = [
+                match_id
+                for match_id, match in self.matches.items()
+                if match["status"] == MatchStatus.IN_PROGRESS.value
+            ]
+            for match_id in stale:
+                self.update_match_status(
+                    match_id,
+                    MatchStatus.INTERRUPTED.value,
+                    metadata_patch,
+                )
+            return stale
+
+    def merge_outcome_display(self, match_id: int, patch: dict[str, Any]) -> None:
+        with self._lock:
+            match = self.matches.get(match_id)
+            if match is not None:
+                metadata = dict(match["metadata"])
+                metadata.pop("outcome_summary", None)
+                match["metadata"] = {**metadata, **_jsonb(patch)}
+
+    def human_user_ids(self, match_id: int) -> list[int]:
+        with self._lock:
+            return [
+                p["user_id"]
+                for p in self.participants.get(match_id, [])
+                if not p["is_deleted"] and not self.users[p["user_id"]]["is_bot"]
+            ]
+
+    def end_match(
+        self,
+        match_id: int,
+        final_state: dict[str, Any],
+        results: Mapping[int, dict[str, Any]],
+    ) -> None:
+        with self._lock:
+            match = self.matches.get(match_id)
+            if match is None:
+                msg = f"Match {match_id} not found"
+                raise ValueError(msg)
+            if match["status"] == MatchStatus.COMPLETED.value:
+                msg = f"Match {match_id} is already completed"
+                raise ValueError(msg)
+            now = _now()
+            for participant in self.participants.get(match_id, []):
+                result = results.get(participant["user_id"])
+                if result is not None:
+                    participant["final_ranking"] = result["ranking"]
+                    participant["score"] = result.get("score")
+                    participant["updated_at"] = now
+            match.update(
+                status=MatchStatus.COMPLETED.value, ended_at=now, updated_at=now
+            )
+            match["metadata"] = {
+                **match["metadata"],
+                **_jsonb({"final_state": final_state}),
+            }
+
+    def get_participants(self, match_id: int) -> list[dict[str, Any]]:
+        with self._lock:
+            return [
+                copy.deepcopy(p)
+                for p in self.participants.get(match_id, [])
+                if not p["is_deleted"]
+            ]
+
+    # -- moves ---------------------------------------------------------------
+
+    def next_move_number(self, match_id: int) -> int:
+        with self._lock:
+            moves = self.moves.get(match_id, [])
+            return max((m["move_number"] for m in moves), default=0) + 1
+
+    def insert_move(
+        self,
+        match_id: int,
+        user_id: int | None,
+        move_number: int | None,
+        kind: str,
+        move_data: dict[str, Any] | None,
+        game_state_after: dict[str, Any] | None,
+        time_taken_ms: int | None,
+        is_game_affecting: bool,
+    ) -> bool:
+        """Append a move; False if an explicit ``move_number`` is already taken."""
+        with self._lock:
+            self._require_match(match_id)
+            moves = self.moves.setdefault(match_id, [])
+            if move_number is None:
+                move_number = self.next_move_number(match_id)
+            elif any(m["move_number"] == move_number for m in moves):
+                return False
+            moves.append(
+                {
+                    "move_id": self._next_id("match_moves"),
+                    "match_id": match_id,
+                    "user_id": user_id,
+                    "move_number": move_number,
+                    "kind": kind,
+                    "move_data": _jsonb(move_data) if move_data else None,
+                    "game_state_after": (
+                        _jsonb(game_state_after) if game_state_after else None
+                    ),
+                    "time_taken_ms": time_taken_ms,
+                    "is_game_affecting": is_game_affecting,
+                    "is_deleted": False,
+                    "created_at": _now(),
+                },
+            )
+            return True
+
+    def move_count(self, match_id: int) -> int:
+        with self._lock:
+            return sum(1 for m in self.moves.get(match_id, []) if not m["is_deleted"])
+
+    # -- history and stats ---------------------------------------------------
+
+    def user_history(
+        self,
+        user_id: int,
+        guild_id: int | None,
+        game_id: int | None,
+        limit: int,
+        offset: int,
+        after: HistoryCursor | None = None,
+    ) -> list[dict[str, Any]]:
+        """Finished matches of ``user_id``, newest first (keyset past ``after``)."""
+        with self._lock:
+            rows = []
+            for match_id, participants in self.participants.items():
+                match = self.matches[match_id]
+                if match["status"] not in _FINISHED_STATUSES:
+                    continue
+                if guild_id is not None and match["guild_id"] != guild_id:
+                    continue
+                if game_id is not None and match["game_id"] != game_id:
+                    continue
+                if after is not None and (match["ended_at"], match_id) >= (
+                    after.ended_at,
+                    after.match_id,
+                ):
+                    continue
+                game = self.games[match["game_id"]]
+                rows.extend(
+                    {
+                        "match_id": match_id,
+                        "match_code": match["match_code"],
+                        "game_id": match["game_id"],
+                        "game_key": game["game_name"],
+                        "game_name": game["display_name"],
+                        "ended_at": match["ended_at"],
+                        "status": match["status"],
+                        "metadata": copy.deepcopy(match["metadata"]),
+                        "final_ranking": p["final_ranking"],
+                        "player_number": p["player_number"],
+                        "player_count": match["player_count"],
+                    }
+                    for p in participants
+                    if p["user_id"] == user_id
+                )
+        rows.sort(key=lambda row: (row["ended_at"], row["match_id"]), reverse=True)
+        start = offset if after is None else 0
+        return rows[start : start + limit]
+
+    def user_game_stats(
+        self,
+        user_id: int | None = None,
+        guild_id: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Per (user, guild, game) totals of finished matches, most played first.
+
+        Computed from match history on each call, with the outcome rules of
+        ``apply_user_game_stats`` (a shared first place is a draw).
+        """
+        stats: dict[tuple[int, int, int], dict[str, Any]] = {}
+        with self._lock:
+            for match_id, participants in self.participants.items():
+                match = self.matches[match_id]
+                status = match["status"]
+                if status not in _FINISHED_STATUSES:
+                    continue
+                if guild_id is not None and match["guild_id"] != guild_id:
+                    continue
+                live = [p for p in participants if not p["is_deleted"]]
+                winners = sum(1 for p in live if p["final_ranking"] == 1)
+                game = self.games[match["game_id"]]
+                for p in live:
+                    if user_id is not None and p["user_id"] != user_id:
+                        continue
+                    key = (p["user_id"], match["guild_id"], match["game_id"])
+                    row = stats.get(key)
+                    if row is None:
+                        row = stats[key] = {
+                            "user_id": p["user_id"],
+                            "guild_id": match["guild_id"],
+                            "game_id": match["game_id"],
+                            "game_key": game["game_name"],
+                            "game_name": game["display_name"],
+                            "matches_played": 0,
+                            "wins": 0,
+                            "draws": 0,
+                            "losses": 0,
+                            "interrupted": 0,
+                            "last_played_at": match["ended_at"],
+                        }
+                    row["matches_played"] += 1
+                    ranking = p["final_ranking"]
+                    if status == MatchStatus.COMPLETED.value and ranking is not None:
+                        if ranking == 1:
+                            row["draws" if winners > 1 else "wins"] += 1
+                        elif ranking > 1:
+                            row["losses"] += 1
+                    elif status == MatchStatus.INTERRUPTED.value:
+                        row["interrupted"] += 1
+                    row["last_played_at"] = max(
+                        row["last_played_at"],
+                        match["ended_at"],
+                    )
+        return sorted(
+            stats.values(),
+            key=lambda row: (row["matches_played"], row["last_played_at"]),
+            reverse=True,
+        )
+
+    # -- replays -------------------------------------------------------------
+
+    def replay_rows(self, match_id: int) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self.replay_events.get(match_id, {})
+            return [copy.deepcopy(rows[seq]) for seq in sorted(rows)]
+
+    def replay_archive(self, match_id: int) -> dict[str, Any] | None:
+        with self._lock:
+            archive = self.replay_archives.get(match_id)
+            return dict(archive) if archive is not None else None
+
+    def next_replay_sequence(self, match_id: int) -> int:
+        with self._lock:
+            archive = self.replay_archives.get(match_id)
+            return (
+                max(
+                    max(self.replay_events.get(match_id, {}), default=0),
+                    archive["last_sequence"] if archive else 0,
+                )
+                + 1
+            )
+
+    def insert_replay_rows(
+        self,
+        match_id: int,
+        rows: Sequence[tuple[int, str, int | None, str]],
+    ) -> bool:
+        """Insert ``(sequence, event_type, actor, payload JSON)`` rows, all or none.
+
+        Returns False when one of the sequence numbers is already taken.
+        """
+        with self._lock:
+            self._require_match(match_id)
+            events = self.replay_events.setdefault(match_id, {})
+            if any(sequence in events for sequence, *_ in rows):
+                return False
+            for sequence, event_type, actor_user_id, payload_json in rows:
+                events[sequence] = {
+                    "sequence_number": sequence,
+                    "event_type": event_type,
+                    "actor_user_id": actor_user_id,
+                    "payload": json.loads(payload_json),
+                }
+            return True
+
+    def append_replay_row(
+        self,
+        match_id: int,
+        event_type: str,
+        actor_user_id: int | None,
+        payload_json: str,
+    ) -> None:
+        with self._lock:
+            sequence = self.next_replay_sequence(match_id)
+            self.insert_replay_rows(
+                match_id,
+                [(sequence, event_type, actor_user_id, payload_json)],
+            )
+
+    def store_replay_archive(
+        self,
+        params: tuple[Any, ...],
+        last_sequence: int,
+    ) -> None:
+        """Upsert an archive built by ``_archive_payload`` and drop the rows it covers."""
+        match_id, encoding, event_count, _last, uncompressed_bytes, data = params
+        with self._lock:
+            self.replay_archives[match_id] = {
+                "match_id": match_id,
+                "encoding": encoding,
+                "event_count": event_count,
+                "last_sequence": last_sequence,
+                "uncompressed_bytes": uncompressed_bytes,
+                "data": data,
+                "archived_at": _now(),
+            }
+            events = self.replay_events.get(match_id, {})
+            for sequence in [seq for seq in events if seq <= last_sequence]:
+                del events[sequence]
+
+    # -- roles ---------------------------------------------------------------
+
+    def save_role_assignments(
+        self,
+        match_id: int,
+        assignments: Sequence[tuple[int, str, int]],
+    ) -> None:
+        with self._lock:
+            self._require_match(match_id)
+            saved = self.role_assignments.setdefault(match_id, {})
+            for player_id, role_id, seat_index in assignments:
+                saved[int(player_id)] = (str(role_id), int(seat_index))
+
+    def get_role_assignments(self, match_id: int) -> dict[int, tuple[str, int]]:
+        with self._lock:
+            saved = self.role_assignments.get(match_id, {})
+            return dict(sorted(saved.items(), key=lambda item: item[1][1]))
+
+    # -- analytics -----------------------------------------------------------
+
+    def insert_analytics_events(self, events: Sequence[dict[str, Any]]) -> int:
+        """Insert event rows (users/guilds ensured); unknown event types are skipped."""
+        with self._lock:
+            known = [e for e in events if e["event_type"] in self.event_types]
+            self.ensure_users(e["user_id"] for e in known if e.get("user_id"))
+            self.ensure_guilds(e["guild_id"] for e in known if e.get("guild_id"))
+            for event in known:
+                self.analytics_events.append(
+                    {
+                        "event_id": self._next_id("analytics_events"),
+                        "event_type": event["event_type"],
+                        "created_at": _as_datetime(event.get("created_at")),
+                        "user_id": event.get("user_id"),
+                        "guild_id": event.get("guild_id"),
+                        "game_id": event.get("game_id"),
+                        "match_id": event.get("match_id"),
+                        "metadata": (
+                            _jsonb(event["metadata"]) if event.get("metadata") else None
+                        ),
+                    },
+                )
+            return len(known)
+
+    def _events_since(self, since: datetime) -> list[dict[str, Any]]:
+        return [e for e in self.analytics_events if e["created_at"] >= since]
+
+    def analytics_event_counts(self, hours: int) -> list[dict[str, Any]]:
+        counts: dict[str, int] = {}
+        with self._lock:
+            for event in self._events_since(_window_start(hours)):
+                counts[event["event_type"]] = counts.get(event["event_type"], 0) + 1
+        return [
+            {"event_type": event_type, "cnt": cnt}
+            for event_type, cnt in sorted(counts.items(), key=lambda i: -i[1])
+        ]
+
+    def analytics_game_counts(self, hours: int) -> list[dict[str, Any]]:
+        counts: dict[str, int] = {}
+        with self._lock:
+            for event in self._events_since(_window_start(hours)):
+                game = self.games.get(event["game_id"])
+                if game is not None:
+                    name = game["game_name"]
+                    counts[name] = counts.get(name, 0) + 1
+        return [
+            {"game_type": game_type, "cnt": cnt}
+            for game_type, cnt in sorted(counts.items(), key=lambda i: -i[1])
+        ]
+
+    def analytics_latency_summary(self, hours: int) -> list[dict[str, Any]]:
+        samples: dict[str, list[float]] = {}
+        with self._lock:
+            for event in self._events_since(_window_start(hours)):
+                latency = _latency_ms(event["metadata"])
+                if latency is not None:
+                    samples.setdefault(event["event_type"], []).append(latency)
+        rows = [
+            {
+                "event_type": event_type,
+                "samples": len(values),
+                "avg_ms": sum(values) / len(values),
+                "min_ms": min(values),
+                "max_ms": max(values),
+            }
+            for event_type, values in samples.items()
+        ]
+        return sorted(rows, key=lambda row: row["samples"], reverse=True)
+
+    def recent_analytics_events(self, hours: int, limit: int) -> list[dict[str, Any]]:
+        since = _now() - timedelta(hours=hours)
+        with self._lock:
+            rows = [
+                copy.deepcopy(e)
+                for e in self.analytics_events
+                if e["created_at"] > since
+            ]
+        rows.sort(key=lambda row: row["created_at"], reverse=True)
+        return rows[:limit]
+
+    def advance_rollup(self, limit: int) -> int:
+        """Move the rollup mark past up to ``limit`` events; returns how many.
+
+        Reads always aggregate the raw events here, so there is no rollup table
+        to fill; the mark only keeps the folding counters meaningful.
+        """
+        with self._lock:
+            pending = [
+                e["event_id"]
+                for e in self.analytics_events
+                if e["event_id"] > self.rollup_high_water_id
+            ][:limit]
+            if pending:
+                self.rollup_high_water_id = pending[-1]
+            return len(pending)
+
+    def delete_analytics_before(self, cutoff: datetime) -> int:
+        with self._lock:
+            kept = [e for e in self.analytics_events if e["created_at"] >= cutoff]
+            removed = len(self.analytics_events) - len(kept)
+            self.analytics_events[:] = kept
+            return removed
@@ -2,14 +2,18 @@
 
 from playcord.infrastructure.database.implementation.repositories.analytics import (
     AnalyticsRepository,
+    AsyncAnalyticsRepository,
 )
 from playcord.infrastructure.database.implementation.repositories.game import (
     GameRepository,
 )
 from playcord.infrastructure.database.implementation.repositories.guild import (
+    AsyncGuildRepository,
     GuildRepository,
 )
 from playcord.infrastructure.database.implementation.repositories.history import (
+    AsyncMatchRepository,
+    AsyncReplayRepository,
     MatchRepository,
     ReplayRepository,
 )
@@ -20,11 +24,17 @@ from playcord.infrastructure.database.implementation.repositories.roles import (
     RoleRepository,
 )
 from playcord.infrastructure.database.implementation.repositories.user import (
+    AsyncPlayerRepository,
     PlayerRepository,
 )
 
 __all__ = [
     "AnalyticsRepository",
+    "AsyncAnalyticsRepository",
+    "AsyncGuildRepository",
+    "AsyncMatchRepository",
+    "AsyncPlayerRepository",
+    "AsyncReplayRepository",
     "GameRepository",
     "GuildRepository",
     "MaintenanceRepository",
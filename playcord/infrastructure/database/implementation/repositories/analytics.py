@@ -4,12 +4,249 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from playcord.infrastructure.config import get_settings
+from playcord.infrastructure.constants import (
+    ANALYTICS_ROLLUP_BATCH_SIZE,
+    ANALYTICS_ROLLUP_MAX_BATCHES,
+    ANALYTICS_ROLLUP_SETTLE_SECONDS,
+)
+from playcord.infrastructure.database.implementation.core.replica import (
+    ReadConsistency,
+)
+from playcord.infrastructure.database.implementation.core.statements import (
+    register_statement,
+)
 
 if TYPE_CHECKING:
-    from playcord.infrastructure.database.implementation.database import Database
+    from collections.abc import Sequence
+
+    from playcord.infrastructure.database.implementation.database import (
+        AsyncDatabase,
+        Database,
+    )
+
+_ENSURE_USER_SQL = """
+    INSERT INTO users (user_id, username, is_bot)
+    VALUES (%s, 'Unknown', FALSE)
+    ON CONFLICT (user_id) DO NOTHING;
+"""
+_ENSURE_GUILD_SQL = """
+    INSERT INTO guilds (guild_id, settings)
+    VALUES (%s, '{}'::jsonb)
+    ON CONFLICT (guild_id) DO NOTHING;
+"""
+_INSERT_EVENT_SQL = register_statement(
+    "insert_analytics_event",
+    """
+    INSERT INTO analytics_events
+        (event_type, user_id, guild_id, game_id, match_id, metadata)
+    VALUES (%s, %s, %s, %s, %s, %s::jsonb);
+""",
+)
+_ENSURE_USERS_SQL = register_statement(
+    "ensure_users",
+    """
+    INSERT INTO users (user_id, username, is_bot)
+    SELECT u.user_id, 'Unknown', FALSE
+    FROM unnest(%s::bigint[]) AS u(user_id)
+    ON CONFLICT (user_id) DO NOTHING;
+""",
+)
+_ENSURE_GUILDS_SQL = register_statement(
+    "ensure_guilds",
+    """
+    INSERT INTO guilds (guild_id, settings)
+    SELECT g.guild_id, '{}'::jsonb
+    FROM unnest(%s::bigint[]) AS g(guild_id)
+    ON CONFLICT (guild_id) DO NOTHING;
+""",
+)
+_KNOWN_EVENT_TYPES_SQL = register_statement(
+    "known_analytics_event_types",
+    """
+    SELECT event_type FROM analytics_event_types WHERE event_type = ANY(%s);
+""",
+)
+_GAME_IDS_BY_NAME_SQL = register_statement(
+    "analytics_game_ids_by_name",
+    """
+    SELECT game_id, game_name FROM games WHERE game_name = ANY(%s);
+""",
+)
+_COPY_EVENTS_SQL = """
+    COPY analytics_events
+        (created_at, event_type, user_id, guild_id, game_id, match_id, metadata)
+    FROM STDIN
+"""
+# Dashboard counts read the hourly rollup plus the raw tail not folded into it yet.
+# The window is hour-aligned, so it can reach up to an hour further back than ``hours``.
+_HOURLY_WINDOW_CTE = """
+    WITH since AS (
+        SELECT date_trunc('hour', NOW() - (%(hours)s * INTERVAL '1 hour')) AS hour
+    ),
+    windowed AS (
+        SELECT h.event_type, h.game_id, h.event_count
+        FROM analytics_hourly h, since
+        WHERE h.hour >= since.hour
+        UNION ALL
+        SELECT e.event_type, COALESCE(e.game_id, 0), 1
+        FROM analytics_events e, since
+        WHERE e.event_id > COALESCE(
+                (SELECT high_water_id FROM analytics_rollup_state
+                 WHERE rollup = 'analytics_hourly'),
+                0
+            )
+          AND e.created_at >= since.hour
+    )
+"""
+_EVENT_COUNTS_SQL = (
+    _HOURLY_WINDOW_CTE
+    + """
+    SELECT event_type, SUM(event_count)::BIGINT AS cnt
+    FROM windowed
+    GROUP BY event_type
+    ORDER BY cnt DESC;
+"""
+)
+_GAME_COUNTS_SQL = (
+    _HOURLY_WINDOW_CTE
+    + """
+    SELECT g.game_name AS game_type, SUM(w.event_count)::BIGINT AS cnt
+    FROM windowed w
+    JOIN games g ON g.game_id = w.game_id
+    GROUP BY g.game_name
+    ORDER BY cnt DESC;
+"""
+)
+_LATENCY_SQL = """
+    SELECT event_type,
+           SUM(latency_count)::BIGINT AS samples,
+           SUM(latency_sum_ms) / SUM(latency_count) AS avg_ms,
+           MIN(latency_min_ms) AS min_ms,
+           MAX(latency_max_ms) AS max_ms
+    FROM analytics_hourly
+    WHERE hour >= date_trunc('hour', NOW() - (%s * INTERVAL '1 hour'))
+      AND latency_count > 0
+    GROUP BY event_type
+    ORDER BY samples DESC;
+"""
+# Folds the next batch of raw events past the high-water mark into analytics_hourly
+# and advances the mark in the same statement. Locking the state row keeps two
+# folders from counting the same batch.
+#
+# Identity values are taken before commit, so a lower event_id can commit after a
+# higher one. The fold therefore stops at horizon_id, the identity's last value as
+# sampled at horizon_at, and only once that sample is ANALYTICS_ROLLUP_SETTLE_SECONDS
+# old: by then every transaction holding an id at or below it has finished. When a
+# batch reaches the horizon the mark jumps to it and a new horizon is sampled.
+_FOLD_HOURLY_SQL = """
+    WITH state AS (
+        SELECT high_water_id, horizon_id
+        FROM analytics_rollup_state
+        WHERE rollup = 'analytics_hourly'
+          AND horizon_at <= NOW() - (%(settle)s * INTERVAL '1 second')
+        FOR UPDATE
+    ),
+    batch AS (
+        SELECT e.event_id, e.created_at, e.event_type, e.game_id, e.guild_id,
+               CASE WHEN jsonb_typeof(e.metadata -> 'latency_ms') = 'number'
+                    THEN (e.metadata ->> 'latency_ms')::DOUBLE PRECISION
+               END AS latency_ms
+        FROM analytics_events e, state
+        WHERE e.event_id > state.high_water_id
+          AND e.event_id <= state.horizon_id
+        ORDER BY e.event_id
+        LIMIT %(batch_size)s
+    ),
+    folded AS (
+        INSERT INTO analytics_hourly AS h
+            (hour, event_type, game_id, guild_id, event_count,
+             latency_count, latency_sum_ms, latency_min_ms, latency_max_ms)
+        SELECT date_trunc('hour', created_at),
+               event_type,
+               COALESCE(game_id, 0),
+               COALESCE(guild_id, 0),
+               COUNT(*),
+               COUNT(latency_ms),
+               COALESCE(SUM(latency_ms), 0),
+               MIN(latency_ms),
+               MAX(latency_ms)
+        FROM batch
+        GROUP BY 1, 2, 3, 4
+        ON CONFLICT (hour, event_type, game_id, guild_id) DO UPDATE
+        SET event_count    = h.event_count + EXCLUDED.event_count,
+            latency_count  = h.latency_count + EXCLUDED.latency_count,
+            latency_sum_ms = h.latency_sum_ms + EXCLUDED.latency_sum_ms,
+            latency_min_ms = LEAST(h.latency_min_ms, EXCLUDED.latency_min_ms),
+            latency_max_ms = GREATEST(h.latency_max_ms, EXCLUDED.latency_max_ms)
+    ),
+    progress AS (
+        SELECT COUNT(*) AS folded,
+               COUNT(*) >= %(batch_size)s AS more,
+               MAX(event_id) AS last_id
+        FROM batch
+    )
+    UPDATE analytics_rollup_state AS r
+    SET high_water_id = CASE WHEN p.more THEN p.last_id ELSE s.horizon_id END,
+        horizon_id    = CASE
+            WHEN p.more THEN s.horizon_id
+            ELSE COALESCE(
+                pg_sequence_last_value(
+                    pg_get_serial_sequence('analytics_events', 'event_id')
+                ),
+                s.horizon_id
+            )
+        END,
+        horizon_at    = CASE WHEN p.more THEN r.horizon_at ELSE NOW() END,
+        updated_at    = NOW()
+    FROM state s, progress p
+    WHERE r.rollup = 'analytics_hourly'
+    RETURNING p.folded AS folded;
+"""
+_RECENT_EVENTS_SQL = """
+    SELECT event_id, event_type, created_at, user_id, guild_id, game_id, match_id, metadata
+    FROM analytics_events
+    WHERE created_at > NOW() - (%s * INTERVAL '1 hour')
+    ORDER BY created_at DESC
+    LIMIT %s;
+"""
+# Retention drops whole monthly partitions, so rows live up to a month past ``days``.
+_CLEANUP_SQL = """
+    SELECT drop_expired_partitions('analytics_events', NOW() - (%s * INTERVAL '1 day'));
+"""
+
+
+def _event_kwargs(event_type: str, payload: dict[str, Any] | None) -> dict[str, Any]:
+    metadata = payload or {}
+    return {
+        "event_type": event_type,
+        "user_id": metadata.get("user_id"),
+        "guild_id": metadata.get("guild_id"),
+        "game_type": metadata.get("game_type"),
+        "match_id": metadata.get("match_id"),
+        "metadata": (
+            metadata.get("metadata")
+            if isinstance(metadata.get("metadata"), dict)
+            else metadata
+        ),
+    }
+
+
+def _optional_id(value: Any) -> int | None:
+    try:
+        return int(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _resolve_game_id(games: Any, game_type: str | None) -> int | None:
+    if not game_type:
+        return None
+    game = games.get_game(game_type)
+    return game.game_id if game else None
 
 
 @dataclass(slots=True)
@@ -22,19 +259,7 @@ class AnalyticsRepository:
         event_type: str,
         payload: dict[str, Any] | None = None,
     ) -> None:
-        metadata = payload or {}
-        self.record_analytics_event(
-            event_type=event_type,
-            user_id=metadata.get("user_id"),
-            guild_id=metadata.get("guild_id"),
-            game_type=metadata.get("game_type"),
-            match_id=metadata.get("match_id"),
-            metadata=(
-                metadata.get("metadata")
-                if isinstance(metadata.get("metadata"), dict)
-                else metadata
-            ),
-        )
+        self.record_analytics_event(**_event_kwargs(event_type, payload))
 
     def get_summary(self, *, hours: int = 24) -> list[dict[str, Any]]:
         return self.get_analytics_event_counts(hours=hours)
@@ -57,28 +282,13 @@ class AnalyticsRepository:
         metadata: dict[str, Any] | None = None,
     ) -> None:
         if user_id:
-            q = """
-            INSERT INTO users (user_id, username, is_bot)
-            VALUES (%s, 'Unknown', FALSE)
-            ON CONFLICT (user_id) DO NOTHING;
-            """
-            self.database.execute_query(q, (user_id,))
+            self.database.execute_query(_ENSURE_USER_SQL, (user_id,))
         if guild_id:
-            gq = """
-            INSERT INTO guilds (guild_id, settings)
-            VALUES (%s, '{}'::jsonb)
-            ON CONFLICT (guild_id) DO NOTHING;
-            """
-            self.database.execute_query(gq, (guild_id,))
+            self.database.execute_query(_ENSURE_GUILD_SQL, (guild_id,))
 
         metadata_json = json.dumps(metadata) if metadata else None
-        query = """
-            INSERT INTO analytics_events
-                (event_type, user_id, guild_id, game_id, match_id, metadata)
-            VALUES (%s, %s, %s, %s, %s, %s::jsonb);
-        """
         self.database.execute_query(
-            query,
+            _INSERT_EVENT_SQL,
             (event_type, user_id, guild_id, game_id, match_id, metadata_json),
         )
 
@@ -91,29 +301,39 @@ class AnalyticsRepository:
         match_id: int | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> None:
-        resolved_game_id: int | None = None
-        if game_type:
-            game = self.games.get_game(game_type)
-            if game:
-                resolved_game_id = game.game_id
         self._insert_event_row(
             event_type,
             user_id,
             guild_id,
-            resolved_game_id,
+            _resolve_game_id(self.games, game_type),
             match_id,
             metadata,
         )
 
     def get_analytics_event_counts(self, hours: int = 24) -> list[dict[str, Any]]:
-        query = """
-            SELECT event_type, COUNT(*)::BIGINT AS cnt
-            FROM analytics_events
-            WHERE created_at > NOW() - (%s * INTERVAL '1 hour')
-            GROUP BY event_type
-            ORDER BY cnt DESC;
-        """
-        rows = self.database.execute_query(query, (hours,), fetchall=True)
+        rows = self.database.execute_read(
+            _EVENT_COUNTS_SQL,
+            {"hours": hours},
+            consistency=ReadConsistency.RELAXED,
+        )
+        return rows or []
+
+    def get_event_counts_by_game(self, *, hours: int = 24) -> list[dict[str, Any]]:
+        """Event totals per game (``game_type``, ``cnt``) over the last ``hours``."""
+        rows = self.database.execute_read(
+            _GAME_COUNTS_SQL,
+            {"hours": hours},
+            consistency=ReadConsistency.RELAXED,
+        )
+        return rows or []
+
+    def get_latency_summary(self, *, hours: int = 24) -> list[dict[str, Any]]:
+        """Per event type ``samples``/``avg_ms``/``min_ms``/``max_ms`` from the rollup."""
+        rows = self.database.execute_read(
+            _LATENCY_SQL,
+            (hours,),
+            consistency=ReadConsistency.RELAXED,
+        )
         return rows or []
 
     def get_analytics_recent_events(
@@ -121,25 +341,205 @@ class AnalyticsRepository:
         hours: int = 24,
         limit: int = 60,
     ) -> list[dict[str, Any]]:
-        query = """
-            SELECT event_id, event_type, created_at, user_id, guild_id, game_id, match_id, metadata
-            FROM analytics_events
-            WHERE created_at > NOW() - (%s * INTERVAL '1 hour')
-            ORDER BY created_at DESC
-            LIMIT %s;
-        """
-        rows = self.database.execute_query(query, (hours, limit), fetchall=True)
+        rows = self.database.execute_read(
+            _RECENT_EVENTS_SQL,
+            (hours, limit),
+            consistency=ReadConsistency.RELAXED,
+        )
         return rows or []
 
     def cleanup_old_analytics(self, days: int | None = None) -> int:
+        """Drop expired analytics partitions; returns how many were dropped."""
         if days is None:
             days = get_settings().analytics_retention_days
-        query = """
-            DELETE FROM analytics_events
-            WHERE created_at < NOW() - (%s * INTERVAL '1 day');
+        with self.database.transaction() as cur:
+            cur.execute(_CLEANUP_SQL, (days,))
+            return len(cur.fetchall())
+
+
+@dataclass(slots=True)
+class AsyncAnalyticsRepository:
+    """Asyncio counterpart of :class:`AnalyticsRepository`."""
+
+    database: AsyncDatabase
+    games: Any  # GameRepository
+
+    async def record_event(
+        self,
+        event_type: str,
+        payload: dict[str, Any] | None = None,
+    ) -> None:
+        await self.record_analytics_event(**_event_kwargs(event_type, payload))
+
+    async def get_summary(self, *, hours: int = 24) -> list[dict[str, Any]]:
+        return await self.get_analytics_event_counts(hours=hours)
+
+    async def get_recent_events(
+        self,
+        *,
+        hours: int = 24,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        return await self.get_analytics_recent_events(hours=hours, limit=limit)
+
+    async def record_analytics_event(
+        self,
+        event_type: str,
+        user_id: int | None = None,
+        guild_id: int | None = None,
+        game_type: str | None = None,
+        match_id: int | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        metadata_json = json.dumps(metadata) if metadata else None
+        game = (
+            await self.games.get_game_async(self.database, game_type)
+            if game_type
+            else None
+        )
+        async with self.database.transaction() as cur:
+            if user_id:
+                await cur.execute(_ENSURE_USER_SQL, (user_id,))
+            if guild_id:
+                await cur.execute(_ENSURE_GUILD_SQL, (guild_id,))
+            await cur.execute(
+                _INSERT_EVENT_SQL,
+                (
+                    event_type,
+                    user_id,
+                    guild_id,
+                    game.game_id if game else None,
+                    match_id,
+                    metadata_json,
+                ),
+            )
+
+    async def ingest_events(self, events: Sequence[dict[str, Any]]) -> int:
+        """Write a batch of queued events in one transaction; returns rows written.
+
+        Each event is a dict with ``event_type``, ``created_at`` and optional
+        ``user_id``/``guild_id``/``game_type``/``match_id``/``metadata``. Distinct
+        users and guilds are upserted once, the rows go in through COPY, and
+        events with an unregistered ``event_type`` are skipped.
         """
-        with self.database.get_connection() as conn, conn.cursor() as cur:
-            cur.execute(query, (days,))
-            count = cur.rowcount
-            conn.commit()
-            return int(count) if count is not None else 0
+        if not events:
+            return 0
+        event_types = sorted({str(event["event_type"]) for event in events})
+        game_types = sorted(
+            {str(event["game_type"]) for event in events if event.get("game_type")},
+        )
+        async with self.database.transaction() as cur:
+            await cur.execute(_KNOWN_EVENT_TYPES_SQL, (event_types,))
+            known = {row["event_type"] for row in await cur.fetchall()}
+            game_ids: dict[str, int] = {}
+            if game_types:
+                await cur.execute(_GAME_IDS_BY_NAME_SQL, (game_types,))
+                game_ids = {
+                    row["game_name"]: row["game_id"] for row in await cur.fetchall()
+                }
+            rows = [
+                (
+                    event.get("created_at") or datetime.now(UTC).isoformat(),
+                    str(event["event_type"]),
+                    _optional_id(event.get("user_id")),
+                    _optional_id(event.get("guild_id")),
+                    game_ids.get(event.get("game_type")),
+                    _optional_id(event.get("match_id")),
+                    json.dumps(event["metadata"]) if event.get("metadata") else None,
+                )
+                for event in events
+                if str(event["event_type"]) in known
+            ]
+            if not rows:
+                return 0
+            user_ids = sorted({row[2] for row in rows if row[2] is not None})
+            guild_ids = sorted({row[3] for row in rows if row[3] is not None})
+            if user_ids:
+                await cur.execute(_ENSURE_USERS_SQL, (user_ids,))
+            if guild_ids:
+                await cur.execute(_ENSURE_GUILDS_SQL, (guild_ids,))
+            async with cur.copy(_COPY_EVENTS_SQL) as copy:
+                for row in rows:
+                    await copy.write_row(row)
+        return len(rows)
+
+    async def get_analytics_event_counts(
+        self,
+        hours: int = 24,
+    ) -> list[dict[str, Any]]:
+        rows = await self.database.execute_read(
+            _EVENT_COUNTS_SQL,
+            {"hours": hours},
+            consistency=ReadConsistency.RELAXED,
+        )
+        return rows or []
+
+    async def get_event_counts_by_game(
+        self,
+        *,
+        hours: int = 24,
+    ) -> list[dict[str, Any]]:
+        rows = await self.database.execute_read(
+            _GAME_COUNTS_SQL,
+            {"hours": hours},
+            consistency=ReadConsistency.RELAXED,
+        )
+        return rows or []
+
+    async def get_latency_summary(self, *, hours: int = 24) -> list[dict[str, Any]]:
+        rows = await self.database.execute_read(
+            _LATENCY_SQL,
+            (hours,),
+            consistency=ReadConsistency.RELAXED,
+        )
+        return rows or []
+
+    async def fold_hourly_rollup(
+        self,
+        *,
+        batch_size: int = ANALYTICS_ROLLUP_BATCH_SIZE,
+        max_batches: int = ANALYTICS_ROLLUP_MAX_BATCHES,
+    ) -> int:
+        """Fold raw events past the high-water mark into analytics_hourly.
+
+        Only events up to a settled id horizon are folded (see _FOLD_HOURLY_SQL);
+        newer ones stay in the raw tail the dashboards add on top.
+        Each batch is one transaction, so the rollup and the mark never disagree.
+        Stops after ``max_batches`` so a large backlog is worked off over several
+        calls. Returns the number of raw events folded.
+        """
+        folded = 0
+        for _ in range(max(1, max_batches)):
+            async with self.database.transaction() as cur:
+                await cur.execute(
+                    _FOLD_HOURLY_SQL,
+                    {
+                        "batch_size": batch_size,
+                        "settle": ANALYTICS_ROLLUP_SETTLE_SECONDS,
+                    },
+                )
+                result = await cur.fetchone()
+            count = int(result["folded"]) if result else 0
+            folded += count
+            if count < batch_size:
+                break
+        return folded
+
+    async def get_analytics_recent_events(
+        self,
+        hours: int = 24,
+        limit: int = 60,
+    ) -> list[dict[str, Any]]:
+        rows = await self.database.execute_read(
+            _RECENT_EVENTS_SQL,
+            (hours, limit),
+            consistency=ReadConsistency.RELAXED,
+        )
+        return rows or []
+
+    async def cleanup_old_analytics(self, days: int | None = None) -> int:
+        if days is None:
+            days = get_settings().analytics_retention_days
+        async with self.database.transaction() as cur:
+            await cur.execute(_CLEANUP_SQL, (days,))
+            return len(await cur.fetchall())
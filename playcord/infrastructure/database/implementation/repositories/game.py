@@ -12,10 +12,38 @@ from playcord.infrastructure.constants import GAME_TYPES
 from playcord.infrastructure.database.implementation.core.exceptions import (
     DatabaseError,
 )
+from playcord.infrastructure.database.implementation.core.invalidation import (
+    InvalidationTopic,
+    invalidation_bus,
+)
+from playcord.infrastructure.database.implementation.core.migrations import (
+    GAME_REGISTRY_FINGERPRINT,
+    get_migration_hash,
+    record_fingerprint,
+)
 from playcord.infrastructure.database.models import Game, row_to_game
 
 if TYPE_CHECKING:
-    from playcord.infrastructure.database.implementation.database import Database
+    from playcord.infrastructure.database.implementation.database import (
+        AsyncDatabase,
+        Database,
+    )
+
+_UPSERT_GAME_SQL = """
+    INSERT INTO games (game_name, display_name, min_players, max_players,
+                      game_metadata, game_schema_version)
+    VALUES (%s, %s, %s, %s, %s::jsonb, %s)
+    ON CONFLICT (game_name) DO UPDATE SET
+        display_name = EXCLUDED.display_name,
+        min_players = EXCLUDED.min_players,
+        max_players = EXCLUDED.max_players,
+        game_metadata = EXCLUDED.game_metadata,
+        game_schema_version = EXCLUDED.game_schema_version,
+        updated_at = NOW()
+    RETURNING game_id;
+"""
+_GET_GAME_BY_NAME_SQL = "SELECT * FROM games WHERE game_name = %s;"
+_GET_ALL_GAMES_SQL = "SELECT * FROM games;"
 
 
 @dataclass(slots=True)
@@ -38,6 +66,19 @@ class GameRepository:
         self._game_cache_by_id.clear()
         self._game_cache_by_name.clear()
 
+    def forget_game(self, game_name: str | None) -> None:
+        """Drop one game's cache entries (all of them for ``None``).
+
+        Subscribed to :attr:`InvalidationTopic.GAME`, so other processes' writes
+        land here too.
+        """
+        if game_name is None:
+            self.clear_caches()
+            return
+        game = self._game_cache_by_name.pop(game_name, None)
+        if game is not None:
+            self._game_cache_by_id.pop(game.game_id, None)
+
     def register_game(
         self,
         game_name: str,
@@ -47,49 +88,85 @@ class GameRepository:
         game_metadata: dict[str, Any] | None = None,
         game_schema_version: int = 1,
     ) -> int:
-        metadata_json = json.dumps(game_metadata or {})
-        query = """
-            INSERT INTO games (game_name, display_name, min_players, max_players,
-                              game_metadata, game_schema_version)
-            VALUES (%s, %s, %s, %s, %s::jsonb, %s)
-            ON CONFLICT (game_name) DO UPDATE SET
-                display_name = EXCLUDED.display_name,
-                min_players = EXCLUDED.min_players,
-                max_players = EXCLUDED.max_players,
-                game_metadata = EXCLUDED.game_metadata,
-                game_schema_version = EXCLUDED.game_schema_version,
-                updated_at = NOW()
-            RETURNING game_id;
-        """
-        result = self.database.execute_query(
-            query,
+        with self.database.transaction() as cur:
+            game_id = self._upsert_game(
+                cur,
+                game_name=game_name,
+                display_name=display_name,
+                min_players=min_players,
+                max_players=max_players,
+                game_metadata=game_metadata,
+                game_schema_version=game_schema_version,
+            )
+        self._remember_game(
+            game_id,
+            game_name=game_name,
+            display_name=display_name,
+            min_players=min_players,
+            max_players=max_players,
+            game_metadata=game_metadata,
+            game_schema_version=game_schema_version,
+        )
+        return game_id  # type: ignore[return-value]
+
+    @staticmethod
+    def _upsert_game(
+        cur: Any,
+        *,
+        game_name: str,
+        display_name: str,
+        min_players: int,
+        max_players: int,
+        game_metadata: dict[str, Any] | None = None,
+        game_schema_version: int = 1,
+    ) -> int | None:
+        """Upsert one game inside the caller's transaction; returns its id."""
+        cur.execute(
+            _UPSERT_GAME_SQL,
             (
                 game_name,
                 display_name,
                 min_players,
                 max_players,
-                metadata_json,
+                json.dumps(game_metadata or {}),
                 game_schema_version,
             ),
-            fetchone=True,
         )
-        game_id = result["game_id"] if result else None
-        if game_id is not None:
-            self._cache_game(
-                Game(
-                    game_id=game_id,
-                    game_name=game_name,
-                    display_name=display_name,
-                    min_players=min_players,
-                    max_players=max_players,
-                    game_metadata=json.loads(metadata_json),
-                    game_schema_version=game_schema_version,
-                    is_active=True,
-                ),
-            )
-        return game_id  # type: ignore[return-value]
+        result = cur.fetchone()
+        return result["game_id"] if result else None
 
-    def sync_games_from_code(self) -> None:
+    def _remember_game(
+        self,
+        game_id: int | None,
+        *,
+        game_name: str,
+        display_name: str,
+        min_players: int,
+        max_players: int,
+        game_metadata: dict[str, Any] | None = None,
+        game_schema_version: int = 1,
+    ) -> None:
+        """Cache a committed upsert and tell the other processes about it."""
+        if game_id is None:
+            return
+        self._cache_game(
+            Game(
+                game_id=game_id,
+                game_name=game_name,
+                display_name=display_name,
+                min_players=min_players,
+                max_players=max_players,
+                game_metadata=dict(game_metadata or {}),
+                game_schema_version=game_schema_version,
+                is_active=True,
+            ),
+        )
+        invalidation_bus.publish(InvalidationTopic.GAME, game_name)
+
+    @staticmethod
+    def _games_from_code() -> list[dict[str, Any]]:
+        """``register_game`` keyword arguments for every game defined in code."""
+        games: list[dict[str, Any]] = []
         for game_name, (mod_name, cls_name) in GAME_TYPES.items():
             mod = importlib.import_module(mod_name)
             cls = getattr(mod, cls_name)
@@ -111,22 +188,79 @@ class GameRepository:
                 "summary": getattr(metadata, "summary", ""),
                 "description": getattr(metadata, "description", ""),
             }
-            self.register_game(
-                game_name=game_name,
-                display_name=display_name,
-                min_players=min_p,
-                max_players=max_p,
-                game_metadata=meta,
-                game_schema_version=schema_ver,
+            games.append(
+                {
+                    "game_name": game_name,
+                    "display_name": display_name,
+                    "min_players": min_p,
+                    "max_players": max_p,
+                    "game_metadata": meta,
+                    "game_schema_version": schema_ver,
+                },
             )
+        return games
+
+    def sync_games_from_code(self, known: dict[str, str] | None = None) -> bool:
+        """Upsert every game defined in code; returns whether anything was written.
+
+        With ``known`` fingerprints (see ``load_fingerprints``) the upserts are
+        skipped while the hash of the games' metadata matches the stored one.
+        The upserts and the new fingerprint commit together, so a failed sync
+        never leaves a fingerprint for games that were not written. When the
+        upserts are skipped the cache is warmed from the table instead.
+        """
+        games = self._games_from_code()
+        registry_hash = None
+        if known is not None:
+            registry_hash = get_migration_hash(json.dumps(games, sort_keys=True))
+            if known.get(GAME_REGISTRY_FINGERPRINT) == registry_hash:
+                self._warm_cache()
+                return False
+        with self.database.transaction() as cur:
+            game_ids = [self._upsert_game(cur, **game) for game in games]
+            if registry_hash is not None:
+                record_fingerprint(
+                    cur,
+                    GAME_REGISTRY_FINGERPRINT,
+                    f"Game registry ({len(games)} games) synced from code",
+                    registry_hash,
+                )
+        for game_id, game in zip(game_ids, games, strict=True):
+            self._remember_game(game_id, **game)
+        return True
+
+    def _warm_cache(self) -> None:
+        """Cache every registered game with one query."""
+        rows = self.database.execute_query(_GET_ALL_GAMES_SQL, fetchall=True)
+        for row in rows or ():
+            self._cache_game(row_to_game(row))
 
     def get(self, game_name: str) -> Game | None:
         """Get game by name (alias: get_game in legacy)."""
         cached = self._game_cache_by_name.get(game_name)
         if cached is not None:
             return cached
-        query = "SELECT * FROM games WHERE game_name = %s;"
-        result = self.database.execute_query(query, (game_name,), fetchone=True)
+        result = self.database.execute_query(
+            _GET_GAME_BY_NAME_SQL,
+            (game_name,),
+            fetchone=True,
+        )
+        return self._cache_game(row_to_game(result) if result else None)
+
+    async def get_game_async(
+        self,
+        database: AsyncDatabase,
+        game_name: str,
+    ) -> Game | None:
+        """:meth:`get` for the event loop: cache misses query through ``database``."""
+        cached = self._game_cache_by_name.get(game_name)
+        if cached is not None:
+            return cached
+        result = await database.execute_query(
+            _GET_GAME_BY_NAME_SQL,
+            (game_name,),
+            fetchone=True,
+        )
         return self._cache_game(row_to_game(result) if result else None)
 
     def get_by_id(self, game_id: int) -> Game | None:
@@ -148,6 +282,7 @@ class GameRepository:
         self.database.execute_query("DELETE FROM games WHERE game_id = %s;", (game_id,))
         self._game_cache_by_id.pop(game_id, None)
         self._game_cache_by_name.pop(game_name, None)
+        invalidation_bus.publish(InvalidationTopic.GAME, game_name)
 
         self.sync_games_from_code()
         recreated = self.get(game_name)
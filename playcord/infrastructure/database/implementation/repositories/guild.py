@@ -3,11 +3,89 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from playcord.infrastructure.constants import (
+    GUILD_SETTINGS_CACHE_MAX_ENTRIES,
+    GUILD_SETTINGS_CACHE_TTL_SECONDS,
+)
+from playcord.infrastructure.database.implementation.core.cache import TTLCache
+from playcord.infrastructure.database.implementation.core.invalidation import (
+    InvalidationTopic,
+    invalidation_bus,
+)
+from playcord.infrastructure.database.implementation.core.statements import (
+    register_statement,
+)
+
 if TYPE_CHECKING:
-    from playcord.infrastructure.database.implementation.database import Database
+    from playcord.infrastructure.database.implementation.database import (
+        AsyncDatabase,
+        Database,
+    )
+
+_UPSERT_GUILD_SQL = register_statement(
+    "upsert_guild",
+    """
+    INSERT INTO guilds (guild_id, settings)
+    VALUES (%s, %s::jsonb)
+    ON CONFLICT (guild_id) DO UPDATE SET
+        is_active = TRUE,
+        updated_at = NOW();
+""",
+)
+_GET_GUILD_SETTINGS_SQL = register_statement(
+    "get_guild_settings", "SELECT settings FROM guilds WHERE guild_id = %s;"
+)
+_MERGE_GUILD_SETTINGS_SQL = """
+    UPDATE guilds
+    SET settings = COALESCE(settings, '{}'::jsonb) || %s::jsonb,
+        updated_at = NOW()
+    WHERE guild_id = %s;
+"""
+_DELETE_GUILD_SQL = "DELETE FROM guilds WHERE guild_id = %s;"
+
+
+def new_guild_settings_cache() -> TTLCache[int, dict | None]:
+    """Cache of ``guild_id -> settings`` (``None`` for unknown guilds)."""
+    return TTLCache(
+        GUILD_SETTINGS_CACHE_TTL_SECONDS,
+        max_entries=GUILD_SETTINGS_CACHE_MAX_ENTRIES,
+    )
+
+
+def _invalidate_settings(cache: TTLCache[int, dict | None], guild_id: int) -> None:
+    cache.invalidate(guild_id)
+    invalidation_bus.publish(InvalidationTopic.GUILD_SETTINGS, guild_id)
+
+
+def forget_guild_settings(
+    cache: TTLCache[int, dict | None],
+    guild_id: str | None,
+) -> None:
+    """Invalidation bus handler: drop one guild's settings (all for ``None``)."""
+    if guild_id is None:
+        cache.clear()
+    else:
+        cache.invalidate(int(guild_id))
+
+
+def _cached_settings(settings: dict | None) -> dict | None:
+    # Hand out copies so callers cannot mutate the cached entry.
+    return dict(settings) if settings is not None else None
+
+
+def _playcord_channel_from_settings(settings: dict | None) -> int | None:
+    if not settings:
+        return None
+    raw = settings.get("playcord_channel_id")
+    if raw is None:
+        return None
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return None
 
 
 @dataclass(slots=True)
@@ -17,6 +95,10 @@ class GuildRepository:
     players: Any  # PlayerRepository
     games: Any  # GameRepository
     maintenance: Any  # MaintenanceRepository
+    # Shared with AsyncGuildRepository so a write through either side invalidates both.
+    settings_cache: TTLCache[int, dict | None] = field(
+        default_factory=new_guild_settings_cache,
+    )
 
     def create_guild(
         self,
@@ -24,48 +106,38 @@ class GuildRepository:
         settings: dict[str, Any] | None = None,
     ) -> None:
         settings_json = json.dumps(settings or {})
-        query = """
-            INSERT INTO guilds (guild_id, settings)
-            VALUES (%s, %s::jsonb)
-            ON CONFLICT (guild_id) DO UPDATE SET
-                is_active = TRUE,
-                updated_at = NOW();
-        """
-        self.database.execute_query(query, (guild_id, settings_json))
+        self.database.execute_query(_UPSERT_GUILD_SQL, (guild_id, settings_json))
+        _invalidate_settings(self.settings_cache, guild_id)
 
     def get_guild_settings(self, guild_id: int) -> dict | None:
-        query = "SELECT settings FROM guilds WHERE guild_id = %s;"
-        result = self.database.execute_query(query, (guild_id,), fetchone=True)
-        return result["settings"] if result else None
+        found, settings = self.settings_cache.lookup(guild_id)
+        if not found:
+            result = self.database.execute_query(
+                _GET_GUILD_SETTINGS_SQL,
+                (guild_id,),
+                fetchone=True,
+            )
+            settings = result["settings"] if result else None
+            self.settings_cache.put(guild_id, settings)
+        return _cached_settings(settings)
 
     def merge_guild_settings(self, guild_id: int, patch: dict[str, Any]) -> None:
         self.create_guild(guild_id, {})
-        query = """
-            UPDATE guilds
-            SET settings = COALESCE(settings, '{}'::jsonb) || %s::jsonb,
-                updated_at = NOW()
-            WHERE guild_id = %s;
-        """
-        self.database.execute_query(query, (json.dumps(patch), guild_id))
+        self.database.execute_query(
+            _MERGE_GUILD_SETTINGS_SQL,
+            (json.dumps(patch), guild_id),
+        )
+        _invalidate_settings(self.settings_cache, guild_id)
 
     def merge_settings(self, guild_id: int, patch: dict[str, Any]) -> None:
         self.merge_guild_settings(guild_id, patch)
 
     def get_playcord_channel_id(self, guild_id: int) -> int | None:
-        s = self.get_guild_settings(guild_id)
-        if not s:
-            return None
-        raw = s.get("playcord_channel_id")
-        if raw is None:
-            return None
-        try:
-            return int(raw)
-        except (TypeError, ValueError):
-            return None
+        return _playcord_channel_from_settings(self.get_guild_settings(guild_id))
 
     def delete_guild(self, guild_id: int) -> None:
-        query = "DELETE FROM guilds WHERE guild_id = %s;"
-        self.database.execute_query(query, (guild_id,))
+        self.database.execute_query(_DELETE_GUILD_SQL, (guild_id,))
+        _invalidate_settings(self.settings_cache, guild_id)
 
     def reset_guild_data(self, guild_id: int) -> None:
         self.delete_guild(guild_id)
@@ -76,9 +148,68 @@ class GuildRepository:
 
     def reset_all_data(self) -> None:
         self.maintenance.reset_all_data()
+        self.settings_cache.clear()
+        invalidation_bus.publish(InvalidationTopic.GUILD_SETTINGS)
 
     def reset_game_data(self, game_id: int) -> Any:
         return self.games.reset_game_data(game_id)
 
     def reset_user_data(self, user_id: int) -> None:
         self.players.reset_user_data(user_id)
+
+
+@dataclass(slots=True)
+class AsyncGuildRepository:
+    """Asyncio counterpart of :class:`GuildRepository` (settings reads and writes)."""
+
+    database: AsyncDatabase
+    settings_cache: TTLCache[int, dict | None] = field(
+        default_factory=new_guild_settings_cache,
+    )
+
+    async def create_guild(
+        self,
+        guild_id: int,
+        settings: dict[str, Any] | None = None,
+    ) -> None:
+        await self.database.execute_query(
+            _UPSERT_GUILD_SQL,
+            (guild_id, json.dumps(settings or {})),
+        )
+        _invalidate_settings(self.settings_cache, guild_id)
+
+    async def get_guild_settings(self, guild_id: int) -> dict | None:
+        found, settings = self.settings_cache.lookup(guild_id)
+        if not found:
+            result = await self.database.execute_query(
+                _GET_GUILD_SETTINGS_SQL,
+                (guild_id,),
+                fetchone=True,
+            )
+            settings = result["settings"] if result else None
+            self.settings_cache.put(guild_id, settings)
+        return _cached_settings(settings)
+
+    async def merge_guild_settings(
+        self,
+        guild_id: int,
+        patch: dict[str, Any],
+    ) -> None:
+        await self.create_guild(guild_id, {})
+        await self.database.execute_query(
+            _MERGE_GUILD_SETTINGS_SQL,
+            (json.dumps(patch), guild_id),
+        )
+        _invalidate_settings(self.settings_cache, guild_id)
+
+    async def merge_settings(self, guild_id: int, patch: dict[str, Any]) -> None:
+        await self.merge_guild_settings(guild_id, patch)
+
+    async def get_playcord_channel_id(self, guild_id: int) -> int | None:
+        return _playcord_channel_from_settings(
+            await self.get_guild_settings(guild_id),
+        )
+
+    async def delete_guild(self, guild_id: int) -> None:
+        await self.database.execute_query(_DELETE_GUILD_SQL, (guild_id,))
+        _invalidate_settings(self.settings_cache, guild_id)
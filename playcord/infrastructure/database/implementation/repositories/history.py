@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import zlib
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -12,7 +13,14 @@ except ImportError:
     pg_errors = None  # type: ignore[assignment]
 
 from playcord.core.generators import generate_match_code
+from playcord.infrastructure.database.implementation.core.replica import (
+    ReadConsistency,
+)
+from playcord.infrastructure.database.implementation.core.statements import (
+    register_statement,
+)
 from playcord.infrastructure.database.models import (
+    HistoryCursor,
     Match,
     MatchStatus,
     Participant,
@@ -21,7 +29,526 @@ from playcord.infrastructure.database.models import (
 )
 
 if TYPE_CHECKING:
-    from playcord.infrastructure.database.implementation.database import Database
+    from collections.abc import Sequence
+
+    from playcord.infrastructure.database.implementation.database import (
+        AsyncDatabase,
+        Database,
+    )
+
+# SQL shared by the sync and asyncio repositories below.
+
+_GET_MATCH_SQL = register_statement(
+    "get_match", "SELECT * FROM matches WHERE match_id = %s;"
+)
+_GET_MATCH_BY_CODE_SQL = register_statement(
+    "get_match_by_code", "SELECT * FROM matches WHERE lower(match_code) = %s;"
+)
+
+_UPDATE_STATUS_WITH_METADATA_SQL = """
+    UPDATE matches
+    SET status = %s,
+        updated_at = NOW(),
+        ended_at = CASE WHEN %s = 'in_progress' THEN ended_at ELSE COALESCE(ended_at, NOW()) END,
+        metadata = COALESCE(metadata, '{}'::jsonb) || %s::jsonb
+    WHERE match_id = %s;
+"""
+_UPDATE_STATUS_SQL = """
+    UPDATE matches
+    SET status = %s,
+        updated_at = NOW(),
+        ended_at = CASE WHEN %s = 'in_progress' THEN ended_at ELSE COALESCE(ended_at, NOW()) END
+    WHERE match_id = %s;
+"""
+
+_MERGE_OUTCOME_DISPLAY_SQL = """
+    UPDATE matches
+    SET metadata = (COALESCE(metadata, '{}'::jsonb) - 'outcome_summary')
+        || %s::jsonb
+    WHERE match_id = %s;
+"""
+
+_HUMAN_USER_IDS_SQL = """
+    SELECT mp.user_id
+    FROM match_participants mp
+    JOIN users u ON u.user_id = mp.user_id
+    WHERE mp.match_id = %s AND u.is_bot = FALSE AND mp.is_deleted = FALSE
+    ORDER BY mp.player_number;
+"""
+
+# Codes are tried in array order; the first one not already taken is used.
+_FIRST_FREE_MATCH_CODE_SQL = """
+    SELECT c.code
+    FROM unnest(%s::text[]) WITH ORDINALITY AS c(code, ord)
+    WHERE NOT EXISTS (
+        SELECT 1 FROM matches m
+        WHERE m.match_code IS NOT NULL AND lower(m.match_code) = lower(c.code)
+    )
+    ORDER BY c.ord
+    LIMIT 1;
+"""
+# Set-based match creation: guild + users upsert, match insert and participant
+# rows in one statement. Returns no row when every candidate code is taken.
+_CREATE_MATCH_SQL = register_statement(
+    "create_match",
+    """
+    WITH guild_row AS (
+        INSERT INTO guilds (guild_id, settings)
+        VALUES (%(guild_id)s, '{}'::jsonb)
+        ON CONFLICT (guild_id) DO UPDATE SET
+            is_active = TRUE,
+            updated_at = NOW()
+    ),
+    user_rows AS (
+        INSERT INTO users (user_id, username, is_bot)
+        SELECT DISTINCT u.user_id, 'Unknown', FALSE
+        FROM unnest(%(user_ids)s::bigint[]) AS u(user_id)
+        ON CONFLICT (user_id) DO NOTHING
+    ),
+    free_code AS (
+        SELECT c.code
+        FROM unnest(%(codes)s::text[]) WITH ORDINALITY AS c(code, ord)
+        WHERE NOT EXISTS (
+            SELECT 1 FROM matches m
+            WHERE m.match_code IS NOT NULL AND lower(m.match_code) = lower(c.code)
+        )
+        ORDER BY c.ord
+        LIMIT 1
+    ),
+    new_match AS (
+        INSERT INTO matches (match_id, game_id, guild_id, channel_id, thread_id,
+            game_config, status, match_code, player_count)
+        SELECT %(match_id)s, %(game_id)s, %(guild_id)s, %(channel_id)s,
+            %(thread_id)s, %(game_config)s::jsonb, 'in_progress', free_code.code,
+            cardinality(%(user_ids)s::bigint[])
+        FROM free_code
+        RETURNING match_id, match_code
+    ),
+    new_participants AS (
+        INSERT INTO match_participants (match_id, user_id, player_number)
+        SELECT new_match.match_id, p.user_id, p.player_number
+        FROM new_match,
+            unnest(%(user_ids)s::bigint[]) WITH ORDINALITY AS p(user_id, player_number)
+    )
+    SELECT match_id, match_code FROM new_match;
+""",
+)
+
+_LOCK_MATCH_FOR_END_SQL = """
+    SELECT game_id, guild_id, status
+    FROM matches
+    WHERE match_id = %s
+    FOR UPDATE;
+"""
+_UPDATE_PARTICIPANT_RESULT_SQL = """
+    UPDATE match_participants
+    SET final_ranking = %s,
+        score = %s
+    WHERE match_id = %s AND user_id = %s;
+"""
+_COMPLETE_MATCH_SQL = """
+    UPDATE matches
+    SET status = 'completed',
+        ended_at = NOW(),
+        metadata = COALESCE(metadata, '{}'::jsonb) || %s::jsonb,
+        updated_at = NOW()
+    WHERE match_id = %s;
+"""
+
+_GET_PARTICIPANTS_SQL = register_statement(
+    "get_participants",
+    """
+    SELECT * FROM match_participants
+    WHERE match_id = %s AND is_deleted = FALSE
+    ORDER BY player_number;
+""",
+)
+
+_NEXT_MOVE_NUMBER_SQL = """
+    SELECT COALESCE(MAX(move_number), 0) + 1 as next_move_num
+    FROM match_moves
+    WHERE match_id = %s;
+"""
+_INSERT_MOVE_SQL = """
+    INSERT INTO match_moves
+        (match_id, user_id, move_number, kind, move_data, game_state_after,
+         time_taken_ms, is_game_affecting)
+    VALUES (%s, %s, %s, %s, %s::jsonb, %s::jsonb, %s, %s);
+"""
+# Single-statement insert for callers that number moves themselves. match_moves is
+# partitioned on created_at, so (match_id, move_number) cannot carry a UNIQUE
+# constraint; the NOT EXISTS probe (idx_match_moves_match_sequence) stands in.
+_INSERT_NUMBERED_MOVE_SQL = register_statement(
+    "insert_numbered_move",
+    """
+    INSERT INTO match_moves
+        (match_id, user_id, move_number, kind, move_data, game_state_after,
+         time_taken_ms, is_game_affecting)
+    SELECT %s, %s, %s, %s, %s::jsonb, %s::jsonb, %s, %s
+    WHERE NOT EXISTS (
+        SELECT 1 FROM match_moves WHERE match_id = %s AND move_number = %s
+    );
+""",
+)
+_MOVE_COUNT_SQL = "SELECT COUNT(*) as count FROM match_moves WHERE match_id = %s AND is_deleted = FALSE;"
+
+# Per-user totals come from the user_game_stats rollup (kept current by
+# apply_user_game_stats whenever a match enters or leaves a finished status).
+_FINISHED_STATUSES = frozenset(
+    {
+        MatchStatus.COMPLETED.value,
+        MatchStatus.INTERRUPTED.value,
+        MatchStatus.ABANDONED.value,
+    },
+)
+_APPLY_USER_GAME_STATS_SQL = "SELECT apply_user_game_stats(%s::bigint[], %s);"
+_COUNT_MATCHES_FOR_USER_SQL = register_statement(
+    "count_matches_for_user",
+    """
+    SELECT COALESCE(SUM(matches_played), 0) AS total_matches
+    FROM user_game_stats
+    WHERE user_id = %s AND guild_id = %s;
+""",
+)
+_USER_GAME_STATS_SQL = register_statement(
+    "user_game_stats",
+    """
+    SELECT
+        s.game_id,
+        g.game_name AS game_key,
+        g.display_name AS game_name,
+        s.matches_played,
+        s.wins,
+        s.draws,
+        s.losses,
+        s.interrupted,
+        s.last_played_at
+    FROM user_game_stats s
+    JOIN games g ON g.game_id = s.game_id
+    WHERE s.user_id = %s AND s.guild_id = %s AND s.matches_played > 0
+    ORDER BY s.matches_played DESC, s.last_played_at DESC;
+""",
+)
+_INTERRUPT_STALE_MATCHES_SQL = """
+    UPDATE matches
+    SET status = 'interrupted',
+        ended_at = COALESCE(ended_at, NOW()),
+        updated_at = NOW(),
+        metadata = COALESCE(metadata, '{}'::jsonb) || %s::jsonb
+    WHERE status = 'in_progress'
+    RETURNING match_id;
+"""
+
+# The archive row (if any) and the live rows in one statement, so both come
+# from the same snapshot: read separately, an archive_replay committing in
+# between would move rows out of replay_events after the archive was read.
+# Read from the primary: replay viewers cache the frames built from these
+# rows, and a lagging replica can still be missing a just-finished match's
+# final flush.
+_GET_REPLAY_STREAM_SQL = register_statement(
+    "get_replay_stream",
+    """
+    SELECT FALSE AS is_live, encoding, data,
+        last_sequence AS sequence_number, NULL::varchar AS event_type,
+        NULL::bigint AS actor_user_id, NULL::jsonb AS payload
+    FROM replay_archives
+    WHERE match_id = %(match_id)s
+    UNION ALL
+    SELECT TRUE, NULL, NULL, sequence_number, event_type, actor_user_id, payload
+    FROM replay_events
+    WHERE match_id = %(match_id)s
+    ORDER BY is_live ASC, sequence_number ASC;
+""",
+)
+_GET_REPLAY_ARCHIVE_SQL = register_statement(
+    "get_replay_archive",
+    """
+    SELECT encoding, last_sequence, data
+    FROM replay_archives
+    WHERE match_id = %s;
+""",
+)
+_LOCK_MATCH_SQL = "SELECT 1 FROM matches WHERE match_id = %s FOR UPDATE;"
+# Archived events no longer have replay_events rows, so numbering continues
+# after the archive's last sequence as well.
+_NEXT_REPLAY_SEQUENCE_SQL = """
+    SELECT GREATEST(
+        (SELECT COALESCE(MAX(sequence_number), 0)
+         FROM replay_events WHERE match_id = %(match_id)s),
+        (SELECT COALESCE(MAX(last_sequence), 0)
+         FROM replay_archives WHERE match_id = %(match_id)s)
+    ) + 1 AS next_sequence_number;
+"""
+_LOCK_REPLAY_EVENTS_SQL = """
+    SELECT sequence_number, event_type, actor_user_id, payload
+    FROM replay_events
+    WHERE match_id = %s
+    ORDER BY sequence_number ASC
+    FOR UPDATE;
+"""
+_UPSERT_REPLAY_ARCHIVE_SQL = """
+    INSERT INTO replay_archives
+        (match_id, encoding, event_count, last_sequence, uncompressed_bytes, data)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON CONFLICT (match_id) DO UPDATE
+    SET encoding           = EXCLUDED.encoding,
+        event_count        = EXCLUDED.event_count,
+        last_sequence      = EXCLUDED.last_sequence,
+        uncompressed_bytes = EXCLUDED.uncompressed_bytes,
+        data               = EXCLUDED.data,
+        archived_at        = NOW();
+"""
+_DELETE_ARCHIVED_REPLAY_EVENTS_SQL = """
+    DELETE FROM replay_events
+    WHERE match_id = %s AND sequence_number <= %s;
+"""
+_INSERT_REPLAY_EVENT_SQL = register_statement(
+    "insert_replay_event",
+    """
+    INSERT INTO replay_events (
+        match_id, sequence_number, event_type, actor_user_id, payload
+    )
+    VALUES (%s, %s, %s, %s, %s::jsonb);
+""",
+)
+_INSERT_REPLAY_EVENTS_BATCH_SQL = register_statement(
+    "insert_replay_events_batch",
+    """
+    INSERT INTO replay_events (
+        match_id, sequence_number, event_type, actor_user_id, payload
+    )
+    SELECT %s, e.sequence_number, e.event_type, e.actor_user_id, e.payload::jsonb
+    FROM unnest(%s::integer[], %s::text[], %s::bigint[], %s::text[])
+        AS e(sequence_number, event_type, actor_user_id, payload);
+""",
+)
+
+
+_REPLAY_ARCHIVE_ENCODING = "jsonl+zlib"
+_REPLAY_ARCHIVE_COMPRESSION_LEVEL = 6
+
+# Candidate codes checked per statement, and statements tried before giving up
+# (a retry only happens when a concurrent insert wins the race for a code).
+_MATCH_CODE_CANDIDATES = 8
+_MATCH_CODE_ATTEMPTS = 6
+
+
+def _normalize_match_code(code: str | None) -> str:
+    return (code or "").strip().lower()
+
+
+def _outcome_display_patch(
+    summaries: dict[int, str] | None,
+    global_summary: str | None,
+) -> dict[str, Any]:
+    patch: dict[str, Any] = {}
+    if global_summary and str(global_summary).strip():
+        patch["outcome_global_summary"] = str(global_summary).strip()
+    if summaries is not None:
+        patch["outcome_summaries"] = {str(uid): text for uid, text in summaries.items()}
+    return patch
+
+
+def _user_history_query(
+    user_id: int,
+    guild_id: int | None,
+    game_id: int | None,
+    limit: int,
+    offset: int,
+    after: HistoryCursor | None = None,
+) -> tuple[str, tuple[Any, ...]]:
+    """Newest-first history; with ``after`` the page starts past that keyset row."""
+    query = """
+        SELECT
+            m.match_id,
+            m.match_code,
+            m.game_id,
+            g.game_name as game_key,
+            g.display_name as game_name,
+            m.ended_at,
+            m.status,
+            m.metadata,
+            mp.final_ranking as final_ranking,
+            mp.player_number,
+            m.player_count
+        FROM match_participants mp
+        JOIN matches m ON mp.match_id = m.match_id
+        JOIN games g ON m.game_id = g.game_id
+        WHERE mp.user_id = %s
+          AND m.status IN ('completed', 'interrupted', 'abandoned')
+    """
+    params: list[Any] = [user_id]
+    if guild_id is not None:
+        query += " AND m.guild_id = %s"
+        params.append(guild_id)
+    if game_id is not None:
+        query += " AND m.game_id = %s"
+        params.append(game_id)
+    if after is not None:
+        query += " AND (m.ended_at, m.match_id) < (%s, %s)"
+        params.extend([after.ended_at, after.match_id])
+    query += " ORDER BY m.ended_at DESC, m.match_id DESC LIMIT %s"
+    params.append(limit)
+    if offset and after is None:
+        query += " OFFSET %s"
+        params.append(offset)
+    return query + ";", tuple(params)
+
+
+def _move_params(
+    match_id: int,
+    user_id: int | None,
+    move_number: int,
+    kind: str,
+    move_data: dict[str, Any] | None,
+    game_state_after: dict[str, Any] | None,
+    time_taken_ms: int | None,
+    is_game_affecting: bool,
+) -> tuple[Any, ...]:
+    return (
+        match_id,
+        user_id,
+        move_number,
+        kind,
+        json.dumps(move_data) if move_data else None,
+        json.dumps(game_state_after) if game_state_after else None,
+        time_taken_ms,
+        is_game_affecting,
+    )
+
+
+def _is_unique_violation(exc: Exception) -> bool:
+    return bool(pg_errors and isinstance(exc, pg_errors.UniqueViolation))
+
+
+def _candidate_match_codes(
+    attempt: int,
+    preset_match_code: str | None,
+) -> list[str]:
+    codes = [generate_match_code() for _ in range(_MATCH_CODE_CANDIDATES)]
+    if attempt == 0 and preset_match_code is not None:
+        codes[0] = preset_match_code
+    return codes
+
+
+def _create_match_params(
+    game_id: int,
+    guild_id: int,
+    channel_id: int,
+    thread_id: int | None,
+    participants: list[int],
+    game_config: dict[str, Any] | None,
+    match_id: int,
+    codes: list[str],
+) -> dict[str, Any]:
+    return {
+        "match_id": match_id,
+        "game_id": game_id,
+        "guild_id": guild_id,
+        "channel_id": channel_id,
+        "thread_id": thread_id,
+        "game_config": json.dumps(game_config or {}),
+        "user_ids": [int(user_id) for user_id in participants],
+        "codes": codes,
+    }
+
+
+def _rows_to_replay_events(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    events: list[dict[str, Any]] = []
+    for row in rows:
+        payload = dict(row.get("payload") or {})
+        event_type = str(
+            row.get("event_type") or payload.pop("event_type", "event"),
+        )
+        payload["type"] = event_type
+        actor_user_id = row.get("actor_user_id")
+        if actor_user_id is not None and "user_id" not in payload:
+            payload["user_id"] = actor_user_id
+        events.append(payload)
+    return events
+
+
+def _pack_replay_rows(rows: Sequence[dict[str, Any]]) -> tuple[bytes, int]:
+    """Compress replay rows as JSON lines; returns ``(blob, uncompressed size)``."""
+    text = "".join(
+        json.dumps(
+            {
+                "sequence_number": int(row["sequence_number"]),
+                "event_type": row["event_type"],
+                "actor_user_id": row.get("actor_user_id"),
+                "payload": row.get("payload") or {},
+            },
+            separators=(",", ":"),
+        )
+        + "\n"
+        for row in rows
+    )
+    raw = text.encode("utf-8")
+    return zlib.compress(raw, _REPLAY_ARCHIVE_COMPRESSION_LEVEL), len(raw)
+
+
+def _unpack_replay_archive(archive: dict[str, Any] | None) -> list[dict[str, Any]]:
+    if not archive:
+        return []
+    encoding = archive.get("encoding")
+    if encoding != _REPLAY_ARCHIVE_ENCODING:
+        msg = f"Unsupported replay archive encoding {encoding!r}"
+        raise ValueError(msg)
+    text = zlib.decompress(bytes(archive["data"])).decode("utf-8")
+    return [json.loads(line) for line in text.splitlines() if line]
+
+
+def _split_replay_stream(
+    rows: list[dict[str, Any]],
+) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+    """Split :data:`_GET_REPLAY_STREAM_SQL` rows into (archive row, live rows)."""
+    if rows and not rows[0]["is_live"]:
+        return rows[0], rows[1:]
+    return None, rows
+
+
+def _merge_replay_rows(
+    archived: list[dict[str, Any]],
+    rows: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Archived rows first, then live rows numbered after them (if any)."""
+    if not archived:
+        return rows
+    last = archived[-1]["sequence_number"]
+    return archived + [row for row in rows if row["sequence_number"] > last]
+
+
+def _archive_payload(
+    match_id: int,
+    rows: list[dict[str, Any]],
+    archive: dict[str, Any] | None,
+) -> tuple[tuple[Any, ...], int]:
+    """Upsert parameters for ``rows`` merged into ``archive``, and the last sequence."""
+    merged = _merge_replay_rows(_unpack_replay_archive(archive), rows)
+    blob, raw_size = _pack_replay_rows(merged)
+    last_sequence = int(merged[-1]["sequence_number"])
+    params = (
+        match_id,
+        _REPLAY_ARCHIVE_ENCODING,
+        len(merged),
+        last_sequence,
+        raw_size,
+        blob,
+    )
+    return params, last_sequence
+
+
+def _split_replay_event(event: dict[str, Any]) -> tuple[str, int | None, str]:
+    """Split a replay dict into (event_type, actor_user_id, payload JSON)."""
+    payload = dict(event or {})
+    event_type = str(payload.pop("type", "event") or "event")
+    actor_user_id = payload.pop("user_id", None)
+    if actor_user_id is not None:
+        try:
+            actor_user_id = int(actor_user_id)
+        except (TypeError, ValueError):
+            actor_user_id = None
+    return event_type, actor_user_id, json.dumps(dict(payload or {}))
 
 
 @dataclass(slots=True)
@@ -35,16 +562,18 @@ class MatchRepository:
         return self.get_match(match_id)
 
     def get_match(self, match_id: int) -> Match | None:
-        query = "SELECT * FROM matches WHERE match_id = %s;"
-        result = self.database.execute_query(query, (match_id,), fetchone=True)
+        result = self.database.execute_query(_GET_MATCH_SQL, (match_id,), fetchone=True)
         return row_to_match(result) if result else None
 
     def get_match_by_code(self, code: str) -> Match | None:
-        c = (code or "").strip().lower()
+        c = _normalize_match_code(code)
         if not c:
             return None
-        query = "SELECT * FROM matches WHERE lower(match_code) = %s;"
-        result = self.database.execute_query(query, (c,), fetchone=True)
+        result = self.database.execute_query(
+            _GET_MATCH_BY_CODE_SQL,
+            (c,),
+            fetchone=True,
+        )
         return row_to_match(result) if result else None
 
     def get_by_code(self, code: str) -> Match | None:
@@ -56,27 +585,21 @@ class MatchRepository:
         status: str,
         metadata_patch: dict[str, Any] | None = None,
     ) -> None:
-        if metadata_patch:
-            payload = json.dumps(metadata_patch)
-            query = """
-                UPDATE matches
-                SET status = %s,
-                    updated_at = NOW(),
-                    ended_at = CASE WHEN %s = 'in_progress' THEN ended_at ELSE COALESCE(ended_at, NOW()) END,
-                    metadata = COALESCE(metadata, '{}'::jsonb) || %s::jsonb
-                WHERE match_id = %s;
-            """
-            self.database.execute_query(query, (status, status, payload, match_id))
-            return
-
-        query = """
-            UPDATE matches
-            SET status = %s,
-                updated_at = NOW(),
-                ended_at = CASE WHEN %s = 'in_progress' THEN ended_at ELSE COALESCE(ended_at, NOW()) END
-            WHERE match_id = %s;
-        """
-        self.database.execute_query(query, (status, status, match_id))
+        with self.database.transaction() as cur:
+            cur.execute(_LOCK_MATCH_FOR_END_SQL, (match_id,))
+            match = cur.fetchone()
+            restat = match is not None and match["status"] != status
+            if restat and match["status"] in _FINISHED_STATUSES:
+                cur.execute(_APPLY_USER_GAME_STATS_SQL, ([match_id], -1))
+            if metadata_patch:
+                cur.execute(
+                    _UPDATE_STATUS_WITH_METADATA_SQL,
+                    (status, status, json.dumps(metadata_patch), match_id),
+                )
+            else:
+                cur.execute(_UPDATE_STATUS_SQL, (status, status, match_id))
+            if restat and status in _FINISHED_STATUSES:
+                cur.execute(_APPLY_USER_GAME_STATS_SQL, ([match_id], 1))
 
     def update_status(
         self,
@@ -89,19 +612,12 @@ class MatchRepository:
 
     def interrupt_stale_matches(self, reason: str = "bot_restart") -> int:
         payload = json.dumps({"interrupt_reason": reason})
-        query = """
-            UPDATE matches
-            SET status = 'interrupted',
-                ended_at = COALESCE(ended_at, NOW()),
-                updated_at = NOW(),
-                metadata = COALESCE(metadata, '{}'::jsonb) || %s::jsonb
-            WHERE status = 'in_progress';
-        """
-        with self.database.get_connection() as conn, conn.cursor() as cur:
-            cur.execute(query, (payload,))
-            count = cur.rowcount
-            conn.commit()
-            return int(count) if count is not None else 0
+        with self.database.transaction() as cur:
+            cur.execute(_INTERRUPT_STALE_MATCHES_SQL, (payload,))
+            match_ids = [row["match_id"] for row in cur.fetchall()]
+            if match_ids:
+                cur.execute(_APPLY_USER_GAME_STATS_SQL, (match_ids, 1))
+        return len(match_ids)
 
     def merge_match_metadata_outcome_display(
         self,
@@ -110,41 +626,31 @@ class MatchRepository:
         summaries: dict[int, str] | None = None,
         global_summary: str | None = None,
     ) -> None:
-        patch: dict[str, Any] = {}
-        if global_summary and str(global_summary).strip():
-            patch["outcome_global_summary"] = str(global_summary).strip()
-        if summaries is not None:
-            patch["outcome_summaries"] = {
-                str(uid): text for uid, text in summaries.items()
-            }
+        patch = _outcome_display_patch(summaries, global_summary)
         if not patch:
             return
-        payload = json.dumps(patch)
-        query = """
-            UPDATE matches
-            SET metadata = (COALESCE(metadata, '{}'::jsonb) - 'outcome_summary')
-                || %s::jsonb
-            WHERE match_id = %s;
-        """
-        self.database.execute_query(query, (payload, match_id))
+        self.database.execute_query(
+            _MERGE_OUTCOME_DISPLAY_SQL,
+            (json.dumps(patch), match_id),
+        )
 
     def get_match_human_user_ids_ordered(self, match_id: int) -> list[int]:
-        query = """
-            SELECT mp.user_id
-            FROM match_participants mp
-            JOIN users u ON u.user_id = mp.user_id
-            WHERE mp.match_id = %s AND u.is_bot = FALSE AND mp.is_deleted = FALSE
-            ORDER BY mp.player_number;
-        """
-        rows = self.database.execute_query(query, (match_id,), fetchall=True) or []
+        rows = (
+            self.database.execute_query(_HUMAN_USER_IDS_SQL, (match_id,), fetchall=True)
+            or []
+        )
         return [int(r["user_id"]) for r in rows]
 
     def ensure_unique_match_code(self) -> str:
         """Reserve an unused public match code (may race with concurrent inserts)."""
-        for _ in range(48):
-            code = generate_match_code()
-            if self.get_match_by_code(code) is None:
-                return code
+        for attempt in range(_MATCH_CODE_ATTEMPTS):
+            row = self.database.execute_query(
+                _FIRST_FREE_MATCH_CODE_SQL,
+                (_candidate_match_codes(attempt, None),),
+                fetchone=True,
+            )
+            if row:
+                return row["code"]
         msg = "Could not allocate a unique match_code"
         raise RuntimeError(msg)
 
@@ -160,58 +666,34 @@ class MatchRepository:
         match_id: int,
         preset_match_code: str | None = None,
     ) -> tuple[int, str]:
-        self.guilds.create_guild(guild_id)
-        for user_id in participants:
-            self.users.create_user(user_id)
+        """Create the match, its guild/users and participants in one statement.
 
-        config_json = json.dumps(game_config or {})
+        Code collisions with existing matches are resolved inside the statement;
+        only a concurrent insert taking the same code forces another attempt.
+        """
         last_err: Exception | None = None
-        for attempt in range(48):
-            match_code = (
-                preset_match_code
-                if attempt == 0 and preset_match_code is not None
-                else generate_match_code()
+        for attempt in range(_MATCH_CODE_ATTEMPTS):
+            params = _create_match_params(
+                game_id,
+                guild_id,
+                channel_id,
+                thread_id,
+                participants,
+                game_config,
+                match_id,
+                _candidate_match_codes(attempt, preset_match_code),
             )
             try:
                 with self.database.transaction() as cur:
-                    cur.execute(
-                        """
-                        INSERT INTO matches (match_id, game_id, guild_id, channel_id, thread_id,
-                            game_config, status, match_code)
-                        VALUES (%s, %s, %s, %s, %s, %s::jsonb, 'in_progress', %s)
-                        RETURNING match_id;
-                        """,
-                        (
-                            match_id,
-                            game_id,
-                            guild_id,
-                            channel_id,
-                            thread_id,
-                            config_json,
-                            match_code,
-                        ),
-                    )
-                    result = cur.fetchone()
-                    resolved_match_id = result["match_id"]
-
-                    for idx, user_id in enumerate(participants, start=1):
-                        cur.execute(
-                            """
-                            INSERT INTO match_participants
-                                (match_id, user_id, player_number)
-                            VALUES (%s, %s, %s);
-                            """,
-                            (resolved_match_id, user_id, idx),
-                        )
-                return resolved_match_id, match_code
+                    cur.execute(_CREATE_MATCH_SQL, params)
+                    row = cur.fetchone()
             except Exception as e:
-                if pg_errors and isinstance(
-                    e,
-                    pg_errors.UniqueViolation,
-                ):  # type: ignore[misc]
+                if _is_unique_violation(e):
                     last_err = e
                     continue
                 raise
+            if row:
+                return row["match_id"], row["match_code"]
         msg = "Could not allocate a unique match_code"
         raise RuntimeError(msg) from last_err
 
@@ -223,15 +705,7 @@ class MatchRepository:
     ) -> None:
         metadata_patch_json = json.dumps({"final_state": final_state})
         with self.database.transaction() as cur:
-            cur.execute(
-                """
-                SELECT game_id, guild_id, status
-                FROM matches
-                WHERE match_id = %s
-                FOR UPDATE;
-                """,
-                (match_id,),
-            )
+            cur.execute(_LOCK_MATCH_FOR_END_SQL, (match_id,))
             match = cur.fetchone()
             if not match:
                 msg = f"Match {match_id} not found"
@@ -239,15 +713,12 @@ class MatchRepository:
             if match["status"] == MatchStatus.COMPLETED.value:
                 msg = f"Match {match_id} is already completed"
                 raise ValueError(msg)
+            if match["status"] in _FINISHED_STATUSES:
+                cur.execute(_APPLY_USER_GAME_STATS_SQL, ([match_id], -1))
 
             for user_id, result in results.items():
                 cur.execute(
-                    """
-                    UPDATE match_participants
-                    SET final_ranking = %s,
-                        score = %s
-                    WHERE match_id = %s AND user_id = %s;
-                    """,
+                    _UPDATE_PARTICIPANT_RESULT_SQL,
                     (
                         result["ranking"],
                         result.get("score"),
@@ -256,25 +727,15 @@ class MatchRepository:
                     ),
                 )
 
-            cur.execute(
-                """
-                UPDATE matches
-                SET status = 'completed',
-                    ended_at = NOW(),
-                    metadata = COALESCE(metadata, '{}'::jsonb) || %s::jsonb,
-                    updated_at = NOW()
-                WHERE match_id = %s;
-                """,
-                (metadata_patch_json, match_id),
-            )
+            cur.execute(_COMPLETE_MATCH_SQL, (metadata_patch_json, match_id))
+            cur.execute(_APPLY_USER_GAME_STATS_SQL, ([match_id], 1))
 
     def get_participants(self, match_id: int) -> list[Participant]:
-        query = """
-            SELECT * FROM match_participants
-            WHERE match_id = %s AND is_deleted = FALSE
-            ORDER BY player_number;
-        """
-        results = self.database.execute_query(query, (match_id,), fetchall=True)
+        results = self.database.execute_query(
+            _GET_PARTICIPANTS_SQL,
+            (match_id,),
+            fetchall=True,
+        )
         return [row_to_participant(row) for row in results] if results else []
 
     def record_move(
@@ -289,38 +750,30 @@ class MatchRepository:
         kind: str = "move",
     ) -> None:
         _ = move_number
-        move_json = json.dumps(move_data) if move_data else None
-        state_json = json.dumps(game_state_after) if game_state_after else None
-        query_next = """
-            SELECT COALESCE(MAX(move_number), 0) + 1 as next_move_num
-            FROM match_moves
-            WHERE match_id = %s;
-        """
-        result = self.database.execute_query(query_next, (match_id,), fetchone=True)
+        result = self.database.execute_query(
+            _NEXT_MOVE_NUMBER_SQL,
+            (match_id,),
+            fetchone=True,
+        )
         auto_sequence = result["next_move_num"] if result else 1
-        query = """
-            INSERT INTO match_moves
-                (match_id, user_id, move_number, kind, move_data, game_state_after,
-                 time_taken_ms, is_game_affecting)
-            VALUES (%s, %s, %s, %s, %s::jsonb, %s::jsonb, %s, %s);
-        """
         self.database.execute_query(
-            query,
-            (
+            _INSERT_MOVE_SQL,
+            _move_params(
                 match_id,
                 user_id,
                 auto_sequence,
                 kind,
-                move_json,
-                state_json,
+                move_data,
+                game_state_after,
                 time_taken_ms,
                 is_game_affecting,
             ),
         )
 
     def get_move_count(self, match_id: int) -> int:
-        query = "SELECT COUNT(*) as count FROM match_moves WHERE match_id = %s AND is_deleted = FALSE;"
-        result = self.database.execute_query(query, (match_id,), fetchone=True)
+        result = self.database.execute_query(
+            _MOVE_COUNT_SQL, (match_id,), fetchone=True
+        )
         return result["count"] if result else 0
 
     def get_user_match_history(
@@ -330,39 +783,17 @@ class MatchRepository:
         game_id: int | None = None,
         limit: int = 10,
         offset: int = 0,
+        after: HistoryCursor | None = None,
     ) -> list[dict[str, Any]]:
-        query = """
-            SELECT
-                m.match_id,
-                m.match_code,
-                m.game_id,
-                g.game_name as game_key,
-                g.display_name as game_name,
-                m.ended_at,
-                m.status,
-                m.metadata,
-                mp.final_ranking as final_ranking,
-                mp.player_number,
-                COUNT(*) OVER (PARTITION BY m.match_id) as player_count
-            FROM match_participants mp
-            JOIN matches m ON mp.match_id = m.match_id
-            JOIN games g ON m.game_id = g.game_id
-            WHERE mp.user_id = %s
-              AND m.status IN ('completed', 'interrupted', 'abandoned')
-        """
-        params: list[Any] = [user_id]
-        if guild_id is not None:
-            query += " AND m.guild_id = %s"
-            params.append(guild_id)
-        if game_id is not None:
-            query += " AND m.game_id = %s"
-            params.append(game_id)
-        query += """
-            ORDER BY m.ended_at DESC
-            LIMIT %s OFFSET %s;
-        """
-        params.extend([limit, offset])
-        results = self.database.execute_query(query, tuple(params), fetchall=True)
+        query, params = _user_history_query(
+            user_id,
+            guild_id,
+            game_id,
+            limit,
+            offset,
+            after,
+        )
+        results = self.database.execute_read(query, params)
         return results or []
 
     def get_history_for_user(
@@ -373,13 +804,16 @@ class MatchRepository:
         game_id: int | None = None,
         limit: int = 20,
         offset: int = 0,
+        after: HistoryCursor | None = None,
     ) -> list[dict[str, Any]]:
+        """History page; pass ``after`` (keyset) instead of ``offset`` to page on."""
         return self.get_user_match_history(
             user_id,
             guild_id,
             game_id=game_id,
             limit=limit,
             offset=offset,
+            after=after,
         )
 
     def count_matches_for_user(
@@ -387,17 +821,21 @@ class MatchRepository:
         user_id: int,
         guild_id: int,
     ) -> int:
-        query = """
-            SELECT COUNT(DISTINCT m.match_id) AS total_matches
-            FROM match_participants mp
-            JOIN matches m ON mp.match_id = m.match_id
-            WHERE mp.user_id = %s AND m.guild_id = %s
-              AND m.status IN ('completed', 'interrupted', 'abandoned')
-              AND mp.is_deleted = FALSE;
-        """
-        result = self.database.execute_query(query, (user_id, guild_id), fetchone=True)
+        result = self.database.execute_read(
+            _COUNT_MATCHES_FOR_USER_SQL,
+            (user_id, guild_id),
+            fetchone=True,
+        )
         return result["total_matches"] if result else 0
 
+    def get_user_game_stats(self, user_id: int, guild_id: int) -> list[dict[str, Any]]:
+        """Per-game totals for one user in one guild, most played first."""
+        results = self.database.execute_read(
+            _USER_GAME_STATS_SQL,
+            (user_id, guild_id),
+        )
+        return results or []
+
     def create_game(
         self,
         game_name: str,
@@ -432,69 +870,51 @@ class ReplayRepository:
     database: Database
 
     def get_replay_events(self, match_id: int) -> list[dict[str, Any]]:
-        rows = (
-            self.database.execute_query(
-                """
-            SELECT sequence_number, event_type, actor_user_id, payload
-            FROM replay_events
-            WHERE match_id = %s
-            ORDER BY sequence_number ASC;
-            """,
-                (match_id,),
-                fetchall=True,
+        """Replay events in order, from the match's archive and/or live rows."""
+        archive, rows = _split_replay_stream(
+            self.database.execute_read(
+                _GET_REPLAY_STREAM_SQL,
+                {"match_id": match_id},
+                consistency=ReadConsistency.PRIMARY,
             )
-            or []
+            or [],
         )
-        events: list[dict[str, Any]] = []
-        for row in rows:
-            payload = dict(row.get("payload") or {})
-            event_type = str(
-                row.get("event_type") or payload.pop("event_type", "event"),
-            )
-            payload["type"] = event_type
-            actor_user_id = row.get("actor_user_id")
-            if actor_user_id is not None and "user_id" not in payload:
-                payload["user_id"] = actor_user_id
-            events.append(payload)
-        return events
+        return _rows_to_replay_events(
+            _merge_replay_rows(_unpack_replay_archive(archive), rows),
+        )
+
+    def archive_replay(self, match_id: int) -> int:
+        """Pack the match's replay_events rows into replay_archives.
+
+        Rows are merged into any existing archive and deleted in the same
+        transaction. Returns the number of rows archived (0 if there were none).
+        """
+        with self.database.transaction() as cur:
+            cur.execute(_LOCK_MATCH_SQL, (match_id,))
+            cur.execute(_LOCK_REPLAY_EVENTS_SQL, (match_id,))
+            rows = cur.fetchall()
+            if not rows:
+                return 0
+            cur.execute(_GET_REPLAY_ARCHIVE_SQL, (match_id,))
+            params, last_sequence = _archive_payload(match_id, rows, cur.fetchone())
+            cur.execute(_UPSERT_REPLAY_ARCHIVE_SQL, params)
+            cur.execute(_DELETE_ARCHIVED_REPLAY_EVENTS_SQL, (match_id, last_sequence))
+        return len(rows)
 
     def append_replay_event(self, match_id: int, event: dict[str, Any]) -> None:
-        payload = dict(event or {})
-        event_type = str(payload.pop("type", "event") or "event")
-        actor_user_id = payload.pop("user_id", None)
-        if actor_user_id is not None:
-            try:
-                actor_user_id = int(actor_user_id)
-            except (TypeError, ValueError):
-                actor_user_id = None
-        replay_payload = dict(payload or {})
+        event_type, actor_user_id, payload_json = _split_replay_event(event)
         with self.database.transaction() as cur:
-            cur.execute(
-                "SELECT 1 FROM matches WHERE match_id = %s FOR UPDATE;",
-                (match_id,),
-            )
-            cur.execute(
-                """
-                SELECT COALESCE(MAX(sequence_number), 0) + 1 AS next_sequence_number
-                FROM replay_events
-                WHERE match_id = %s;
-                """,
-                (match_id,),
-            )
+            cur.execute(_LOCK_MATCH_SQL, (match_id,))
+            cur.execute(_NEXT_REPLAY_SEQUENCE_SQL, {"match_id": match_id})
             next_sequence_number = cur.fetchone()["next_sequence_number"]
             cur.execute(
-                """
-                INSERT INTO replay_events (
-                    match_id, sequence_number, event_type, actor_user_id, payload
-                )
-                VALUES (%s, %s, %s, %s, %s::jsonb);
-                """,
+                _INSERT_REPLAY_EVENT_SQL,
                 (
                     match_id,
                     next_sequence_number,
                     event_type,
                     actor_user_id,
-                    json.dumps(replay_payload),
+                    payload_json,
                 ),
             )
 
@@ -512,3 +932,469 @@ class ReplayRepository:
 
     def append_replay_dict(self, match_id: int, event: dict[str, Any]) -> None:
         self.append_replay_event(match_id, event)
+
+
+@dataclass(slots=True)
+class AsyncMatchRepository:
+    """Asyncio counterpart of :class:`MatchRepository` for event-loop call sites."""
+
+    database: AsyncDatabase
+    users: Any  # AsyncPlayerRepository
+    guilds: Any  # AsyncGuildRepository
+    games: Any  # GameRepository (shared cache; look up with get_game_async)
+
+    async def get(self, match_id: int) -> Match | None:
+        return await self.get_match(match_id)
+
+    async def get_match(self, match_id: int) -> Match | None:
+        result = await self.database.execute_query(
+            _GET_MATCH_SQL,
+            (match_id,),
+            fetchone=True,
+        )
+        return row_to_match(result) if result else None
+
+    async def get_match_by_code(self, code: str) -> Match | None:
+        c = _normalize_match_code(code)
+        if not c:
+            return None
+        result = await self.database.execute_query(
+            _GET_MATCH_BY_CODE_SQL,
+            (c,),
+            fetchone=True,
+        )
+        return row_to_match(result) if result else None
+
+    async def get_by_code(self, code: str) -> Match | None:
+        return await self.get_match_by_code(code)
+
+    async def update_match_status(
+        self,
+        match_id: int,
+        status: str,
+        metadata_patch: dict[str, Any] | None = None,
+    ) -> None:
+        async with self.database.transaction() as cur:
+            await cur.execute(_LOCK_MATCH_FOR_END_SQL, (match_id,))
+            match = await cur.fetchone()
+            restat = match is not None and match["status"] != status
+            if restat and match["status"] in _FINISHED_STATUSES:
+                await cur.execute(_APPLY_USER_GAME_STATS_SQL, ([match_id], -1))
+            if metadata_patch:
+                await cur.execute(
+                    _UPDATE_STATUS_WITH_METADATA_SQL,
+                    (status, status, json.dumps(metadata_patch), match_id),
+                )
+            else:
+                await cur.execute(_UPDATE_STATUS_SQL, (status, status, match_id))
+            if restat and status in _FINISHED_STATUSES:
+                await cur.execute(_APPLY_USER_GAME_STATS_SQL, ([match_id], 1))
+
+    async def update_status(
+        self,
+        match_id: int,
+        status: str,
+        *,
+        metadata_patch: dict[str, Any] | None = None,
+    ) -> None:
+        await self.update_match_status(
+            match_id,
+            status,
+            metadata_patch=metadata_patch,
+        )
+
+    async def merge_match_metadata_outcome_display(
+        self,
+        match_id: int,
+        *,
+        summaries: dict[int, str] | None = None,
+        global_summary: str | None = None,
+    ) -> None:
+        patch = _outcome_display_patch(summaries, global_summary)
+        if not patch:
+            return
+        await self.database.execute_query(
+            _MERGE_OUTCOME_DISPLAY_SQL,
+            (json.dumps(patch), match_id),
+        )
+
+    async def get_match_human_user_ids_ordered(self, match_id: int) -> list[int]:
+        rows = (
+            await self.database.execute_query(
+                _HUMAN_USER_IDS_SQL,
+                (match_id,),
+                fetchall=True,
+            )
+            or []
+        )
+        return [int(r["user_id"]) for r in rows]
+
+    async def ensure_unique_match_code(self) -> str:
+        """Reserve an unused public match code (may race with concurrent inserts)."""
+        for attempt in range(_MATCH_CODE_ATTEMPTS):
+            row = await self.database.execute_query(
+                _FIRST_FREE_MATCH_CODE_SQL,
+                (_candidate_match_codes(attempt, None),),
+                fetchone=True,
+            )
+            if row:
+                return row["code"]
+        msg = "Could not allocate a unique match_code"
+        raise RuntimeError(msg)
+
+    async def create_match(
+        self,
+        game_id: int,
+        guild_id: int,
+        channel_id: int,
+        thread_id: int | None,
+        participants: list[int],
+        game_config: dict[str, Any] | None = None,
+        *,
+        match_id: int,
+        preset_match_code: str | None = None,
+    ) -> tuple[int, str]:
+        """Create the match, its guild/users and participants in one statement.
+
+        Code collisions with existing matches are resolved inside the statement;
+        only a concurrent insert taking the same code forces another attempt.
+        """
+        last_err: Exception | None = None
+        for attempt in range(_MATCH_CODE_ATTEMPTS):
+            params = _create_match_params(
+                game_id,
+                guild_id,
+                channel_id,
+                thread_id,
+                participants,
+                game_config,
+                match_id,
+                _candidate_match_codes(attempt, preset_match_code),
+            )
+            try:
+                async with self.database.transaction() as cur:
+                    await cur.execute(_CREATE_MATCH_SQL, params)
+                    row = await cur.fetchone()
+            except Exception as e:
+                if _is_unique_violation(e):
+                    last_err = e
+                    continue
+                raise
+            if row:
+                return row["match_id"], row["match_code"]
+        msg = "Could not allocate a unique match_code"
+        raise RuntimeError(msg) from last_err
+
+    async def create_game(
+        self,
+        game_name: str,
+        guild_id: int,
+        participants: list[int],
+        channel_id: int | None = None,
+        thread_id: int | None = None,
+        game_config: dict[str, Any] | None = None,
+        *,
+        match_id: int,
+        preset_match_code: str | None = None,
+    ) -> tuple[int, str]:
+        game = await self.games.get_game_async(self.database, game_name)
+        if not game:
+            msg = f"Game {game_name} not found"
+            raise ValueError(msg)
+        resolved_channel_id = channel_id if channel_id is not None else 0
+        return await self.create_match(
+            game_id=game.game_id,
+            guild_id=guild_id,
+            channel_id=resolved_channel_id,
+            thread_id=thread_id,
+            participants=participants,
+            game_config=game_config or {},
+            match_id=match_id,
+            preset_match_code=preset_match_code,
+        )
+
+    async def end_match(
+        self,
+        match_id: int,
+        final_state: dict[str, Any],
+        results: dict[int, dict[str, Any]],
+    ) -> None:
+        metadata_patch_json = json.dumps({"final_state": final_state})
+        async with self.database.transaction() as cur:
+            await cur.execute(_LOCK_MATCH_FOR_END_SQL, (match_id,))
+            match = await cur.fetchone()
+            if not match:
+                msg = f"Match {match_id} not found"
+                raise ValueError(msg)
+            if match["status"] == MatchStatus.COMPLETED.value:
+                msg = f"Match {match_id} is already completed"
+                raise ValueError(msg)
+            if match["status"] in _FINISHED_STATUSES:
+                await cur.execute(_APPLY_USER_GAME_STATS_SQL, ([match_id], -1))
+
+            for user_id, result in results.items():
+                await cur.execute(
+                    _UPDATE_PARTICIPANT_RESULT_SQL,
+                    (
+                        result["ranking"],
+                        result.get("score"),
+                        match_id,
+                        user_id,
+                    ),
+                )
+
+            await cur.execute(_COMPLETE_MATCH_SQL, (metadata_patch_json, match_id))
+            await cur.execute(_APPLY_USER_GAME_STATS_SQL, ([match_id], 1))
+
+    async def get_participants(self, match_id: int) -> list[Participant]:
+        results = await self.database.execute_query(
+            _GET_PARTICIPANTS_SQL,
+            (match_id,),
+            fetchall=True,
+        )
+        return [row_to_participant(row) for row in results] if results else []
+
+    async def record_move(
+        self,
+        match_id: int,
+        user_id: int | None,
+        move_number: int | None = None,
+        move_data: dict[str, Any] | None = None,
+        game_state_after: dict[str, Any] | None = None,
+        time_taken_ms: int | None = None,
+        is_game_affecting: bool = True,
+        kind: str = "move",
+    ) -> bool:
+        """Insert a move; returns False if an explicit ``move_number`` is taken."""
+        if move_number is not None:
+            async with self.database.transaction() as cur:
+                await cur.execute(
+                    _INSERT_NUMBERED_MOVE_SQL,
+                    (
+                        *_move_params(
+                            match_id,
+                            user_id,
+                            move_number,
+                            kind,
+                            move_data,
+                            game_state_after,
+                            time_taken_ms,
+                            is_game_affecting,
+                        ),
+                        match_id,
+                        move_number,
+                    ),
+                )
+                return cur.rowcount == 1
+        result = await self.database.execute_query(
+            _NEXT_MOVE_NUMBER_SQL,
+            (match_id,),
+            fetchone=True,
+        )
+        auto_sequence = result["next_move_num"] if result else 1
+        await self.database.execute_query(
+            _INSERT_MOVE_SQL,
+            _move_params(
+                match_id,
+                user_id,
+                auto_sequence,
+                kind,
+                move_data,
+                game_state_after,
+                time_taken_ms,
+                is_game_affecting,
+            ),
+        )
+        return True
+
+    async def get_next_move_number(self, match_id: int) -> int:
+        result = await self.database.execute_query(
+            _NEXT_MOVE_NUMBER_SQL,
+            (match_id,),
+            fetchone=True,
+        )
+        return int(result["next_move_num"]) if result else 1
+
+    async def get_move_count(self, match_id: int) -> int:
+        result = await self.database.execute_query(
+            _MOVE_COUNT_SQL,
+            (match_id,),
+            fetchone=True,
+        )
+        return result["count"] if result else 0
+
+    async def get_user_match_history(
+        self,
+        user_id: int,
+        guild_id: int | None,
+        game_id: int | None = None,
+        limit: int = 10,
+        offset: int = 0,
+        after: HistoryCursor | None = None,
+    ) -> list[dict[str, Any]]:
+        query, params = _user_history_query(
+            user_id,
+            guild_id,
+            game_id,
+            limit,
+            offset,
+            after,
+        )
+        results = await self.database.execute_read(query, params)
+        return results or []
+
+    async def get_history_for_user(
+        self,
+        user_id: int,
+        *,
+        guild_id: int | None = None,
+        game_id: int | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        after: HistoryCursor | None = None,
+    ) -> list[dict[str, Any]]:
+        """History page; pass ``after`` (keyset) instead of ``offset`` to page on."""
+        return await self.get_user_match_history(
+            user_id,
+            guild_id,
+            game_id=game_id,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+
+    async def count_matches_for_user(self, user_id: int, guild_id: int) -> int:
+        result = await self.database.execute_read(
+            _COUNT_MATCHES_FOR_USER_SQL,
+            (user_id, guild_id),
+            fetchone=True,
+        )
+        return result["total_matches"] if result else 0
+
+    async def get_user_game_stats(
+        self,
+        user_id: int,
+        guild_id: int,
+    ) -> list[dict[str, Any]]:
+        """Per-game totals for one user in one guild, most played first."""
+        results = await self.database.execute_read(
+            _USER_GAME_STATS_SQL,
+            (user_id, guild_id),
+        )
+        return results or []
+
+
+@dataclass(slots=True)
+class AsyncReplayRepository:
+    """Asyncio counterpart of :class:`ReplayRepository`."""
+
+    database: AsyncDatabase
+
+    async def get_replay_events(self, match_id: int) -> list[dict[str, Any]]:
+        archive, rows = _split_replay_stream(
+            await self.database.execute_read(
+                _GET_REPLAY_STREAM_SQL,
+                {"match_id": match_id},
+                consistency=ReadConsistency.PRIMARY,
+            )
+            or [],
+        )
+        return _rows_to_replay_events(
+            _merge_replay_rows(_unpack_replay_archive(archive), rows),
+        )
+
+    async def archive_replay(self, match_id: int) -> int:
+        async with self.database.transaction() as cur:
+            await cur.execute(_LOCK_MATCH_SQL, (match_id,))
+            await cur.execute(_LOCK_REPLAY_EVENTS_SQL, (match_id,))
+            rows = await cur.fetchall()
+            if not rows:
+                return 0
+            await cur.execute(_GET_REPLAY_ARCHIVE_SQL, (match_id,))
+            params, last_sequence = _archive_payload(
+                match_id,
+                rows,
+                await cur.fetchone(),
+            )
+            await cur.execute(_UPSERT_REPLAY_ARCHIVE_SQL, params)
+            await cur.execute(
+                _DELETE_ARCHIVED_REPLAY_EVENTS_SQL,
+                (match_id, last_sequence),
+            )
+        return len(rows)
+
+    async def append_replay_event(self, match_id: int, event: dict[str, Any]) -> None:
+        event_type, actor_user_id, payload_json = _split_replay_event(event)
+        async with self.database.transaction() as cur:
+            await cur.execute(_LOCK_MATCH_SQL, (match_id,))
+            await cur.execute(_NEXT_REPLAY_SEQUENCE_SQL, {"match_id": match_id})
+            next_sequence_number = (await cur.fetchone())["next_sequence_number"]
+            await cur.execute(
+                _INSERT_REPLAY_EVENT_SQL,
+                (
+                    match_id,
+                    next_sequence_number,
+                    event_type,
+                    actor_user_id,
+                    payload_json,
+                ),
+            )
+
+    async def get_events(self, match_id: int) -> list[dict[str, Any]]:
+        return await self.get_replay_events(match_id)
+
+    async def append_event(
+        self,
+        match_id: int,
+        event_type: str,
+        payload: dict[str, Any],
+    ) -> None:
+        event: dict[str, Any] = {"type": event_type, **(payload or {})}
+        await self.append_replay_event(match_id, event)
+
+    async def append_replay_dict(self, match_id: int, event: dict[str, Any]) -> None:
+        await self.append_replay_event(match_id, event)
+
+    async def get_next_replay_sequence(self, match_id: int) -> int:
+        row = await self.database.execute_query(
+            _NEXT_REPLAY_SEQUENCE_SQL,
+            {"match_id": match_id},
+            fetchone=True,
+        )
+        return int(row["next_sequence_number"]) if row else 1
+
+    async def append_replay_events(
+        self,
+        match_id: int,
+        events: Sequence[dict[str, Any]],
+        *,
+        first_sequence: int,
+    ) -> bool:
+        """Insert pre-numbered events in one statement, without locking ``matches``.
+
+        Events are numbered ``first_sequence``, ``first_sequence + 1``, ... in
+        order. Returns False (nothing written) if any of those numbers is already
+        taken, so the caller can reseed its allocator and retry.
+        """
+        if not events:
+            return True
+        sequences: list[int] = []
+        event_types: list[str] = []
+        actor_ids: list[int | None] = []
+        payloads: list[str] = []
+        for offset, event in enumerate(events):
+            event_type, actor_user_id, payload_json = _split_replay_event(event)
+            sequences.append(first_sequence + offset)
+            event_types.append(event_type)
+            actor_ids.append(actor_user_id)
+            payloads.append(payload_json)
+        try:
+            await self.database.execute_query(
+                _INSERT_REPLAY_EVENTS_BATCH_SQL,
+                (match_id, sequences, event_types, actor_ids, payloads),
+            )
+        except Exception as e:
+            if _is_unique_violation(e):
+                return False
+            raise
+        return True
@@ -5,11 +5,26 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from playcord.infrastructure.constants import (
+    PARTITION_MONTHS_AHEAD,
+    PARTITIONED_TABLES,
+)
 from playcord.infrastructure.database.implementation.core import migrations
+from playcord.infrastructure.logging import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from playcord.infrastructure.database.implementation.database import Database
 
+logger = get_logger("database.maintenance")
+
+_ENSURE_PARTITIONS_SQL = "CALL ensure_monthly_partitions(%s, 0, %s);"
+_DRAIN_DEFAULT_PARTITION_SQL = "SELECT drain_default_partition(%s) AS moved;"
+_DROP_EXPIRED_PARTITIONS_SQL = """
+    SELECT drop_expired_partitions(%s, NOW() - (%s * INTERVAL '1 day')) AS partition;
+"""
+
 
 @dataclass(slots=True)
 class MaintenanceRepository:
@@ -29,3 +44,75 @@ class MaintenanceRepository:
         migrations.apply_migrations(self.database)
         self.database.refresh_sql_assets()
         self.games.sync_games_from_code()
+
+    def rebuild_user_game_stats(self) -> int:
+        """Recompute user_game_stats from match history; returns rows written."""
+        with self.database.transaction() as cur:
+            cur.execute("SELECT rebuild_user_game_stats() AS written;")
+            result = cur.fetchone()
+        return int(result["written"]) if result else 0
+
+    def ensure_partitions(
+        self,
+        *,
+        months_ahead: int = PARTITION_MONTHS_AHEAD,
+    ) -> list[str]:
+        """Create the current and next ``months_ahead`` monthly partitions.
+
+        Each table gets its own transaction, so one failing table (e.g. rows
+        for a missing month still sitting in its default partition) does not
+        roll back the others. Returns the tables that failed.
+        """
+        failed: list[str] = []
+        for table in PARTITIONED_TABLES:
+            try:
+                with self.database.transaction() as cur:
+                    cur.execute(_ENSURE_PARTITIONS_SQL, (table, months_ahead))
+            except Exception:
+                logger.exception("Could not create partitions for %s", table)
+                failed.append(table)
+        return failed
+
+    def drain_default_partitions(self) -> dict[str, int]:
+        """Move rows out of each ``_default`` partition; returns rows moved per table.
+
+        Tables that fail are logged and left out of the result.
+        """
+        moved: dict[str, int] = {}
+        for table in PARTITIONED_TABLES:
+            try:
+                with self.database.transaction() as cur:
+                    cur.execute(_DRAIN_DEFAULT_PARTITION_SQL, (table,))
+                    result = cur.fetchone()
+            except Exception:
+                logger.exception("Could not drain %s_default", table)
+                continue
+            moved[table] = int(result["moved"]) if result else 0
+        return moved
+
+    def drop_expired_partitions(self, table: str, *, older_than_days: int) -> list[str]:
+        """Detach and drop monthly partitions of ``table`` that ended before the cutoff."""
+        with self.database.transaction() as cur:
+            cur.execute(_DROP_EXPIRED_PARTITIONS_SQL, (table, older_than_days))
+            rows = cur.fetchall()
+        return [row["partition"] for row in rows]
+
+    def maintain_partitions(
+        self,
+        retention_days: Mapping[str, int],
+    ) -> dict[str, Any]:
+        """Drain defaults, pre-create partitions, then drop expired partitions.
+
+        ``retention_days`` maps a partitioned table to its retention; tables not
+        listed keep every partition. Draining runs first so rows stranded in a
+        default partition are placed (and expired) with their month. It also
+        creates the partitions those rows need; creating them beforehand fails
+        while the rows still sit in the default partition.
+        """
+        moved = self.drain_default_partitions()
+        self.ensure_partitions()
+        dropped = {
+            table: self.drop_expired_partitions(table, older_than_days=days)
+            for table, days in retention_days.items()
+        }
+        return {"moved": moved, "dropped": dropped}
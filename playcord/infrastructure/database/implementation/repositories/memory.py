@@ -0,0 +1,883 @@
+"""
+In-memory repositories (``db.type: memory``).
+
+Each class subclasses its PostgreSQL repository, keeps its caches and helper
+methods, and replaces the SQL with calls into an
+:class:`~playcord.infrastructure.database.implementation.memory.InMemoryStore`.
+Sync and asyncio variants share one store, the way the SQL repositories share
+one database. Use them for load tests and benchmarks of the runtime with the
+database cost taken out; nothing is persisted.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from playcord.infrastructure.config import get_settings
+from playcord.infrastructure.constants import (
+    ANALYTICS_ROLLUP_BATCH_SIZE,
+    ANALYTICS_ROLLUP_MAX_BATCHES,
+    PARTITION_MONTHS_AHEAD,
+    PARTITIONED_TABLES,
+)
+from playcord.infrastructure.database.implementation.core.exceptions import (
+    DatabaseError,
+)
+from playcord.infrastructure.database.implementation.repositories.analytics import (
+    AnalyticsRepository,
+    AsyncAnalyticsRepository,
+    _optional_id,
+    _resolve_game_id,
+)
+from playcord.infrastructure.database.implementation.repositories.game import (
+    GameRepository,
+)
+from playcord.infrastructure.database.implementation.repositories.guild import (
+    AsyncGuildRepository,
+    GuildRepository,
+    _cached_settings,
+)
+from playcord.infrastructure.database.implementation.repositories.history import (
+    _MATCH_CODE_ATTEMPTS,
+    AsyncMatchRepository,
+    AsyncReplayRepository,
+    MatchRepository,
+    ReplayRepository,
+    _archive_payload,
+    _candidate_match_codes,
+    _merge_replay_rows,
+    _normalize_match_code,
+    _outcome_display_patch,
+    _rows_to_replay_events,
+    _split_replay_event,
+    _unpack_replay_archive,
+)
+from playcord.infrastructure.database.implementation.repositories.maintenance import (
+    MaintenanceRepository,
+)
+from playcord.infrastructure.database.implementation.repositories.roles import (
+    RoleRepository,
+)
+from playcord.infrastructure.database.implementation.repositories.user import (
+    AsyncPlayerRepository,
+    PlayerRepository,
+    _cached_preferences,
+    _fill_missing,
+    _players_from_rows,
+    _split_cached,
+)
+from playcord.infrastructure.database.models import (
+    Game,
+    HistoryCursor,
+    Match,
+    Participant,
+    User,
+    row_to_game,
+    row_to_match,
+    row_to_participant,
+    row_to_user,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from playcord.infrastructure.database.implementation.internal_player import (
+        InternalPlayer,
+    )
+    from playcord.infrastructure.database.implementation.memory import InMemoryStore
+
+
+def _create_match(
+    store: InMemoryStore,
+    game_id: int,
+    guild_id: int,
+    channel_id: int,
+    thread_id: int | None,
+    participants: list[int],
+    game_config: dict[str, Any] | None,
+    match_id: int,
+    preset_match_code: str | None,
+) -> tuple[int, str]:
+    for attempt in range(_MATCH_CODE_ATTEMPTS):
+        created = store.create_match(
+            match_id=match_id,
+            game_id=game_id,
+            guild_id=guild_id,
+            channel_id=channel_id,
+            thread_id=thread_id,
+            game_config=game_config or {},
+            user_ids=[int(user_id) for user_id in participants],
+            codes=_candidate_match_codes(attempt, preset_match_code),
+        )
+        if created:
+            return created
+    msg = "Could not allocate a unique match_code"
+    raise RuntimeError(msg)
+
+
+def _unique_match_code(store: InMemoryStore) -> str:
+    for attempt in range(_MATCH_CODE_ATTEMPTS):
+        code = store.first_free_match_code(_candidate_match_codes(attempt, None))
+        if code:
+            return code
+    msg = "Could not allocate a unique match_code"
+    raise RuntimeError(msg)
+
+
+def _match_or_none(row: dict[str, Any] | None) -> Match | None:
+    return row_to_match(row) if row else None
+
+
+def _replay_events(store: InMemoryStore, match_id: int) -> list[dict[str, Any]]:
+    return _rows_to_replay_events(
+        _merge_replay_rows(
+            _unpack_replay_archive(store.replay_archive(match_id)),
+            store.replay_rows(match_id),
+        ),
+    )
+
+
+def _archive_replay(store: InMemoryStore, match_id: int) -> int:
+    rows = store.replay_rows(match_id)
+    if not rows:
+        return 0
+    params, last_sequence = _archive_payload(
+        match_id,
+        rows,
+        store.replay_archive(match_id),
+    )
+    store.store_replay_archive(params, last_sequence)
+    return len(rows)
+
+
+def _analytics_cutoff(days: int | None) -> datetime:
+    if days is None:
+        days = get_settings().analytics_retention_days
+    return datetime.now(UTC) - timedelta(days=days)
+
+
+def _ingest_rows(
+    games: Any,
+    events: Sequence[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "created_at": event.get("created_at"),
+            "event_type": str(event["event_type"]),
+            "user_id": _optional_id(event.get("user_id")),
+            "guild_id": _optional_id(event.get("guild_id")),
+            "game_id": _resolve_game_id(games, event.get("game_type")),
+            "match_id": _optional_id(event.get("match_id")),
+            "metadata": event.get("metadata"),
+        }
+        for event in events
+    ]
+
+
+@dataclass(slots=True)
+class InMemoryGameRepository(GameRepository):
+    database: InMemoryStore  # type: ignore[assignment]
+
+    def register_game(
+        self,
+        game_name: str,
+        display_name: str,
+        min_players: int,
+        max_players: int,
+        game_metadata: dict[str, Any] | None = None,
+        game_schema_version: int = 1,
+    ) -> int:
+        game_id = self.database.upsert_game(
+            game_name,
+            display_name,
+            min_players,
+            max_players,
+            game_metadata or {},
+            game_schema_version,
+        )
+        self._cache_game(row_to_game(self.database.get_game(game_id=game_id)))
+        return game_id
+
+    def sync_games_from_code(self, known: dict[str, str] | None = None) -> bool:
+        # No fingerprints or transactions here: upsert every game each time.
+        _ = known
+        for game in self._games_from_code():
+            self.register_game(**game)
+        return True
+
+    def get(self, game_name: str) -> Game | None:
+        cached = self._game_cache_by_name.get(game_name)
+        if cached is not None:
+            return cached
+        row = self.database.get_game(game_name=game_name)
+        return self._cache_game(row_to_game(row) if row else None)
+
+    async def get_game_async(
+        self,
+        database: InMemoryStore,  # type: ignore[override]
+        game_name: str,
+    ) -> Game | None:
+        _ = database
+        return self.get(game_name)
+
+    def get_by_id(self, game_id: int) -> Game | None:
+        cached = self._game_cache_by_id.get(game_id)
+        if cached is not None:
+            return cached
+        row = self.database.get_game(game_id=game_id)
+        return self._cache_game(row_to_game(row) if row else None)
+
+    def reset_game_data(self, game_id: int) -> Game:
+        game = self.get_by_id(game_id)
+        if game is None:
+            msg = f"Game {game_id} not found"
+            raise ValueError(msg)
+
+        self.database.delete_game(game_id)
+        self._game_cache_by_id.pop(game_id, None)
+        self._game_cache_by_name.pop(game.game_name, None)
+
+        self.sync_games_from_code()
+        recreated = self.get(game.game_name)
+        if recreated is None:
+            msg = f"Game {game.game_name!r} was deleted but not recreated from code"
+            raise DatabaseError(msg)
+        return recreated
+
+
+@dataclass(slots=True)
+class InMemoryPlayerRepository(PlayerRepository):
+    database: InMemoryStore  # type: ignore[assignment]
+
+    def create_user(
+        self,
+        user_id: int,
+        username: str = "Unknown",
+        is_bot: bool = False,
+    ) -> None:
+        self.database.upsert_user(user_id, username, is_bot)
+        self.cache.invalidate(user_id)
+
+    def get_user(self, user_id: int) -> User | None:
+        row = self.database.get_user(user_id)
+        return row_to_user(row) if row else None
+
+    def get_user_preferences(self, user_id: int) -> dict | None:
+        found, row = self.cache.lookup(user_id)
+        if not found:
+            rows = self.database.get_users_preferences([user_id])
+            row = (
+                {k: rows[0][k] for k in ("joined_at", "preferences")} if rows else None
+            )
+            self.cache.put(user_id, row)
+        return _cached_preferences(row)
+
+    def update_user_preferences(
+        self,
+        user_id: int,
+        patch: dict[str, Any],
+    ) -> dict | None:
+        row = self.database.merge_user_preferences(user_id, patch)
+        self.cache.put(user_id, row)
+        return _cached_preferences(row)
+
+    def delete_user(self, user_id: int) -> None:
+        self.database.set_user_deleted(user_id, True)
+        self.cache.invalidate(user_id)
+
+    def restore_user(self, user_id: int) -> None:
+        self.database.set_user_deleted(user_id, False)
+        self.cache.invalidate(user_id)
+
+    def get_players(
+        self,
+        user_ids: Iterable[int],
+        usernames: Mapping[int, str | None] | None = None,
+    ) -> dict[int, InternalPlayer]:
+        found, missing = _split_cached(self.cache, user_ids)
+        if missing:
+            rows = self.database.get_users_preferences(missing)
+            _fill_missing(self.cache, found, missing, rows)
+        return _players_from_rows(found, usernames)
+
+
+@dataclass(slots=True)
+class AsyncInMemoryPlayerRepository(AsyncPlayerRepository):
+    database: InMemoryStore  # type: ignore[assignment]
+
+    async def create_user(
+        self,
+        user_id: int,
+        username: str = "Unknown",
+        is_bot: bool = False,
+    ) -> None:
+        self.database.upsert_user(user_id, username, is_bot)
+        self.cache.invalidate(user_id)
+
+    async def get_user(self, user_id: int) -> User | None:
+        row = self.database.get_user(user_id)
+        return row_to_user(row) if row else None
+
+    async def get_user_preferences(self, user_id: int) -> dict | None:
+        found, row = self.cache.lookup(user_id)
+        if not found:
+            rows = self.database.get_users_preferences([user_id])
+            row = (
+                {k: rows[0][k] for k in ("joined_at", "preferences")} if rows else None
+            )
+            self.cache.put(user_id, row)
+        return _cached_preferences(row)
+
+    async def update_user_preferences(
+        self,
+        user_id: int,
+        patch: dict[str, Any],
+    ) -> dict | None:
+        row = self.database.merge_user_preferences(user_id, patch)
+        self.cache.put(user_id, row)
+        return _cached_preferences(row)
+
+    async def get_players(
+        self,
+        user_ids: Iterable[int],
+        usernames: Mapping[int, str | None] | None = None,
+    ) -> dict[int, InternalPlayer]:
+        found, missing = _split_cached(self.cache, user_ids)
+        if missing:
+            rows = self.database.get_users_preferences(missing)
+            _fill_missing(self.cache, found, missing, rows)
+        return _players_from_rows(found, usernames)
+
+
+@dataclass(slots=True)
+class InMemoryGuildRepository(GuildRepository):
+    database: InMemoryStore  # type: ignore[assignment]
+
+    def create_guild(
+        self,
+        guild_id: int,
+        settings: dict[str, Any] | None = None,
+    ) -> None:
+        self.database.upsert_guild(guild_id, settings or {})
+        self.settings_cache.invalidate(guild_id)
+
+    def get_guild_settings(self, guild_id: int) -> dict | None:
+        found, settings = self.settings_cache.lookup(guild_id)
+        if not found:
+            settings = self.database.get_guild_settings(guild_id)
+            self.settings_cache.put(guild_id, settings)
+        return _cached_settings(settings)
+
+    def merge_guild_settings(self, guild_id: int, patch: dict[str, Any]) -> None:
+        self.database.upsert_guild(guild_id, {})
+        self.database.merge_guild_settings(guild_id, patch)
+        self.settings_cache.invalidate(guild_id)
+
+    def delete_guild(self, guild_id: int) -> None:
+        self.database.delete_guild(guild_id)
+        self.settings_cache.invalidate(guild_id)
+
+
+@dataclass(slots=True)
+class AsyncInMemoryGuildRepository(AsyncGuildRepository):
+    database: InMemoryStore  # type: ignore[assignment]
+
+    async def create_guild(
+        self,
+        guild_id: int,
+        settings: dict[str, Any] | None = None,
+    ) -> None:
+        self.database.upsert_guild(guild_id, settings or {})
+        self.settings_cache.invalidate(guild_id)
+
+    async def get_guild_settings(self, guild_id: int) -> dict | None:
+        found, settings = self.settings_cache.lookup(guild_id)
+        if not found:
+            settings = self.database.get_guild_settings(guild_id)
+            self.settings_cache.put(guild_id, settings)
+        return _cached_settings(settings)
+
+    async def merge_guild_settings(
+        self,
+        guild_id: int,
+        patch: dict[str, Any],
+    ) -> None:
+        self.database.upsert_guild(guild_id, {})
+        self.database.merge_guild_settings(guild_id, patch)
+        self.settings_cache.invalidate(guild_id)
+
+    async def delete_guild(self, guild_id: int) -> None:
+        self.database.delete_guild(guild_id)
+        self.settings_cache.invalidate(guild_id)
+
+
+@dataclass(slots=True)
+class InMemoryMatchRepository(MatchRepository):
+    database: InMemoryStore  # type: ignore[assignment]
+
+    def get_match(self, match_id: int) -> Match | None:
+        return _match_or_none(self.database.get_match(match_id))
+
+    def get_match_by_code(self, code: str) -> Match | None:
+        c = _normalize_match_code(code)
+        return _match_or_none(self.database.get_match_by_code(c)) if c else None
+
+    def update_match_status(
+        self,
+        match_id: int,
+        status: str,
+        metadata_patch: dict[str, Any] | None = None,
+    ) -> None:
+        self.database.update_match_status(match_id, status, metadata_patch)
+
+    def interrupt_stale_matches(self, reason: str = "bot_restart") -> int:
+        return len(
+            self.database.interrupt_stale_matches({"interrupt_reason": reason}),
+        )
+
+    def merge_match_metadata_outcome_display(
+        self,
+        match_id: int,
+        *,
+        summaries: dict[int, str] | None = None,
+        global_summary: str | None = None,
+    ) -> None:
+        patch = _outcome_display_patch(summaries, global_summary)
+        if patch:
+            self.database.merge_outcome_display(match_id, patch)
+
+    def get_match_human_user_ids_ordered(self, match_id: int) -> list[int]:
+        return self.database.human_user_ids(match_id)
+
+    def ensure_unique_match_code(self) -> str:
+        return _unique_match_code(self.database)
+
+    def create_match(
+        self,
+        game_id: int,
+        guild_id: int,
+        channel_id: int,
+        thread_id: int | None,
+        participants: list[int],
+        game_config: dict[str, Any] | None = None,
+        *,
+        match_id: int,
+        preset_match_code: str | None = None,
+    ) -> tuple[int, str]:
+        return _create_match(
+            self.database,
+            game_id,
+            guild_id,
+            channel_id,
+            thread_id,
+            participants,
+            game_config,
+            match_id,
+            preset_match_code,
+        )
+
+    def end_match(
+        self,
+        match_id: int,
+        final_state: dict[str, Any],
+        results: dict[int, dict[str, Any]],
+    ) -> None:
+        self.database.end_match(match_id, final_state, results)
+
+    def get_participants(self, match_id: int) -> list[Participant]:
+        return [
+            row_to_participant(row) for row in self.database.get_participants(match_id)
+        ]
+
+    def record_move(
+        self,
+        match_id: int,
+        user_id: int | None,
+        move_number: int | None = None,
+        move_data: dict[str, Any] | None = None,
+        game_state_after: dict[str, Any] | None = None,
+        time_taken_ms: int | None = None,
+        is_game_affecting: bool = True,
+        kind: str = "move",
+    ) -> None:
+        # An explicit move_number is kept, and skipped if already taken, like
+        # _INSERT_NUMBERED_MOVE_SQL; without one the move is numbered next.
+        self.database.insert_move(
+            match_id,
+            user_id,
+            move_number,
+            kind,
+            move_data,
+            game_state_after,
+            time_taken_ms,
+            is_game_affecting,
+        )
+
+    def get_move_count(self, match_id: int) -> int:
+        return self.database.move_count(match_id)
+
+    def get_user_match_history(
+        self,
+        user_id: int,
+        guild_id: int | None,
+        game_id: int | None = None,
+        limit: int = 10,
+        offset: int = 0,
+        after: HistoryCursor | None = None,
+    ) -> list[dict[str, Any]]:
+        return self.database.user_history(
+            user_id,
+            guild_id,
+            game_id,
+            limit,
+            offset,
+            after,
+        )
+
+    def count_matches_for_user(self, user_id: int, guild_id: int) -> int:
+        return sum(
+            row["matches_played"]
+            for row in self.database.user_game_stats(user_id, guild_id)
+        )
+
+    def get_user_game_stats(self, user_id: int, guild_id: int) -> list[dict[str, Any]]:
+        return self.database.user_game_stats(user_id, guild_id)
+
+
+@dataclass(slots=True)
+class AsyncInMemoryMatchRepository(AsyncMatchRepository):
+    database: InMemoryStore  # type: ignore[assignment]
+
+    async def get_match(self, match_id: int) -> Match | None:
+        return _match_or_none(self.database.get_match(match_id))
+
+    async def get_match_by_code(self, code: str) -> Match | None:
+        c = _normalize_match_code(code)
+        return _match_or_none(self.database.get_match_by_code(c)) if c else None
+
+    async def update_match_status(
+        self,
+        match_id: int,
+        status: str,
+        metadata_patch: dict[str, Any] | None = None,
+    ) -> None:
+        self.database.update_match_status(match_id, status, metadata_patch)
+
+    async def merge_match_metadata_outcome_display(
+        self,
+        match_id: int,
+        *,
+        summaries: dict[int, str] | None = None,
+        global_summary: str | None = None,
+    ) -> None:
+        patch = _outcome_display_patch(summaries, global_summary)
+        if patch:
+            self.database.merge_outcome_display(match_id, patch)
+
+    async def get_match_human_user_ids_ordered(self, match_id: int) -> list[int]:
+        return self.database.human_user_ids(match_id)
+
+    async def ensure_unique_match_code(self) -> str:
+        return _unique_match_code(self.database)
+
+    async def create_match(
+        self,
+        game_id: int,
+        guild_id: int,
+        channel_id: int,
+        thread_id: int | None,
+        participants: list[int],
+        game_config: dict[str, Any] | None = None,
+        *,
+        match_id: int,
+        preset_match_code: str | None = None,
+    ) -> tuple[int, str]:
+        return _create_match(
+            self.database,
+            game_id,
+            guild_id,
+            channel_id,
+            thread_id,
+            participants,
+            game_config,
+            match_id,
+            preset_match_code,
+        )
+
+    async def end_match(
+        self,
+        match_id: int,
+        final_state: dict[str, Any],
+        results: dict[int, dict[str, Any]],
+    ) -> None:
+        self.database.end_match(match_id, final_state, results)
+
+    async def get_participants(self, match_id: int) -> list[Participant]:
+        return [
+            row_to_participant(row) for row in self.database.get_participants(match_id)
+        ]
+
+    async def record_move(
+        self,
+        match_id: int,
+        user_id: int | None,
+        move_number: int | None = None,
+        move_data: dict[str, Any] | None = None,
+        game_state_after: dict[str, Any] | None = None,
+        time_taken_ms: int | None = None,
+        is_game_affecting: bool = True,
+        kind: str = "move",
+    ) -> bool:
+        return self.database.insert_move(
+            match_id,
+            user_id,
+            move_number,
+            kind,
+            move_data,
+            game_state_after,
+            time_taken_ms,
+            is_game_affecting,
+        )
+
+    async def get_next_move_number(self, match_id: int) -> int:
+        return self.database.next_move_number(match_id)
+
+    async def get_move_count(self, match_id: int) -> int:
+        return self.database.move_count(match_id)
+
+    async def get_user_match_history(
+        self,
+        user_id: int,
+        guild_id: int | None,
+        game_id: int | None = None,
+        limit: int = 10,
+        offset: int = 0,
+        after: HistoryCursor | None = None,
+    ) -> list[dict[str, Any]]:
+        return self.database.user_history(
+            user_id,
+            guild_id,
+            game_id,
+            limit,
+            offset,
+            after,
+        )
+
+    async def count_matches_for_user(self, user_id: int, guild_id: int) -> int:
+        return sum(
+            row["matches_played"]
+            for row in self.database.user_game_stats(user_id, guild_id)
+        )
+
+    async def get_user_game_stats(
+        self,
+        user_id: int,
+        guild_id: int,
+    ) -> list[dict[str, Any]]:
+        return self.database.user_game_stats(user_id, guild_id)
+
+
+@dataclass(slots=True)
+class InMemoryReplayRepository(ReplayRepository):
+    database: InMemoryStore  # type: ignore[assignment]
+
+    def get_replay_events(self, match_id: int) -> list[dict[str, Any]]:
+        return _replay_events(self.database, match_id)
+
+    def archive_replay(self, match_id: int) -> int:
+        return _archive_replay(self.database, match_id)
+
+    def append_replay_event(self, match_id: int, event: dict[str, Any]) -> None:
+        self.database.append_replay_row(match_id, *_split_replay_event(event))
+
+
+@dataclass(slots=True)
+class AsyncInMemoryReplayRepository(AsyncReplayRepository):
+    database: InMemoryStore  # type: ignore[assignment]
+
+    async def get_replay_events(self, match_id: int) -> list[dict[str, Any]]:
+        return _replay_events(self.database, match_id)
+
+    async def archive_replay(self, match_id: int) -> int:
+        return _archive_replay(self.database, match_id)
+
+    async def append_replay_event(self, match_id: int, event: dict[str, Any]) -> None:
+        self.database.append_replay_row(match_id, *_split_replay_event(event))
+
+    async def get_next_replay_sequence(self, match_id: int) -> int:
+        return self.database.next_replay_sequence(match_id)
+
+    async def append_replay_events(
+        self,
+        match_id: int,
+        events: Sequence[dict[str, Any]],
+        *,
+        first_sequence: int,
+    ) -> bool:
+        return self.database.insert_replay_rows(
+            match_id,
+            [
+                (first_sequence + offset, *_split_replay_event(event))
+                for offset, event in enumerate(events)
+            ],
+        )
+
+
+class InMemoryRoleRepository(RoleRepository):
+    """Role assignments kept in an :class:`InMemoryStore`."""
+
+    def __init__(self, database: InMemoryStore) -> None:
+        self.database = database
+
+    def save_role_assignments(
+        self,
+        match_id: int,
+        assignments: list[tuple[int, str, int]],
+    ) -> None:
+        if assignments:
+            self.database.save_role_assignments(match_id, assignments)
+
+    def get_role_assignments(self, match_id: int) -> dict[int, tuple[str, int]]:
+        return self.database.get_role_assignments(match_id)
+
+
+@dataclass(slots=True)
+class InMemoryAnalyticsRepository(AnalyticsRepository):
+    """Analytics over raw in-memory events (reads need no hourly rollup)."""
+
+    database: InMemoryStore  # type: ignore[assignment]
+
+    def _insert_event_row(
+        self,
+        event_type: str,
+        user_id: int | None = None,
+        guild_id: int | None = None,
+        game_id: int | None = None,
+        match_id: int | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        event = {
+            "event_type": event_type,
+            "user_id": user_id,
+            "guild_id": guild_id,
+            "game_id": game_id,
+            "match_id": match_id,
+            "metadata": metadata,
+        }
+        if not self.database.insert_analytics_events([event]):
+            msg = f"Unknown analytics event type {event_type!r}"
+            raise DatabaseError(msg)
+
+    def get_analytics_event_counts(self, hours: int = 24) -> list[dict[str, Any]]:
+        return self.database.analytics_event_counts(hours)
+
+    def get_event_counts_by_game(self, *, hours: int = 24) -> list[dict[str, Any]]:
+        return self.database.analytics_game_counts(hours)
+
+    def get_latency_summary(self, *, hours: int = 24) -> list[dict[str, Any]]:
+        return self.database.analytics_latency_summary(hours)
+
+    def get_analytics_recent_events(
+        self,
+        hours: int = 24,
+        limit: int = 60,
+    ) -> list[dict[str, Any]]:
+        return self.database.recent_analytics_events(hours, limit)
+
+    def cleanup_old_analytics(self, days: int | None = None) -> int:
+        """Delete expired events; returns how many rows were removed."""
+        return self.database.delete_analytics_before(_analytics_cutoff(days))
+
+
+@dataclass(slots=True)
+class AsyncInMemoryAnalyticsRepository(AsyncAnalyticsRepository):
+    database: InMemoryStore  # type: ignore[assignment]
+
+    async def record_analytics_event(
+        self,
+        event_type: str,
+        user_id: int | None = None,
+        guild_id: int | None = None,
+        game_type: str | None = None,
+        match_id: int | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        event = {
+            "event_type": event_type,
+            "user_id": user_id,
+            "guild_id": guild_id,
+            "game_id": _resolve_game_id(self.games, game_type),
+            "match_id": match_id,
+            "metadata": metadata,
+        }
+        if not self.database.insert_analytics_events([event]):
+            msg = f"Unknown analytics event type {event_type!r}"
+            raise DatabaseError(msg)
+
+    async def ingest_events(self, events: Sequence[dict[str, Any]]) -> int:
+        if not events:
+            return 0
+        return self.database.insert_analytics_events(_ingest_rows(self.games, events))
+
+    async def get_analytics_event_counts(
+        self,
+        hours: int = 24,
+    ) -> list[dict[str, Any]]:
+        return self.database.analytics_event_counts(hours)
+
+    async def get_event_counts_by_game(
+        self,
+        *,
+        hours: int = 24,
+    ) -> list[dict[str, Any]]:
+        return self.database.analytics_game_counts(hours)
+
+    async def get_latency_summary(self, *, hours: int = 24) -> list[dict[str, Any]]:
+        return self.database.analytics_latency_summary(hours)
+
+    async def fold_hourly_rollup(
+        self,
+        *,
+        batch_size: int = ANALYTICS_ROLLUP_BATCH_SIZE,
+        max_batches: int = ANALYTICS_ROLLUP_MAX_BATCHES,
+    ) -> int:
+        return self.database.advance_rollup(batch_size * max(1, max_batches))
+
+    async def get_analytics_recent_events(
+        self,
+        hours: int = 24,
+        limit: int = 60,
+    ) -> list[dict[str, Any]]:
+        return self.database.recent_analytics_events(hours, limit)
+
+    async def cleanup_old_analytics(self, days: int | None = None) -> int:
+        return self.database.delete_analytics_before(_analytics_cutoff(days))
+
+
+@dataclass(slots=True)
+class InMemoryMaintenanceRepository(MaintenanceRepository):
+    """Reset and stats upkeep; there are no partitions to maintain in memory."""
+
+    database: InMemoryStore  # type: ignore[assignment]
+
+    def reset_all_data(self) -> None:
+        self.games.clear_caches()
+        self.database.reset()
+        self.games.sync_games_from_code()
+
+    def rebuild_user_game_stats(self) -> int:
+        # Stats are derived from match history on read; report the row count.
+        return len(self.database.user_game_stats())
+
+    def ensure_partitions(self, *, months_ahead: int = PARTITION_MONTHS_AHEAD) -> None:
+        _ = months_ahead
+
+    def drain_default_partitions(self) -> dict[str, int]:
+        return dict.fromkeys(PARTITIONED_TABLES, 0)
+
+    def drop_expired_partitions(self, table: str, *, older_than_days: int) -> list[str]:
+        if table == "analytics_events":
+            self.database.delete_analytics_before(_analytics_cutoff(older_than_days))
+        return []
@@ -2,22 +2,152 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from playcord.infrastructure.constants import (
+    PLAYER_CACHE_MAX_ENTRIES,
+    PLAYER_CACHE_TTL_SECONDS,
+)
+from playcord.infrastructure.database.implementation.core.cache import TTLCache
+from playcord.infrastructure.database.implementation.core.statements import (
+    register_statement,
+)
 from playcord.infrastructure.database.implementation.internal_player import (
     InternalPlayer,
 )
 from playcord.infrastructure.database.models import User, row_to_user
 
 if TYPE_CHECKING:
-    from playcord.infrastructure.database.implementation.database import Database
+    from collections.abc import Iterable, Mapping
+
+    from playcord.infrastructure.database.implementation.database import (
+        AsyncDatabase,
+        Database,
+    )
+
+_UPSERT_USER_SQL = register_statement(
+    "upsert_user",
+    """
+    INSERT INTO users (user_id, username, is_bot)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (user_id) DO UPDATE SET
+        username = EXCLUDED.username,
+        is_bot = EXCLUDED.is_bot,
+        updated_at = NOW();
+""",
+)
+_GET_USER_SQL = register_statement(
+    "get_user", "SELECT * FROM users WHERE user_id = %s AND is_deleted = FALSE;"
+)
+_GET_USER_PREFERENCES_SQL = register_statement(
+    "get_user_preferences",
+    "SELECT created_at AS joined_at, preferences FROM users WHERE user_id = %s AND is_deleted = FALSE;",
+)
+_GET_USERS_PREFERENCES_SQL = register_statement(
+    "get_users_preferences",
+    """
+    SELECT user_id, created_at AS joined_at, preferences
+    FROM users
+    WHERE user_id = ANY(%s::bigint[]) AND is_deleted = FALSE;
+""",
+)
+_MERGE_USER_PREFERENCES_SQL = """
+    UPDATE users
+    SET preferences = COALESCE(preferences, '{}'::jsonb) || %s::jsonb,
+        updated_at = NOW()
+    WHERE user_id = %s AND is_deleted = FALSE
+    RETURNING created_at AS joined_at, preferences;
+"""
+
+
+def new_player_cache() -> TTLCache[int, dict | None]:
+    """Cache of ``user_id -> {joined_at, preferences}`` (``None`` for unknown users)."""
+    return TTLCache(PLAYER_CACHE_TTL_SECONDS, max_entries=PLAYER_CACHE_MAX_ENTRIES)
+
+
+def _cached_preferences(row: dict | None) -> dict | None:
+    # Hand out copies (preferences included) so callers cannot mutate the
+    # shared cache entry.
+    if row is None:
+        return None
+    copied = dict(row)
+    if isinstance(copied.get("preferences"), dict):
+        copied["preferences"] = dict(copied["preferences"])
+    return copied
+
+
+def _split_cached(
+    cache: TTLCache[int, dict | None],
+    user_ids: Iterable[int],
+) -> tuple[dict[int, dict | None], list[int]]:
+    """Cached preference rows for ``user_ids`` plus the ids that missed."""
+    found: dict[int, dict | None] = {}
+    missing: list[int] = []
+    for user_id in dict.fromkeys(int(uid) for uid in user_ids):
+        hit, row = cache.lookup(user_id)
+        if hit:
+            found[user_id] = row
+        else:
+            missing.append(user_id)
+    return found, missing
+
+
+def _fill_missing(
+    cache: TTLCache[int, dict | None],
+    found: dict[int, dict | None],
+    missing: list[int],
+    rows: list[dict[str, Any]],
+) -> None:
+    by_id = {
+        int(row["user_id"]): {
+            "joined_at": row["joined_at"],
+            "preferences": row["preferences"],
+        }
+        for row in rows
+    }
+    for user_id in missing:
+        row = by_id.get(user_id)
+        cache.put(user_id, row)
+        found[user_id] = row
+
+
+def _players_from_rows(
+    found: dict[int, dict | None],
+    usernames: Mapping[int, str | None] | None,
+) -> dict[int, InternalPlayer]:
+    names = usernames or {}
+    return {
+        user_id: _player_from_preferences(row, user_id, names.get(user_id))
+        for user_id, row in found.items()
+    }
+
+
+def _player_from_preferences(
+    preferences: dict | None,
+    user_id: int,
+    username: str | None,
+) -> InternalPlayer:
+    # Copied: the row may be a shared cache entry and players mutate metadata.
+    metadata = (
+        dict(preferences["preferences"])
+        if preferences and preferences.get("preferences")
+        else {}
+    )
+    return InternalPlayer(
+        metadata=metadata,
+        user_id=user_id,
+        username=username,
+    )
 
 
 @dataclass(slots=True)
 class PlayerRepository:
     database: Database
     games: Any  # GameRepository
+    # Shared with AsyncPlayerRepository so a write through either side is seen by both.
+    cache: TTLCache[int, dict | None] = field(default_factory=new_player_cache)
 
     def get(self, user_id: int) -> User | None:
         return self.get_user(user_id)
@@ -28,30 +158,42 @@ class PlayerRepository:
         username: str = "Unknown",
         is_bot: bool = False,
     ) -> None:
-        query = """
-            INSERT INTO users (user_id, username, is_bot)
-            VALUES (%s, %s, %s)
-            ON CONFLICT (user_id) DO UPDATE SET
-                username = EXCLUDED.username,
-                is_bot = EXCLUDED.is_bot,
-                updated_at = NOW();
-        """
-        self.database.execute_query(query, (user_id, username, is_bot))
+        self.database.execute_query(_UPSERT_USER_SQL, (user_id, username, is_bot))
+        self.cache.invalidate(user_id)
 
     def get_user(self, user_id: int) -> User | None:
-        query = "SELECT * FROM users WHERE user_id = %s AND is_deleted = FALSE;"
-        result = self.database.execute_query(query, (user_id,), fetchone=True)
+        result = self.database.execute_query(_GET_USER_SQL, (user_id,), fetchone=True)
         return row_to_user(result) if result else None
 
     def get_user_preferences(self, user_id: int) -> dict | None:
-        query = "SELECT created_at AS joined_at, preferences FROM users WHERE user_id = %s AND is_deleted = FALSE;"
-        return self.database.execute_query(query, (user_id,), fetchone=True)
+        found, row = self.cache.lookup(user_id)
+        if not found:
+            row = self.database.execute_query(
+                _GET_USER_PREFERENCES_SQL,
+                (user_id,),
+                fetchone=True,
+            )
+            self.cache.put(user_id, row)
+        return _cached_preferences(row)
+
+    def update_user_preferences(
+        self,
+        user_id: int,
+        patch: dict[str, Any],
+    ) -> dict | None:
+        """Merge ``patch`` into the stored preferences (write-through to the cache)."""
+        with self.database.transaction() as cur:
+            cur.execute(_MERGE_USER_PREFERENCES_SQL, (json.dumps(patch), user_id))
+            row = cur.fetchone()
+        self.cache.put(user_id, row)
+        return _cached_preferences(row)
 
     def delete_user(self, user_id: int) -> None:
         query = (
             "UPDATE users SET is_deleted = TRUE, updated_at = NOW() WHERE user_id = %s;"
         )
         self.database.execute_query(query, (user_id,))
+        self.cache.invalidate(user_id)
 
     def restore_user(self, user_id: int) -> None:
         queries = [
@@ -62,6 +204,7 @@ class PlayerRepository:
         with self.database.transaction() as cur:
             for query in queries:
                 cur.execute(query, (user_id,))
+        self.cache.invalidate(user_id)
 
     def reset_user_data(self, user_id: int) -> None:
         self.delete_user(user_id)
@@ -73,14 +216,111 @@ class PlayerRepository:
         username: str | None = None,
     ) -> InternalPlayer | None:
         preferences = self.get_user_preferences(user_id)
-        metadata = (
-            preferences["preferences"]
-            if preferences and preferences.get("preferences")
-            else {}
+        return _player_from_preferences(preferences, user_id, username)
+
+    def get_players(
+        self,
+        user_ids: Iterable[int],
+        usernames: Mapping[int, str | None] | None = None,
+    ) -> dict[int, InternalPlayer]:
+        """Players by id; cache misses are loaded with a single query."""
+        found, missing = _split_cached(self.cache, user_ids)
+        if missing:
+            rows = self.database.execute_query(
+                _GET_USERS_PREFERENCES_SQL,
+                (missing,),
+                fetchall=True,
+            )
+            _fill_missing(self.cache, found, missing, rows or [])
+        return _players_from_rows(found, usernames)
+
+    def peek_player(
+        self,
+        user_id: int,
+        username: str | None = None,
+    ) -> InternalPlayer:
+        """Player from cached preferences only (defaults on a miss); never queries."""
+        _found, row = self.cache.lookup(user_id)
+        return _player_from_preferences(row, user_id, username)
+
+
+@dataclass(slots=True)
+class AsyncPlayerRepository:
+    """Asyncio counterpart of :class:`PlayerRepository` for event-loop call sites."""
+
+    database: AsyncDatabase
+    games: Any  # GameRepository
+    cache: TTLCache[int, dict | None] = field(default_factory=new_player_cache)
+
+    async def get(self, user_id: int) -> User | None:
+        return await self.get_user(user_id)
+
+    async def create_user(
+        self,
+        user_id: int,
+        username: str = "Unknown",
+        is_bot: bool = False,
+    ) -> None:
+        await self.database.execute_query(
+            _UPSERT_USER_SQL,
+            (user_id, username, is_bot),
         )
+        self.cache.invalidate(user_id)
 
-        return InternalPlayer(
-            metadata=metadata,
-            user_id=user_id,
-            username=username,
+    async def get_user(self, user_id: int) -> User | None:
+        result = await self.database.execute_query(
+            _GET_USER_SQL,
+            (user_id,),
+            fetchone=True,
         )
+        return row_to_user(result) if result else None
+
+    async def get_user_preferences(self, user_id: int) -> dict | None:
+        found, row = self.cache.lookup(user_id)
+        if not found:
+            row = await self.database.execute_query(
+                _GET_USER_PREFERENCES_SQL,
+                (user_id,),
+                fetchone=True,
+            )
+            self.cache.put(user_id, row)
+        return _cached_preferences(row)
+
+    async def update_user_preferences(
+        self,
+        user_id: int,
+        patch: dict[str, Any],
+    ) -> dict | None:
+        """Merge ``patch`` into the stored preferences (write-through to the cache)."""
+        async with self.database.transaction() as cur:
+            await cur.execute(
+                _MERGE_USER_PREFERENCES_SQL,
+                (json.dumps(patch), user_id),
+            )
+            row = await cur.fetchone()
+        self.cache.put(user_id, row)
+        return _cached_preferences(row)
+
+    async def get_player(
+        self,
+        user_id: int,
+        username: str | None = None,
+    ) -> InternalPlayer | None:
+        preferences = await self.get_user_preferences(user_id)
+        return _player_from_preferences(preferences, user_id, username)
+
+    async def get_players(
+        self,
+        user_ids: Iterable[int],
+        usernames: Mapping[int, str | None] | None = None,
+    ) -> dict[int, InternalPlayer]:
+        """Players by id; cache misses are loaded with a single query."""
+        found, missing = _split_cached(self.cache, user_ids)
+        if missing:
+            rows = await self.database.execute_query(
+                _GET_USERS_PREFERENCES_SQL,
+                (missing,),
+                fetchall=True,
+            )
+            _fill_missing(self.cache, found, missing, rows or [])
+        return _players_from_rows(found, usernames)
@@ -0,0 +1,42 @@
+-- PlayCord PostgreSQL Database Migration
+-- Version: 4.3.0
+-- Description: Hourly analytics rollup folded from raw events past a high-water mark.
+
+-- ============================================================================
+-- ANALYTICS HOURLY ROLLUP
+-- ============================================================================
+
+-- game_id / guild_id use 0 for "none" so they can be part of the primary key.
+CREATE TABLE IF NOT EXISTS analytics_hourly
+(
+    hour           TIMESTAMPTZ      NOT NULL,
+    event_type     VARCHAR(100)     NOT NULL,
+    game_id        INTEGER          NOT NULL DEFAULT 0,
+    guild_id       BIGINT           NOT NULL DEFAULT 0,
+    event_count    BIGINT           NOT NULL DEFAULT 0,
+    latency_count  BIGINT           NOT NULL DEFAULT 0,
+    latency_sum_ms DOUBLE PRECISION NOT NULL DEFAULT 0,
+    latency_min_ms DOUBLE PRECISION,
+    latency_max_ms DOUBLE PRECISION,
+
+    PRIMARY KEY (hour, event_type, game_id, guild_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_analytics_hourly_game_hour
+    ON analytics_hourly (game_id, hour DESC)
+    WHERE game_id <> 0;
+
+-- One row per rollup: the last analytics_events.event_id folded into it.
+CREATE TABLE IF NOT EXISTS analytics_rollup_state
+(
+    rollup        TEXT PRIMARY KEY,
+    high_water_id BIGINT      NOT NULL DEFAULT 0,
+    updated_at    TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO analytics_rollup_state (rollup, high_water_id)
+VALUES ('analytics_hourly', 0)
+ON CONFLICT (rollup) DO NOTHING;
+
+-- The fold walks raw events in event_id order.
+CREATE INDEX IF NOT EXISTS idx_analytics_events_event_id ON analytics_events (event_id);
@@ -0,0 +1,15 @@
+-- PlayCord PostgreSQL Database Migration
+-- Version: 4.6.0
+-- Description: Settled event_id horizon for the hourly analytics fold.
+
+-- ============================================================================
+-- ANALYTICS ROLLUP HORIZON
+-- ============================================================================
+
+-- event_id values are taken before commit, so concurrent inserts commit out of
+-- order. The fold only passes ids up to horizon_id, the identity's last value
+-- sampled at horizon_at, once that sample is old enough for every transaction
+-- holding a lower id to have finished.
+ALTER TABLE analytics_rollup_state
+    ADD COLUMN IF NOT EXISTS horizon_id BIGINT      NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS horizon_at TIMESTAMPTZ NOT NULL DEFAULT '-infinity';
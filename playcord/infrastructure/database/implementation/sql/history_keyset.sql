@@ -0,0 +1,26 @@
+-- PlayCord PostgreSQL Database Migration
+-- Version: 4.1.0
+-- Description: Stored participant counts and keyset indexes for match history.
+
+-- ============================================================================
+-- MATCHES
+-- ============================================================================
+
+ALTER TABLE matches
+    ADD COLUMN IF NOT EXISTS player_count SMALLINT NOT NULL DEFAULT 0;
+
+UPDATE matches m
+SET player_count = p.player_count
+FROM (SELECT match_id, COUNT(*) AS player_count
+      FROM match_participants
+      GROUP BY match_id) p
+WHERE p.match_id = m.match_id
+  AND m.player_count <> p.player_count;
+
+-- History pages are read newest-first by (ended_at, match_id) keyset.
+CREATE INDEX IF NOT EXISTS idx_matches_ended_keyset
+    ON matches (ended_at DESC, match_id DESC)
+    WHERE ended_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_matches_guild_game_ended_keyset
+    ON matches (guild_id, game_id, ended_at DESC, match_id DESC)
+    WHERE ended_at IS NOT NULL;
@@ -0,0 +1,88 @@
+-- PlayCord PostgreSQL Database Migration
+-- Version: 4.4.0
+-- Description: Default-partition draining and drop-based retention for monthly partitions.
+
+-- ============================================================================
+-- PARTITION LIFECYCLE
+-- ============================================================================
+
+-- Move rows that landed in <parent>_default into their monthly partitions,
+-- creating each missing partition on the way. The default partition is locked
+-- against inserts for the duration so a partition can be created for a range
+-- it no longer holds rows for. Returns the number of rows moved.
+CREATE OR REPLACE FUNCTION drain_default_partition(p_parent_table TEXT)
+    RETURNS BIGINT
+    LANGUAGE plpgsql
+AS
+$$
+DECLARE
+    v_default        TEXT := p_parent_table || '_default';
+    v_months         TIMESTAMPTZ[];
+    v_month          TIMESTAMPTZ;
+    v_partition_name TEXT;
+    v_moved          BIGINT;
+    v_total          BIGINT := 0;
+BEGIN
+    EXECUTE format('LOCK TABLE %I IN SHARE ROW EXCLUSIVE MODE', v_default);
+    EXECUTE format(
+            'SELECT array_agg(DISTINCT date_trunc(''month'', created_at)) FROM %I',
+            v_default
+            ) INTO v_months;
+    IF v_months IS NULL THEN
+        RETURN 0;
+    END IF;
+
+    FOREACH v_month IN ARRAY v_months
+        LOOP
+            EXECUTE format(
+                    'CREATE TEMP TABLE partition_drain (LIKE %I) ON COMMIT DROP',
+                    p_parent_table
+                    );
+            EXECUTE format(
+                    'WITH moved AS (DELETE FROM %I WHERE created_at >= %L AND created_at < %L RETURNING *)
+                     INSERT INTO partition_drain SELECT * FROM moved',
+                    v_default, v_month, v_month + interval '1 month'
+                    );
+
+            v_partition_name := format('%s_%s', p_parent_table, to_char(v_month, 'YYYYMM'));
+            EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L);',
+                    v_partition_name, p_parent_table, v_month, v_month + interval '1 month'
+                    );
+            EXECUTE format(
+                    'INSERT INTO %I OVERRIDING SYSTEM VALUE SELECT * FROM partition_drain',
+                    p_parent_table
+                    );
+            GET DIAGNOSTICS v_moved = ROW_COUNT;
+            v_total := v_total + v_moved;
+            DROP TABLE partition_drain;
+        END LOOP;
+    RETURN v_total;
+END;
+$$;
+
+-- Detach and drop every <parent>_YYYYMM partition whose whole month ends at or
+-- before p_cutoff. Returns the names of the dropped partitions.
+CREATE OR REPLACE FUNCTION drop_expired_partitions(p_parent_table TEXT, p_cutoff TIMESTAMPTZ)
+    RETURNS SETOF TEXT
+    LANGUAGE plpgsql
+AS
+$$
+DECLARE
+    v_partition_name TEXT;
+BEGIN
+    FOR v_partition_name IN
+        SELECT c.relname
+        FROM pg_inherits i
+                 JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = p_parent_table::regclass
+          AND c.relname ~ ('^' || p_parent_table || '_[0-9]{6}$')
+          AND to_timestamp(right(c.relname, 6), 'YYYYMM') + interval '1 month' <= p_cutoff
+        ORDER BY c.relname
+        LOOP
+            EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', p_parent_table, v_partition_name);
+            EXECUTE format('DROP TABLE %I', v_partition_name);
+            RETURN NEXT v_partition_name;
+        END LOOP;
+END;
+$$;
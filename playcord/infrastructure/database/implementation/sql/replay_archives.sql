@@ -0,0 +1,26 @@
+-- PlayCord PostgreSQL Database Migration
+-- Version: 4.5.0
+-- Description: Compressed per-match replay archives for finished matches.
+
+-- ============================================================================
+-- REPLAY ARCHIVES
+-- ============================================================================
+
+-- One row per archived match: its replay_events rows as zlib-compressed JSON
+-- lines (one {sequence_number, event_type, actor_user_id, payload} object per
+-- line, in sequence order). Archived rows are deleted from replay_events.
+CREATE TABLE IF NOT EXISTS replay_archives
+(
+    match_id           BIGINT PRIMARY KEY,
+    encoding           VARCHAR(20) NOT NULL DEFAULT 'jsonl+zlib',
+    event_count        INTEGER     NOT NULL,
+    last_sequence      INTEGER     NOT NULL,
+    uncompressed_bytes INTEGER     NOT NULL,
+    data               BYTEA       NOT NULL,
+    archived_at        TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT fk_replay_archives_match FOREIGN KEY (match_id)
+        REFERENCES matches (match_id) ON DELETE CASCADE
+);
+
+COMMENT ON TABLE replay_archives IS 'Compressed replay event streams of finished matches (see replay_events)';
@@ -0,0 +1,101 @@
+-- PlayCord PostgreSQL Database Migration
+-- Version: 4.2.0
+-- Description: Per (user, guild, game) match totals maintained as matches finish.
+
+-- ============================================================================
+-- USER GAME STATS
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS user_game_stats
+(
+    user_id        BIGINT      NOT NULL,
+    guild_id       BIGINT      NOT NULL,
+    game_id        INTEGER     NOT NULL,
+    matches_played INTEGER     NOT NULL DEFAULT 0,
+    wins           INTEGER     NOT NULL DEFAULT 0,
+    draws          INTEGER     NOT NULL DEFAULT 0,
+    losses         INTEGER     NOT NULL DEFAULT 0,
+    interrupted    INTEGER     NOT NULL DEFAULT 0,
+    last_played_at TIMESTAMPTZ,
+    updated_at     TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (user_id, guild_id, game_id),
+    CONSTRAINT fk_user_game_stats_user FOREIGN KEY (user_id)
+        REFERENCES users (user_id) ON DELETE CASCADE,
+    CONSTRAINT fk_user_game_stats_guild FOREIGN KEY (guild_id)
+        REFERENCES guilds (guild_id) ON DELETE CASCADE,
+    CONSTRAINT fk_user_game_stats_game FOREIGN KEY (game_id)
+        REFERENCES games (game_id) ON DELETE CASCADE
+);
+
+COMMENT ON TABLE user_game_stats IS 'Rollup of finished matches per user, guild and game (see apply_user_game_stats)';
+
+-- Add (p_delta = 1) or retract (p_delta = -1) finished matches in their current
+-- status. Outcomes follow v_match_outcomes: a shared first place is a draw.
+CREATE OR REPLACE FUNCTION apply_user_game_stats(p_match_ids BIGINT[], p_delta INTEGER)
+    RETURNS INTEGER
+    LANGUAGE plpgsql
+AS
+$$
+DECLARE
+    affected INTEGER;
+BEGIN
+    INSERT INTO user_game_stats AS s (user_id, guild_id, game_id, matches_played,
+                                      wins, draws, losses, interrupted, last_played_at)
+    SELECT mp.user_id,
+           m.guild_id,
+           m.game_id,
+           p_delta * COUNT(*),
+           p_delta * COUNT(*) FILTER (
+               WHERE m.status = 'completed' AND mp.final_ranking = 1
+                   AND COALESCE(r1.rank1_count, 0) = 1),
+           p_delta * COUNT(*) FILTER (
+               WHERE m.status = 'completed' AND mp.final_ranking = 1
+                   AND COALESCE(r1.rank1_count, 0) > 1),
+           p_delta * COUNT(*) FILTER (
+               WHERE m.status = 'completed' AND mp.final_ranking > 1),
+           p_delta * COUNT(*) FILTER (WHERE m.status = 'interrupted'),
+           MAX(m.ended_at)
+    FROM matches m
+             JOIN match_participants mp
+                  ON mp.match_id = m.match_id AND mp.is_deleted = FALSE
+             LEFT JOIN (SELECT match_id, COUNT(*) AS rank1_count
+                        FROM match_participants
+                        WHERE match_id = ANY (p_match_ids)
+                          AND final_ranking = 1
+                          AND is_deleted = FALSE
+                        GROUP BY match_id) r1 ON r1.match_id = m.match_id
+    WHERE m.match_id = ANY (p_match_ids)
+      AND m.status IN ('completed', 'interrupted', 'abandoned')
+    GROUP BY mp.user_id, m.guild_id, m.game_id
+    ON CONFLICT (user_id, guild_id, game_id) DO UPDATE SET
+        matches_played = s.matches_played + EXCLUDED.matches_played,
+        wins           = s.wins + EXCLUDED.wins,
+        draws          = s.draws + EXCLUDED.draws,
+        losses         = s.losses + EXCLUDED.losses,
+        interrupted    = s.interrupted + EXCLUDED.interrupted,
+        last_played_at = GREATEST(s.last_played_at, EXCLUDED.last_played_at),
+        updated_at     = NOW();
+    GET DIAGNOSTICS affected = ROW_COUNT;
+    RETURN affected;
+END;
+$$;
+
+-- Recompute every row from match history (backfill / repair).
+CREATE OR REPLACE FUNCTION rebuild_user_game_stats()
+    RETURNS INTEGER
+    LANGUAGE plpgsql
+AS
+$$
+BEGIN
+    DELETE FROM user_game_stats;
+    RETURN apply_user_game_stats(
+        ARRAY(SELECT match_id
+              FROM matches
+              WHERE status IN ('completed', 'interrupted', 'abandoned')),
+        1
+    );
+END;
+$$;
+
+SELECT rebuild_user_game_stats();
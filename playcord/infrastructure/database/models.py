@@ -4,7 +4,7 @@ Data classes representing database entities for type safety and easier data hand
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from enum import StrEnum
 from typing import Any
 
@@ -132,6 +132,7 @@ class Match:
     metadata: dict[str, Any] = field(default_factory=dict)
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    player_count: int = 0
 
     @property
     def duration_seconds(self) -> int | None:
@@ -216,6 +217,48 @@ class AnalyticsEvent:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+_CURSOR_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_CURSOR_TICK = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryCursor:
+    """Keyset position in a newest-first match history: the last row already shown.
+
+    Encoded as a short opaque token so it fits in a component ``custom_id``.
+    """
+
+    ended_at: datetime
+    match_id: int
+
+    def encode(self) -> str:
+        ended_at = self.ended_at
+        if ended_at.tzinfo is None:
+            ended_at = ended_at.replace(tzinfo=UTC)
+        return f"{(ended_at - _CURSOR_EPOCH) // _CURSOR_TICK:x}.{self.match_id:x}"
+
+    @classmethod
+    def decode(cls, token: str | None) -> "HistoryCursor | None":
+        """Parse a token from :meth:`encode`; returns None for anything malformed."""
+        if not token:
+            return None
+        try:
+            micros_hex, match_hex = token.split(".")
+            return cls(
+                ended_at=_CURSOR_EPOCH + int(micros_hex, 16) * _CURSOR_TICK,
+                match_id=int(match_hex, 16),
+            )
+        except (ValueError, OverflowError):
+            return None
+
+    @classmethod
+    def after_row(cls, row: dict[str, Any]) -> "HistoryCursor | None":
+        """Cursor that continues after a history row (None if it never ended)."""
+        if row.get("ended_at") is None or row.get("match_id") is None:
+            return None
+        return cls(ended_at=row["ended_at"], match_id=int(row["match_id"]))
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -279,6 +322,7 @@ def row_to_match(row: dict[str, Any]) -> Match:
         metadata=row.get("metadata", {}),
         created_at=row.get("created_at"),
         updated_at=row.get("updated_at"),
+        player_count=row.get("player_count") or 0,
     )
 
 
@@ -12,7 +12,7 @@ from discord.ext import commands
 from playcord.application.container import ApplicationContainer
 from playcord.application.runtime_context import bind_application_container
 from playcord.infrastructure import load_settings
-from playcord.infrastructure.analytics_client import Timer
+from playcord.infrastructure.analytics_client import Timer, start_ingest, stop_ingest
 from playcord.infrastructure.config import bind_settings
 from playcord.infrastructure.constants import (
     EPHEMERAL_DELETE_AFTER,
@@ -76,6 +76,8 @@ class PlayCordBot(commands.Bot):
         return get_configured_static_owner_ids()
 
     async def setup_hook(self) -> None:
+        await self.container.open_async()
+        start_ingest(self.container.async_analytics_repository)
         self._effective_owner_ids = await resolve_effective_owner_ids(self)
 
         await self.load_extension("playcord.presentation.cogs.general")
@@ -114,6 +116,21 @@ class PlayCordBot(commands.Bot):
         await self._maybe_compare_command_tree_to_api()
         await self._refresh_command_mentions()
 
+    async def close(self) -> None:
+        for runtime in list(self.container.registry.games_by_thread_id.values()):
+            flush_replay_events = getattr(runtime, "flush_replay_events", None)
+            if callable(flush_replay_events):
+                await flush_replay_events()
+        try:
+            await stop_ingest()
+        except Exception:
+            startup_log.exception("Failed to flush analytics ingest queue")
+        try:
+            await self.container.close_async()
+        except Exception:
+            startup_log.exception("Failed to close async database pool")
+        await super().close()
+
     async def _maybe_sync_commands_if_configured(self) -> None:
         if not self.container.settings.bot.auto_sync_commands:
             return
@@ -189,6 +206,12 @@ def create_container() -> ApplicationContainer:
     return container
 
 
+def _format_startup_timings(timings: dict[str, float], total_ms: float) -> str:
+    parts = [f"{step} {ms:.0f}ms" for step, ms in timings.items()]
+    parts.append(f"other {max(0.0, total_ms - sum(timings.values())):.0f}ms")
+    return ", ".join(parts)
+
+
 def main() -> None:
     configure_logging("INFO")
     startup_timer = Timer().start()
@@ -198,7 +221,12 @@ def main() -> None:
         startup_log.exception("Failed to create PlayCord application container")
         sys.exit(1)
 
-    startup_log.info("Starting PlayCord after %sms", startup_timer.current_time)
+    startup_ms = startup_timer.current_time
+    startup_log.info(
+        "Starting PlayCord after %sms (%s)",
+        startup_ms,
+        _format_startup_timings(container.startup_timings, startup_ms),
+    )
     bot = PlayCordBot(container)
     bot.run(container.settings.bot.secret, log_handler=None)
 
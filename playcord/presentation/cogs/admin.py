@@ -5,6 +5,7 @@ import discord
 from discord.ext import commands
 
 from playcord.infrastructure.analytics_client import (
+    ingest_stats,
     render_analytics_markdown_summary,
 )
 from playcord.infrastructure.constants import (
@@ -17,13 +18,21 @@ from playcord.infrastructure.constants import (
     MESSAGE_COMMAND_EMOJI,
     MESSAGE_COMMAND_FAILED,
     MESSAGE_COMMAND_PENDING,
+    MESSAGE_COMMAND_REBUILD_STATS,
     MESSAGE_COMMAND_SPECIFY_LOCAL_SERVER,
     MESSAGE_COMMAND_SUCCEEDED,
     MESSAGE_COMMAND_SYNC,
+    MESSAGE_COMMAND_TOP_QUERIES,
     MESSAGE_COMMAND_TREEDIFF,
     SUCCESS_COLOR,
+    TOP_QUERIES_DEFAULT_LIMIT,
+    TOP_QUERIES_MAX_LIMIT,
     WARNING_COLOR,
 )
+from playcord.infrastructure.database.implementation.core.profiling import (
+    format_statement_stats,
+    profiler,
+)
 from playcord.infrastructure.db_thread import run_in_thread
 from playcord.infrastructure.locale import fmt, get
 from playcord.infrastructure.logging import get_logger
@@ -139,6 +148,14 @@ class AdminCog(commands.Cog):
         elif msg.content.startswith(f"{LOGGING_ROOT}/{MESSAGE_COMMAND_EMOJI}"):
             _add_task(self._run_long_admin_task(msg, self._task_emoji_sync))
 
+        # Recompute the user_game_stats rollup from match history
+        elif msg.content.startswith(f"{LOGGING_ROOT}/{MESSAGE_COMMAND_REBUILD_STATS}"):
+            _add_task(self._run_long_admin_task(msg, self._task_rebuild_stats))
+
+        # Query profiler: top statements by total time, or on/off/reset
+        elif msg.content.startswith(f"{LOGGING_ROOT}/{MESSAGE_COMMAND_TOP_QUERIES}"):
+            _add_task(self._run_long_admin_task(msg, self._task_top_queries))
+
     async def _task_emoji_sync(self, msg: discord.Message) -> bool:
         report = await purge_and_reupload(self.bot)
         if report.aborted:
@@ -270,9 +287,10 @@ class AdminCog(commands.Cog):
                 self._analytics.get_summary(hours=hours),
                 self._analytics.get_event_counts_by_game(hours=hours),
                 self._analytics.get_recent_events(hours=hours, limit=60),
+                self._analytics.get_latency_summary(hours=hours),
             )
 
-        counts, by_game, recent = await run_in_thread(_load_analytics)
+        counts, by_game, recent, latency = await run_in_thread(_load_analytics)
         if not counts and not recent and not by_game:
             await msg.reply(
                 **container_send_kwargs(
@@ -312,6 +330,10 @@ class AdminCog(commands.Cog):
             by_game,
             recent,
             hours,
+            ingest_stats(),
+            self.bot.container.pool_manager.stats(),
+            self.bot.container.cache_stats(),
+            latency,
         )
         append_container_sections(
             main_container,
@@ -431,6 +453,110 @@ class AdminCog(commands.Cog):
         )
         return True
 
+    async def _task_rebuild_stats(self, msg: discord.Message) -> bool:
+        rows = await run_in_thread(
+            self.bot.container.maintenance_repository.rebuild_user_game_stats,
+        )
+        log.getChild("event.on_message").info(
+            "Rebuilt user_game_stats (%d rows) requested by user %r",
+            rows,
+            msg.author.id if msg.author else None,
+        )
+        await msg.reply(
+            **container_send_kwargs(
+                CustomContainer(
+                    title=get("commands.admin.rebuild_stats_title"),
+                    title_icon="database",
+                    description=fmt(
+                        "commands.admin.rebuild_stats_description",
+                        rows=rows,
+                    ),
+                    color=SUCCESS_COLOR,
+                ),
+            ),
+        )
+        return True
+
+    async def _task_top_queries(self, msg: discord.Message) -> bool:
+        split = msg.content.split()
+        arg = split[1].lower() if len(split) >= 2 else ""
+        if arg in {"on", "off"}:
+            profiler.configure(
+                enabled=arg == "on",
+                slow_query_ms=profiler.slow_query_ms,
+            )
+            log.getChild("event.on_message").info(
+                "Query profiling turned %s by user %r",
+                arg,
+                msg.author.id if msg.author else None,
+            )
+            await msg.reply(
+                **container_send_kwargs(
+                    CustomContainer(
+                        title_icon="database",
+                        description=fmt("commands.admin.top_queries_toggled", state=arg),
+                        color=SUCCESS_COLOR,
+                    ),
+                ),
+            )
+            return True
+        if arg == "reset":
+            profiler.reset()
+            await msg.reply(
+                **container_send_kwargs(
+                    CustomContainer(
+                        title_icon="database",
+                        description=get("commands.admin.top_queries_reset"),
+                        color=SUCCESS_COLOR,
+                    ),
+                ),
+            )
+            return True
+        limit = TOP_QUERIES_DEFAULT_LIMIT
+        if arg:
+            try:
+                limit = max(1, min(int(arg), TOP_QUERIES_MAX_LIMIT))
+            except ValueError:
+                await msg.reply(
+                    **container_send_kwargs(
+                        CustomContainer(
+                            description=fmt(
+                                "commands.admin.top_queries_usage",
+                                prefix=f"{LOGGING_ROOT}/",
+                            ),
+                            title_icon="database",
+                            color=INFO_COLOR,
+                        ),
+                    ),
+                )
+                return False
+
+        top = profiler.top(limit)
+        container = CustomContainer(
+            title=fmt("commands.admin.top_queries_title", count=len(top)),
+            title_icon="database",
+            description=(
+                get("commands.admin.top_queries_description")
+                if profiler.enabled
+                else fmt(
+                    "commands.admin.top_queries_disabled",
+                    prefix=f"{LOGGING_ROOT}/",
+                )
+            ),
+            color=INFO_COLOR,
+        )
+        lines = [format_statement_stats(snapshot) for snapshot in top]
+        append_container_sections(
+            container,
+            lines_to_container_sections(
+                lines or [get("commands.admin.top_queries_empty")],
+            ),
+            first_name=get("commands.admin.top_queries_field"),
+            truncated_note=get("commands.analytics.recent_truncated_note"),
+        )
+        await msg.reply(**container_send_kwargs(container))
+        return True
+
     async def _task_dbreset(self, msg: discord.Message) -> bool:
         f_log = log.getChild("event.on_message")
         f_log.debug(
@@ -1,25 +1,40 @@
 import asyncio
 import shutil
 import subprocess
-import time
 
 import discord
 from discord.ext import commands
 
+from playcord.application.services.message_coalescer import (
+    coalescing_stats,
+    format_coalescing_stats,
+)
+from playcord.application.services.outbound import format_outbound_stats, outbound
 from playcord.infrastructure import analytics_client as analytics_mod
 from playcord.infrastructure.config import get_settings
 from playcord.infrastructure.constants import (
-    ANALYTICS_PERIODIC_CLEANUP_INTERVAL_SECONDS,
     ANALYTICS_PERIODIC_FLUSH_INITIAL_DELAY_SECONDS,
     ANALYTICS_PERIODIC_FLUSH_INTERVAL_SECONDS,
     ERROR_NO_SYSTEM_CHANNEL,
     GAME_TYPES,
+    PARTITION_MAINTENANCE_INITIAL_DELAY_SECONDS,
+    PARTITION_MAINTENANCE_INTERVAL_SECONDS,
     PRESENCE_TIMEOUT,
     THREAD_POLICY_DELETE_NON_PARTICIPANT_MESSAGES,
     THREAD_POLICY_PARTICIPANTS_COMMANDS_ONLY,
     THREAD_POLICY_SPECTATORS_SILENT,
     VERSION,
 )
+from playcord.infrastructure.database.implementation.core.cache import (
+    format_cache_stats,
+)
+from playcord.infrastructure.database.implementation.core.invalidation import (
+    format_invalidation_stats,
+    invalidation_bus,
+)
+from playcord.infrastructure.database.implementation.core.telemetry import (
+    format_pool_snapshot,
+)
 from playcord.infrastructure.db_thread import run_in_thread
 from playcord.infrastructure.locale import fmt, get
 from playcord.infrastructure.logging import get_logger
@@ -36,7 +51,7 @@ class EventsCog(commands.Cog):
         self.presence_lock = asyncio.Lock()
         self._presence_task: asyncio.Task[None] | None = None
         self._analytics_task: asyncio.Task[None] | None = None
-        self._analytics_last_cleanup_monotonic = time.monotonic()
+        self._partition_task: asyncio.Task[None] | None = None
         # Build the version presence string.
         # If git is available and we can read the short commit hash, show:
         #   vx.y.z • f9ab9b
@@ -102,39 +117,77 @@ class EventsCog(commands.Cog):
         self._analytics_task = self.bot.loop.create_task(
             self._analytics_periodic_flush(),
         )
+        # on_ready fires again on every gateway reconnect; keep a single
+        # maintenance loop so runs never overlap on the _default partitions.
+        if self._partition_task is None or self._partition_task.done():
+            self._partition_task = self.bot.loop.create_task(
+                self._partition_maintenance(),
+            )
 
     async def _analytics_periodic_flush(self) -> None:
-        """Retry any buffered analytics rows after failed DB writes."""
+        """Flush queued analytics rows, replay spilled ones, and fold the hourly rollup."""
         await asyncio.sleep(ANALYTICS_PERIODIC_FLUSH_INITIAL_DELAY_SECONDS)
         while True:
             try:
-                log.getChild("analytics.flush").debug(
-                    "Attempting periodic analytics flush"
-                )
-
-                await run_in_thread(analytics_mod.flush_events)
-
-                now = time.monotonic()
-                if (
-                    now - self._analytics_last_cleanup_monotonic
-                    >= ANALYTICS_PERIODIC_CLEANUP_INTERVAL_SECONDS
-                ):
-
-                    def _cleanup() -> None:
-                        self.bot.container.guilds_repository.cleanup_old_analytics(
-                            days=get_settings().analytics_retention_days,
-                        )
+                flush_log = log.getChild("analytics.flush")
+                flush_log.debug("Attempting periodic analytics flush")
 
-                    await run_in_thread(_cleanup)
-                    self._analytics_last_cleanup_monotonic = now
-                    log.getChild("analytics.flush").debug(
-                        "cleanup_old_analytics completed (retention_days=%s)",
-                        get_settings().analytics_retention_days,
+                await analytics_mod.flush_events()
+                folded = await self.bot.container.async_analytics_repository.fold_hourly_rollup()
+                if folded:
+                    flush_log.debug(
+                        "Folded %d analytics events into hourly rollup", folded
+                    )
+                # Same figures as the owner `analytics` dump; debug only, so
+                # the 2-minute tick does not flood the INFO log.
+                for name, snapshot in self.bot.container.pool_manager.stats().items():
+                    flush_log.debug(format_pool_snapshot(name, snapshot))
+                for name, snapshot in self.bot.container.cache_stats().items():
+                    flush_log.debug(format_cache_stats(name, snapshot))
+                flush_log.debug(format_coalescing_stats(coalescing_stats()))
+                flush_log.debug(format_outbound_stats(outbound.stats()))
+                if invalidation_bus.enabled:
+                    flush_log.debug(format_invalidation_stats(invalidation_bus.stats()))
+                stats = analytics_mod.ingest_stats()
+                flush_log.debug("Analytics ingest stats: %s", stats)
+                if stats["spill_bytes"]:
+                    flush_log.warning(
+                        "Analytics spill file holds %s bytes (depth=%s/%s, failed_batches=%s)",
+                        stats["spill_bytes"],
+                        stats["depth"],
+                        stats["capacity"],
+                        stats["failed_batches"],
                     )
             except Exception:
-                log.exception("Periodic analytics flush/cleanup failed")
+                log.exception("Periodic analytics flush failed")
             await asyncio.sleep(ANALYTICS_PERIODIC_FLUSH_INTERVAL_SECONDS)
 
+    async def _partition_maintenance(self) -> None:
+        """Pre-create monthly partitions, drain the defaults, and drop expired months."""
+        await asyncio.sleep(PARTITION_MAINTENANCE_INITIAL_DELAY_SECONDS)
+        while True:
+            try:
+                partition_log = log.getChild("partitions")
+                report = await run_in_thread(
+                    self.bot.container.maintenance_repository.maintain_partitions,
+                    {"analytics_events": get_settings().analytics_retention_days},
+                )
+                for table, moved in report["moved"].items():
+                    if moved:
+                        partition_log.info(
+                            "Moved %d rows out of %s_default", moved, table
+                        )
+                for table, dropped in report["dropped"].items():
+                    if dropped:
+                        partition_log.info(
+                            "Dropped expired %s partitions: %s",
+                            table,
+                            ", ".join(dropped),
+                        )
+            except Exception:
+                log.exception("Periodic partition maintenance failed")
+            await asyncio.sleep(PARTITION_MAINTENANCE_INTERVAL_SECONDS)
+
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild) -> None:
         f_log = log.getChild("event.guild_join")
@@ -184,10 +237,7 @@ class EventsCog(commands.Cog):
         f_log = log.getChild("event.guild_remove")
         f_log.info(f"Removed from guild {guild.name!r}! (id={guild.id}).")
         try:
-            await run_in_thread(
-                self.bot.container.guilds_repository.delete_guild,
-                guild.id,
-            )
+            await self.bot.container.async_guilds_repository.delete_guild(guild.id)
             f_log.info(f"Successfully purged data for guild {guild.id}")
         except Exception as e:
             f_log.exception("Failed to purge data for guild %s: %s", guild.id, e)
@@ -99,8 +99,9 @@ async def _pagination_unhandled_fallback(
             rest = custom_id[len(prefix) :]
             break
     msg = get("interactions.pagination_outdated")
+    # guild_id/user_id, optionally followed by a keyset cursor
     parts = rest.split("/")
-    if len(parts) == 2:
+    if len(parts) in (2, 3):
         try:
             gid, uid = int(parts[0]), int(parts[1])
         except ValueError:
@@ -463,8 +464,7 @@ class GamesCog(commands.Cog):
                 ephemeral=True,
             )
             return
-        human_ids = await run_in_thread(
-            self.bot.container.matches_repository.get_match_human_user_ids_ordered,
+        human_ids = await self.bot.container.async_matches_repository.get_match_human_user_ids_ordered(
             mid,
         )
         if ctx.user.id not in human_ids:
@@ -517,8 +517,7 @@ class GamesCog(commands.Cog):
             )
             return
         game_type = game_row.game_name
-        creator_row = await run_in_thread(
-            get_container().players_repository.get_player,
+        creator_row = await get_container().async_players_repository.get_player(
             ctx.user.id,
             discord_user_db_label(ctx.user),
         )
@@ -596,8 +595,7 @@ async def begin_game(
         return None
 
     if ctx.guild is not None:
-        pc = await run_in_thread(
-            get_container().guilds_repository.get_playcord_channel_id,
+        pc = await get_container().async_guilds_repository.get_playcord_channel_id(
             ctx.guild.id,
         )
         if pc is not None and ctx.channel.id != pc:
@@ -612,8 +610,7 @@ async def begin_game(
     await ctx.response.defer()
     game_overview_message: discord.Message | None = None
     try:
-        creator_row = await run_in_thread(
-            get_container().players_repository.get_player,
+        creator_row = await get_container().async_players_repository.get_player(
             ctx.user.id,
             discord_user_db_label(ctx.user),
         )
@@ -826,8 +823,7 @@ async def handle_autocomplete(
         ]
     if getattr(runtime, "ending_game", False):
         return [app_commands.Choice(name=get("autocomplete.game_finished"), value="-")]
-    player = await run_in_thread(
-        get_container().players_repository.get_player,
+    player = await get_container().async_players_repository.get_player(
         ctx.user.id,
         discord_user_db_label(ctx.user),
     )
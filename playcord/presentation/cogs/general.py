@@ -20,6 +20,7 @@ from playcord.infrastructure.constants import (
     NAME,
     VERSION,
 )
+from playcord.infrastructure.database.models import HistoryCursor
 from playcord.infrastructure.db_thread import run_in_thread
 from playcord.infrastructure.locale import fmt, get
 from playcord.infrastructure.logging import get_logger
@@ -55,6 +56,7 @@ from playcord.presentation.ui.layout_discord import (
     AboutView,
     CatalogView,
     PaginationView,
+    pagination_cursor,
 )
 from playcord.presentation.ui.replay_views import ReplayViewerView
 from playcord.ui.container import CustomContainer, TEXT_DISPLAY_MAX, container_to_markdown
@@ -193,6 +195,21 @@ def _outcome_for_recent_match(match_row: dict[str, Any], user_id: int) -> str:
     return _fallback_match_outcome_label(match_row)
 
 
+def _history_cursor_tokens(
+    page_cursors: dict[int, HistoryCursor],
+    page: int,
+) -> dict[str, str]:
+    """Opaque keyset tokens for the Previous/Next buttons of a history page."""
+    tokens: dict[str, str] = {}
+    previous_cursor = page_cursors.get(page - 1)
+    if previous_cursor is not None:
+        tokens["previous"] = previous_cursor.encode()
+    next_cursor = page_cursors.get(page + 1)
+    if next_cursor is not None:
+        tokens["next"] = next_cursor.encode()
+    return tokens
+
+
 def _ordinal(value: Any) -> str:
     if value is None:
         return "?"
@@ -322,6 +339,9 @@ class GeneralCog(commands.Cog):
         self._games = c.games_repository
         self._players = c.players_repository
         self._guilds = c.guilds_repository
+        self._async_matches = c.async_matches_repository
+        self._async_players = c.async_players_repository
+        self._async_guilds = c.async_guilds_repository
 
     @property
     def _replay_source(self) -> replay_viewer.ReplayDataSource | None:
@@ -595,13 +615,16 @@ class GeneralCog(commands.Cog):
         )
         await response_send_message(ctx, view=view)
 
-    def _sync_load_profile_container(
+    async def _load_profile_container(
         self,
         user: discord.User,
         guild_id: int,
     ) -> tuple[CustomContainer | None, str | None]:
-        """Build profile embed; runs in a worker thread (blocking DB)."""
-        player = self._players.get_player(user.id, discord_user_db_label(user))
+        """Build profile embed from the async repositories."""
+        player = await self._async_players.get_player(
+            user.id,
+            discord_user_db_label(user),
+        )
         if player is None:
             return None, "player_not_found"
 
@@ -610,19 +633,23 @@ class GeneralCog(commands.Cog):
             icon="profile",
         )
 
-        match_history = self._matches.get_history_for_user(
+        match_history = await self._async_matches.get_history_for_user(
             user.id,
             guild_id=guild_id,
             limit=5,
         )
-        total_matches = self._matches.count_matches_for_user(user.id, guild_id)
-        game_counts: dict[str, int] = {}
-        for m in match_history:
-            gname = str(m.get("game_name", get("game_info.unknown")))
-            game_counts[gname] = game_counts.get(gname, 0) + 1
+        # Rollup rows, most played first
+        game_stats = await self._async_matches.get_user_game_stats(user.id, guild_id)
+        total_matches = sum(int(row["matches_played"]) for row in game_stats)
+        game_counts: dict[str, int] = {
+            str(row.get("game_name") or get("game_info.unknown")): int(
+                row["matches_played"],
+            )
+            for row in game_stats
+        }
         if total_matches > 0 or match_history:
             top_game = (
-                max(game_counts, key=game_counts.get)
+                next(iter(game_counts))
                 if game_counts
                 else get("embeds.profile.top_game_empty")
             )
@@ -720,14 +747,22 @@ class GeneralCog(commands.Cog):
                 return
 
             game_name = _GAME_METADATA[resolved_game]["name"]
-            container, _has_data, is_last_page = await run_in_thread(
-                self._build_history_container,
+            # Keyset cursor that starts each page seen so far (page 1 starts at the top).
+            page_cursors: dict[int, HistoryCursor] = {}
+            (
+                container,
+                _has_data,
+                is_last_page,
+                next_cursor,
+            ) = await self._build_history_container(
                 user,
                 game_name,
                 game_db.game_id,
                 guild_id,
                 page,
             )
+            if next_cursor is not None:
+                page_cursors[page + 1] = next_cursor
 
             max_pages = page if is_last_page else page + 1
             container.set_footer(
@@ -739,22 +774,20 @@ class GeneralCog(commands.Cog):
                 current_page=page,
                 max_pages=max_pages,
                 body_text=container_to_markdown(container),
+                cursors=_history_cursor_tokens(page_cursors, page),
                 callback_handler=lambda interaction, new_page: self._profile_page_callback(
                     interaction,
                     user,
                     game_name,
                     game_db.game_id,
                     new_page,
+                    page_cursors,
                 ),
             )
             await followup_send(ctx, view=view)
             return
 
-        load_result = await run_in_thread(
-            self._sync_load_profile_container,
-            user,
-            guild_id,
-        )
+        load_result = await self._load_profile_container(user, guild_id)
         container, err = load_result
         if err == "player_not_found":
             await followup_send(
@@ -771,29 +804,34 @@ class GeneralCog(commands.Cog):
             return
         await followup_send(ctx, **container_send_kwargs(container))
 
-    def _build_history_container(
+    async def _build_history_container(
         self,
         user,
         game_name: str,
         game_id: int,
         guild_id: int,
         page: int,
+        after: HistoryCursor | None = None,
     ):
         """
         Build history container for a specific page.
 
-        Returns (container, has_data, is_last_page).
+        Pages reached through Previous/Next are read by keyset (``after``);
+        jumps to a page without a known cursor fall back to OFFSET.
+
+        Returns (container, has_data, is_last_page, next_cursor).
         """
         limit = HISTORY_PAGE_SIZE
-        offset = (page - 1) * limit
+        offset = 0 if after is not None else (page - 1) * limit
 
         # Fetch one extra item to check if there are more pages
-        match_history = self._matches.get_history_for_user(
+        match_history = await self._async_matches.get_history_for_user(
             user.id,
             guild_id=guild_id,
             game_id=game_id,
             limit=limit + 1,
             offset=offset,
+            after=after,
         )
 
         container = build_page(
@@ -807,6 +845,9 @@ class GeneralCog(commands.Cog):
 
         # Only use the first 'limit' items for display
         display_history = match_history[:limit]
+        next_cursor = (
+            None if is_last_page else HistoryCursor.after_row(display_history[-1])
+        )
 
         if display_history:
             lines = []
@@ -820,7 +861,7 @@ class GeneralCog(commands.Cog):
                         match_id=str(mid),
                         game_key=str(gkey),
                         rank_text=rank_text,
-                        player_count=row.get("player_count", "?"),
+                        player_count=row.get("player_count") or "?",
                         status_label=_history_status_label(row.get("status")),
                         summary=summ,
                     ),
@@ -845,7 +886,7 @@ class GeneralCog(commands.Cog):
                 inline=False,
             )
 
-        return container, has_data, is_last_page
+        return container, has_data, is_last_page, next_cursor
 
     async def _profile_page_callback(
         self,
@@ -854,16 +895,31 @@ class GeneralCog(commands.Cog):
         game_name: str,
         game_id: int,
         new_page: int,
+        page_cursors: dict[int, HistoryCursor],
     ) -> None:
         """Callback for profile game-history pagination buttons."""
-        container, _has_data, is_last_page = await run_in_thread(
-            self._build_history_container,
+        after = None
+        if new_page > 1:
+            after = HistoryCursor.decode(
+                pagination_cursor(interaction),
+            ) or page_cursors.get(new_page)
+        (
+            container,
+            _has_data,
+            is_last_page,
+            next_cursor,
+        ) = await self._build_history_container(
             user,
             game_name,
             game_id,
             interaction.guild.id,
             new_page,
+            after=after,
         )
+        if after is not None:
+            page_cursors[new_page] = after
+        if next_cursor is not None:
+            page_cursors[new_page + 1] = next_cursor
         max_pages = new_page if is_last_page else new_page + 1
         container.set_footer(
             text=fmt("pagination.page_footer", page=new_page, max=max_pages),
@@ -874,12 +930,14 @@ class GeneralCog(commands.Cog):
             current_page=new_page,
             max_pages=max_pages,  # Dynamic max based on data
             body_text=container_to_markdown(container),
+            cursors=_history_cursor_tokens(page_cursors, new_page),
             callback_handler=lambda inter, pg: self._profile_page_callback(
                 inter,
                 user,
                 game_name,
                 game_id,
                 pg,
+                page_cursors,
             ),
         )
         await interaction.edit_original_response(view=view)
@@ -1104,8 +1162,7 @@ class GeneralCog(commands.Cog):
             return []
 
         needle = (current or "").strip().lower()
-        rows = await run_in_thread(
-            self._matches.get_history_for_user,
+        rows = await self._async_matches.get_history_for_user(
             ctx.user.id,
             guild_id=ctx.guild.id,
             limit=25,
@@ -1498,8 +1555,7 @@ class GeneralCog(commands.Cog):
             return
         await ctx.response.defer(ephemeral=True)
         if channel is None:
-            await run_in_thread(
-                self._guilds.merge_settings,
+            await self._async_guilds.merge_settings(
                 ctx.guild.id,
                 {"playcord_channel_id": None},
             )
@@ -1510,8 +1566,7 @@ class GeneralCog(commands.Cog):
                 delete_after=EPHEMERAL_DELETE_AFTER,
             )
             return
-        await run_in_thread(
-            self._guilds.merge_settings,
+        await self._async_guilds.merge_settings(
             ctx.guild.id,
             {"playcord_channel_id": channel.id},
         )
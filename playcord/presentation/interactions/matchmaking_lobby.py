@@ -20,6 +20,7 @@ from playcord.application.services.matchmaker import (
     lobby_kick_phase,
     lobby_remove_bot,
 )
+from playcord.application.services.outbound import OutboundPriority, edit_message
 from playcord.application.services.role_management import has_role_support
 from playcord.core.player import Player
 from playcord.infrastructure.analytics_client import Timer
@@ -35,7 +36,6 @@ from playcord.infrastructure.constants import (
 from playcord.infrastructure.database.implementation.internal_player import (
     InternalPlayer,
 )
-from playcord.infrastructure.db_thread import run_in_thread
 from playcord.infrastructure.locale import fmt, get
 from playcord.infrastructure.logging import get_logger
 from playcord.infrastructure.state.user_games import (
@@ -102,11 +102,12 @@ class MatchmakingInterface:
         self.private = private
         self._default_private = private
 
-        # Allowed players for whitelist
+        # Allowed players for whitelist. Callers load the creator beforehand; the
+        # fallback only reads the player cache so the constructor never blocks the loop.
         creator_row = (
             creator_db_player
             if creator_db_player is not None
-            else get_container().players_repository.get_player(
+            else get_container().players_repository.peek_player(
                 creator.id,
                 discord_user_db_label(creator),
             )
@@ -915,7 +916,12 @@ class MatchmakingInterface:
             return
 
         view, attachments = self._build_lobby_view()
-        await self.message.edit(view=view, attachments=attachments)
+        await edit_message(
+            self.message,
+            priority=OutboundPriority.PRESENCE,
+            view=view,
+            attachments=attachments,
+        )
         await self._refresh_open_settings_panel()
         log.debug(f"Finished matchmaking update task in {update_timer.stop()}ms.")
 
@@ -926,18 +932,20 @@ class MatchmakingInterface:
     ) -> str | None:
         """Add humans from a finished match to this lobby (creator is already queued)."""
         present = {p.id for p in self.queued_players}
+        members: list[discord.Member] = []
         for uid in user_ids:
             if uid in present:
                 continue
             try:
-                member = await guild.fetch_member(uid)
+                members.append(await guild.fetch_member(uid))
             except (discord.NotFound, discord.HTTPException):
                 return fmt("rematch.member_missing", mention=f"<@{uid}>")
-            player = await run_in_thread(
-                get_container().players_repository.get_player,
-                member.id,
-                discord_user_db_label(member),
-            )
+        players = await get_container().async_players_repository.get_players(
+            [member.id for member in members],
+            {member.id: discord_user_db_label(member) for member in members},
+        )
+        for member in members:
+            player = players.get(member.id)
             if player is None:
                 return get("rematch.db_failed")
             MatchmakingInterface._add_queued_player(self, player)
@@ -1032,8 +1040,7 @@ class MatchmakingInterface:
         :return: Error code or None if no error.
         """
         log = self.logger.getChild("ban")
-        new_player = await run_in_thread(
-            get_container().players_repository.get_player,
+        new_player = await get_container().async_players_repository.get_player(
             player.id,
             discord_user_db_label(player),
         )
@@ -368,13 +368,44 @@ class PageScrubModal(discord.ui.Modal):
         await self.callback_handler(interaction, page)
 
 
+_CURSOR_BUTTON_PREFIXES = {
+    "previous": BUTTON_PREFIX_PAGINATION_PREV,
+    "next": BUTTON_PREFIX_PAGINATION_NEXT,
+}
+
+
+def pagination_cursor(interaction: discord.Interaction) -> str | None:
+    """Opaque cursor carried by the clicked Previous/Next button, if it has one."""
+    custom_id = str((interaction.data or {}).get("custom_id") or "")
+    if not custom_id.startswith(tuple(_CURSOR_BUTTON_PREFIXES.values())):
+        return None
+    parts = custom_id.split("/")
+    # prefix/guild_id/user_id/cursor
+    if len(parts) != 4:
+        return None
+    return parts[3] or None
+
+
+def _attach_cursors(row: Any, cursors: dict[str, str]) -> None:
+    for item in getattr(row, "children", ()):
+        custom_id = getattr(item, "custom_id", None)
+        if not isinstance(item, discord.ui.Button) or not custom_id:
+            continue
+        for key, prefix in _CURSOR_BUTTON_PREFIXES.items():
+            token = cursors.get(key)
+            if token and custom_id.startswith(prefix):
+                item.custom_id = f"{custom_id}/{token}"
+
+
 class PaginationView(discord.ui.LayoutView):
     """
     Pagination with First/Previous/[Page]/Next/Last (timeout=None).
 
-    Button custom_ids carry only guild_id/user_id for ownership checks;
-    page state lives on this view instance. If the view is not registered
-    (e.g. after restart), GamesCog.on_interaction replies ephemerally.
+    Button custom_ids carry guild_id/user_id for ownership checks and, for
+    keyset-paged listings, an opaque cursor on Previous/Next (read back with
+    :func:`pagination_cursor`). Page numbers live on this view instance. If the
+    view is not registered (e.g. after restart), GamesCog.on_interaction replies
+    ephemerally.
     """
 
     def __init__(
@@ -386,6 +417,7 @@ class PaginationView(discord.ui.LayoutView):
             callback_handler,
             body_text: str | None = None,
             media_urls: list[str] | None = None,
+            cursors: dict[str, str] | None = None,
     ) -> None:
         """
         :param guild_id: Guild ID for validation (0 if not in a guild)
@@ -394,6 +426,8 @@ class PaginationView(discord.ui.LayoutView):
         :param max_pages: Total pages
         :param callback_handler: async (interaction, new_page) -> None
         :param media_urls: Optional image URLs (including attachment://) shown above pagination
+        :param cursors: Optional opaque tokens for the "previous"/"next" pages,
+            appended to those buttons' custom_ids
         """
         super().__init__(timeout=None)
         self.guild_id = guild_id
@@ -420,35 +454,36 @@ class PaginationView(discord.ui.LayoutView):
             )
             container.add_item(discord.ui.Separator())
 
-        container.add_item(
-            pagination_row(
-                guild_id=guild_id,
-                user_id=user_id,
-                current_page=current_page,
-                max_pages=max_pages,
-                labels={
-                    "first": get("buttons.first"),
-                    "previous": get("buttons.previous"),
-                    "page": "",
-                    "next": get("buttons.next"),
-                    "last": get("buttons.last"),
-                },
-                prefixes={
-                    "first": BUTTON_PREFIX_PAGINATION_FIRST,
-                    "previous": BUTTON_PREFIX_PAGINATION_PREV,
-                    "page": BUTTON_PREFIX_PAGINATION_PAGE,
-                    "next": BUTTON_PREFIX_PAGINATION_NEXT,
-                    "last": BUTTON_PREFIX_PAGINATION_LAST,
-                },
-                callbacks={
-                    "first": self._first_callback,
-                    "previous": self._prev_callback,
-                    "page": self._page_button_callback,
-                    "next": self._next_callback,
-                    "last": self._last_callback,
-                },
-            ),
+        row = pagination_row(
+            guild_id=guild_id,
+            user_id=user_id,
+            current_page=current_page,
+            max_pages=max_pages,
+            labels={
+                "first": get("buttons.first"),
+                "previous": get("buttons.previous"),
+                "page": "",
+                "next": get("buttons.next"),
+                "last": get("buttons.last"),
+            },
+            prefixes={
+                "first": BUTTON_PREFIX_PAGINATION_FIRST,
+                "previous": BUTTON_PREFIX_PAGINATION_PREV,
+                "page": BUTTON_PREFIX_PAGINATION_PAGE,
+                "next": BUTTON_PREFIX_PAGINATION_NEXT,
+                "last": BUTTON_PREFIX_PAGINATION_LAST,
+            },
+            callbacks={
+                "first": self._first_callback,
+                "previous": self._prev_callback,
+                "page": self._page_button_callback,
+                "next": self._next_callback,
+                "last": self._last_callback,
+            },
         )
+        if cursors:
+            _attach_cursors(row, cursors)
+        container.add_item(row)
         self.add_item(container)
 
     def _validate_interaction(self, interaction: discord.Interaction) -> bool: